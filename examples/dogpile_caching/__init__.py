@@ -9,6 +9,12 @@ as well.
    dogpile.cache, replacing Beaker as the caching library in
    use.
 
+.. seealso::
+
+    :class:`.SecondLevelCache` - a built-in cache of column state
+    consulted by :meth:`.Query.get` and simple many-to-one lazy loads,
+    configured per mapper.
+
 In this demo, the following techniques are illustrated:
 
 * Using custom subclasses of :class:`.Query`
@@ -659,9 +659,65 @@ static PyTypeObject BaseRowProxyType = {
     0                                   /* tp_new */
 };
 
+/**************************
+ * Plain tuple processing *
+ **************************/
+
+static PyObject *
+process_rows_as_tuples(PyObject *self, PyObject *args)
+{
+    PyObject *rows, *processors, *rows_fastseq, *result, *row;
+    PyObject **rowptr;
+    Py_ssize_t num_rows, num_processors, i;
+    int has_processors = 0;
+
+    if (!PyArg_ParseTuple(args, "OO!", &rows, &PyList_Type, &processors))
+        return NULL;
+
+    num_processors = PyList_GET_SIZE(processors);
+    for (i = 0; i < num_processors; i++) {
+        if (PyList_GET_ITEM(processors, i) != Py_None) {
+            has_processors = 1;
+            break;
+        }
+    }
+
+    rows_fastseq = PySequence_Fast(rows, "rows must be a sequence");
+    if (rows_fastseq == NULL)
+        return NULL;
+
+    num_rows = PySequence_Fast_GET_SIZE(rows_fastseq);
+    result = PyList_New(num_rows);
+    if (result == NULL) {
+        Py_DECREF(rows_fastseq);
+        return NULL;
+    }
+
+    rowptr = PySequence_Fast_ITEMS(rows_fastseq);
+    for (i = 0; i < num_rows; i++) {
+        if (has_processors) {
+            row = BaseRowProxy_processvalues(rowptr[i], processors, 1);
+        } else {
+            /* returns the same object if the row is already a tuple */
+            row = PySequence_Tuple(rowptr[i]);
+        }
+        if (row == NULL) {
+            Py_DECREF(rows_fastseq);
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyList_SET_ITEM(result, i, row);
+    }
+    Py_DECREF(rows_fastseq);
+    return result;
+}
+
 static PyMethodDef module_methods[] = {
     {"safe_rowproxy_reconstructor", safe_rowproxy_reconstructor, METH_VARARGS,
      "reconstruct a RowProxy instance from its pickled form."},
+    {"process_rows_as_tuples", process_rows_as_tuples, METH_VARARGS,
+     "return a list of tuples from a sequence of rows, applying the "
+     "given list of processors to each row."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -268,6 +268,74 @@ available.
 
     update(..., mysql_limit=10)
 
+.. _mysql_insert_on_duplicate_key_update:
+
+INSERT...ON DUPLICATE KEY UPDATE (Upsert)
+------------------------------------------
+
+MySQL allows "upserts" (update or insert)
+of rows into a table via the ``ON DUPLICATE KEY UPDATE`` clause of the
+``INSERT`` statement.  A candidate row will only be inserted if that row does
+not match an existing primary or unique key in the table; otherwise, an UPDATE
+will be performed.   The statement allows for separate specification of the
+values to INSERT versus the values for UPDATE.
+
+SQLAlchemy provides ``ON DUPLICATE KEY UPDATE`` support via the MySQL-specific
+:func:`.mysql.dml.insert()` function, which provides
+the generative method :meth:`~.mysql.dml.Insert.on_duplicate_key_update`::
+
+    from sqlalchemy.dialects.mysql import insert
+
+    insert_stmt = insert(my_table).values(
+        id='some_existing_id',
+        data='inserted value')
+
+    on_duplicate_key_stmt = insert_stmt.on_duplicate_key_update(
+        data=insert_stmt.inserted.data,
+        status='U'
+    )
+
+    conn.execute(on_duplicate_key_stmt)
+
+Unlike Postgresql's "ON CONFLICT" phrase, the "ON DUPLICATE KEY UPDATE"
+phrase will always match on any primary key or unique key, and will always
+perform an UPDATE if there's a match; there are no options for it to raise
+an error or to skip performing an UPDATE.
+
+``ON DUPLICATE KEY UPDATE`` is used to perform an update of the already
+existing row, using any combination of new values as well as values
+from the proposed insertion.   These values are specified using
+keyword arguments passed to the
+:meth:`~.mysql.dml.Insert.on_duplicate_key_update`
+given column key values (usually the name of the column, unless it
+specifies :paramref:`.Column.key`) as keys and literal or SQL expressions
+as values.
+
+In order to refer to the proposed insertion row, the special alias
+:attr:`~.mysql.dml.Insert.inserted` is available as an attribute on
+the :class:`.mysql.dml.Insert` object; this object is a
+:class:`.ColumnCollection` which contains all columns of the target
+table, rendering as ``VALUES(column)`` within the clause.
+
+A statement whose ON DUPLICATE KEY UPDATE clause refers only to
+:attr:`~.mysql.dml.Insert.inserted` may be executed with a list of
+parameter sets, or given multiple rows using :meth:`.Insert.values`, so that
+a batch of rows is upserted using a single statement::
+
+    stmt = insert(my_table)
+    stmt = stmt.on_duplicate_key_update(data=stmt.inserted.data)
+
+    conn.execute(stmt, [
+        {"id": 1, "data": "d1"},
+        {"id": 2, "data": "d2"},
+    ])
+
+When returning a :class:`.ResultProxy`, the ``.rowcount`` attribute of an
+upsert reflects MySQL's convention of counting an inserted row as one and
+an updated row as two.
+
+.. versionadded:: 1.0.7
+
 rowcount Support
 ----------------
 
@@ -538,7 +606,7 @@ import sys
 
 from ... import schema as sa_schema
 from ... import exc, log, sql, util
-from ...sql import compiler
+from ...sql import compiler, elements
 from array import array as _array
 
 from ...engine import reflection
@@ -1913,6 +1981,42 @@ class MySQLCompiler(compiler.SQLCompiler):
                            extra_froms, from_hints, **kw):
         return None
 
+    def visit_on_duplicate_key_update(self, on_duplicate, **kw):
+        table = self.stack[-1]['selectable'].table
+
+        clauses = []
+        # traverse the table's columns to preserve column order
+        for column in table.c:
+            if column.key not in on_duplicate.update:
+                continue
+            val = on_duplicate.update[column.key]
+            if val is None:
+                value_text = self.process(elements.Null(), **kw)
+            elif elements._is_literal(val):
+                val = elements.BindParameter(None, val, type_=column.type)
+                value_text = self.process(val.self_group(), **kw)
+            elif isinstance(val, elements.BindParameter) and \
+                    val.type._isnull:
+                val = val._clone()
+                val.type = column.type
+                value_text = self.process(val.self_group(), **kw)
+            elif isinstance(val, elements.ColumnClause) and \
+                    val.table is on_duplicate.inserted_alias:
+                value_text = 'VALUES(%s)' % self.preparer.quote(val.name)
+            else:
+                value_text = self.process(val.self_group(), **kw)
+            name_text = self.preparer.quote(column.name)
+            clauses.append('%s = %s' % (name_text, value_text))
+
+        non_matching = set(on_duplicate.update).difference(
+            column.key for column in table.c)
+        if non_matching:
+            raise exc.CompileError(
+                "Unconsumed column names in ON DUPLICATE KEY UPDATE: %s" %
+                ", ".join(sorted(non_matching)))
+
+        return 'ON DUPLICATE KEY UPDATE ' + ', '.join(clauses)
+
 
 # ug.  "InnoDB needs indexes on foreign keys and referenced keys [...].
 #       Starting with MySQL 4.1.2, these indexes are created automatically.
@@ -2626,6 +2730,29 @@ class MySQLDialect(default.DefaultDialect):
 
         default.DefaultDialect.initialize(self, connection)
 
+    _initialize_state_attrs = \
+        default.DefaultDialect._initialize_state_attrs + (
+            '_connection_charset', '_server_ansiquotes',
+            '_backslash_escapes')
+
+    def _set_initialize_state(self, state):
+        super(MySQLDialect, self)._set_initialize_state(state)
+        if self._server_ansiquotes:
+            self.identifier_preparer = self.preparer(
+                self, server_ansiquotes=self._server_ansiquotes)
+
+    @property
+    def _mariadb_version_info(self):
+        # e.g. (10, 2, 7, 'MariaDB'), or (5, 5, 5, 10, 2, 7, 'MariaDB')
+        # when reported with the replication version prefix
+        version = self.server_version_info
+        if version is None or 'MariaDB' not in version:
+            return None
+        numbers = tuple(v for v in version if isinstance(v, int))
+        if numbers[:3] == (5, 5, 5) and len(numbers) > 3:
+            numbers = numbers[3:]
+        return numbers
+
     @property
     def _supports_cast(self):
         return self.server_version_info is None or \
@@ -2798,12 +2925,259 @@ class MySQLDialect(default.DefaultDialect):
 
     def _parsed_state_or_create(self, connection, table_name,
                                 schema=None, **kw):
+        info_cache = kw.get('info_cache', None)
+        if info_cache is not None:
+            prefetched = info_cache.get(('mysql_prefetched_states', schema))
+            if prefetched and table_name in prefetched:
+                return prefetched[table_name]
         return self._setup_parser(
             connection,
             table_name,
             schema,
-            info_cache=kw.get('info_cache', None)
+            info_cache=info_cache
+        )
+
+    def _prefetch_reflection(self, connection, table_names,
+                             schema=None, **kw):
+        """Reflect all tables of a schema using a few queries against
+        information_schema, rather than one SHOW CREATE TABLE per table.
+
+        The information is formatted as SHOW CREATE TABLE output and parsed
+        by the usual MySQLTableDefinitionParser; the resulting states are
+        stored in the info_cache for use by _parsed_state_or_create().
+
+        """
+        info_cache = kw.get('info_cache', None)
+        if info_cache is None or self.server_version_info is None or \
+                self.server_version_info < (5, 1, 10):
+            # REFERENTIAL_CONSTRAINTS is not available
+            return
+
+        key = ('mysql_prefetched_states', schema)
+        if key in info_cache:
+            return
+
+        charset = self._connection_charset
+        parser = self._tabledef_parser
+        prefetched = info_cache[key] = {}
+        for table_name, show_create in self._information_schema_create(
+                connection, schema):
+            prefetched[table_name] = parser.parse(show_create, charset)
+
+    def _reflection_fingerprint(self, connection, schema=None):
+        if schema is None:
+            schema = self.default_schema_name
+        rp = connection.execute(
+            sql.text(
+                "SELECT TABLE_NAME, TABLE_TYPE, CREATE_TIME, "
+                "TABLE_COLLATION FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = :schema ORDER BY TABLE_NAME"),
+            schema=schema)
+        rows = self._compat_fetchall(rp, charset=self._connection_charset)
+        return util.md5_hex(repr((
+            self.server_version_info,
+            [[row[i] for i in range(4)] for row in rows]
+        )))
+
+    def _information_schema_create(self, connection, schema=None):
+        """Produce (table name, SHOW CREATE TABLE-style DDL) tuples for all
+        tables and views in a schema from information_schema."""
+
+        if schema is None:
+            schema = self.default_schema_name
+        charset = self._connection_charset
+        quote = self._tabledef_parser.preparer.quote_identifier
+
+        # MariaDB 10.2.7 and above deliver COLUMN_DEFAULT as an SQL
+        # expression, with literals quoted and NULL as 'NULL'
+        mariadb_version = self._mariadb_version_info
+        quoted_defaults = mariadb_version is not None and \
+            mariadb_version >= (10, 2, 7)
+
+        def fetch(stmt):
+            rp = connection.execute(sql.text(stmt), schema=schema)
+            return self._compat_fetchall(rp, charset=charset)
+
+        collations = dict(
+            (row[0], (row[1], row[2] == 'Yes'))
+            for row in self._compat_fetchall(
+                connection.execute(
+                    "SELECT COLLATION_NAME, CHARACTER_SET_NAME, IS_DEFAULT "
+                    "FROM information_schema.COLLATIONS"),
+                charset=charset)
+        )
+
+        tables = util.OrderedDict()
+        for row in fetch(
+                "SELECT TABLE_NAME, TABLE_TYPE, ENGINE, TABLE_COLLATION, "
+                "CREATE_OPTIONS, TABLE_COMMENT "
+                "FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = :schema ORDER BY TABLE_NAME"):
+            tables[row[0]] = row
+
+        columns = util.defaultdict(list)
+        for row in fetch(
+                "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, "
+                "COLUMN_DEFAULT, EXTRA, CHARACTER_SET_NAME, COLLATION_NAME "
+                "FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = :schema "
+                "ORDER BY TABLE_NAME, ORDINAL_POSITION"):
+            columns[row[0]].append(row)
+
+        keys = util.defaultdict(util.OrderedDict)
+        for row in fetch(
+                "SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE, INDEX_TYPE, "
+                "COLUMN_NAME, SUB_PART "
+                "FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = :schema "
+                "ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX"):
+            keys[row[0]].setdefault(row[1], []).append(row)
+
+        constraints = util.defaultdict(util.OrderedDict)
+        for row in fetch(
+                "SELECT kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, "
+                "kcu.COLUMN_NAME, kcu.REFERENCED_TABLE_SCHEMA, "
+                "kcu.REFERENCED_TABLE_NAME, kcu.REFERENCED_COLUMN_NAME, "
+                "rc.DELETE_RULE, rc.UPDATE_RULE "
+                "FROM information_schema.KEY_COLUMN_USAGE AS kcu "
+                "JOIN information_schema.REFERENTIAL_CONSTRAINTS AS rc "
+                "ON rc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA "
+                "AND rc.TABLE_NAME = kcu.TABLE_NAME "
+                "AND rc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME "
+                "WHERE kcu.TABLE_SCHEMA = :schema "
+                "AND kcu.REFERENCED_TABLE_NAME IS NOT NULL "
+                "ORDER BY kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, "
+                "kcu.ORDINAL_POSITION"):
+            constraints[row[0]].setdefault(row[1], []).append(row)
+
+        for table_name, table_row in tables.items():
+            table_charset = collations.get(table_row[3], (None, ))[0]
+
+            lines = []
+            for row in columns[table_name]:
+                lines.append(self._information_schema_column(
+                    row, table_charset, collations, quote,
+                    quoted_defaults=quoted_defaults))
+
+            for key_name, rows in sorted(
+                    keys[table_name].items(),
+                    key=lambda item: item[0] != 'PRIMARY'):
+                lines.append(self._information_schema_key(
+                    key_name, rows, quote, engine=table_row[2]))
+
+            for constraint_name, rows in constraints[table_name].items():
+                lines.append(self._information_schema_constraint(
+                    constraint_name, rows, schema, quote))
+
+            if table_row[1] == 'VIEW':
+                options = ''
+            else:
+                options = self._information_schema_table_options(
+                    table_row, table_charset, collations)
+
+            yield table_name, "CREATE TABLE %s (\n%s\n) %s" % (
+                quote(table_name), ",\n".join(lines), options)
+
+    _re_on_update = re.compile(r'on update (\S+)', re.I)
+
+    def _information_schema_column(self, row, table_charset, collations,
+                                   quote, quoted_defaults=False):
+        (name, type_, nullable, default, extra, charset, collation) = \
+            [row[i] for i in range(1, 8)]
+        extra = extra or ''
+        line = ['  %s %s' % (quote(name), type_)]
+        if charset and charset != table_charset:
+            line.append('CHARACTER SET %s' % charset)
+        if collation and not collations.get(collation, (None, True))[1]:
+            line.append('COLLATE %s' % collation)
+        if nullable == 'NO':
+            line.append('NOT NULL')
+
+        on_update = self._re_on_update.search(extra)
+        if default is not None:
+            if quoted_defaults or \
+                    type_.startswith(('timestamp', 'datetime')) and \
+                    default.upper().startswith('CURRENT_TIMESTAMP') or \
+                    type_.startswith('bit') and default.startswith("b'"):
+                line.append('DEFAULT %s' % default)
+            elif 'DEFAULT_GENERATED' in extra.upper():
+                # expression default, MySQL 8.0.13 and above
+                line.append('DEFAULT (%s)' % default)
+            else:
+                line.append("DEFAULT '%s'" % (
+                    default.replace("\\", "\\\\").replace("'", "''")))
+        elif on_update:
+            line.append('DEFAULT NULL')
+        if on_update:
+            line.append('ON UPDATE %s' % on_update.group(1))
+        if 'auto_increment' in extra.lower():
+            line.append('AUTO_INCREMENT')
+        return ' '.join(line)
+
+    def _information_schema_key(self, name, rows, quote, engine=None):
+        columns = ','.join(
+            quote(row[4]) + ('(%s)' % row[5] if row[5] else '')
+            for row in rows
+        )
+        index_type = rows[0][3]
+
+        # STATISTICS reports the type in effect rather than the one given
+        # in the CREATE statement, so USING is rendered only where the
+        # type differs from the default of the storage engine
+        if (engine or '').upper() in ('MEMORY', 'HEAP'):
+            default_type = 'HASH'
+        else:
+            default_type = 'BTREE'
+        if index_type in ('BTREE', 'HASH') and index_type != default_type:
+            using = ' USING %s' % index_type
+        else:
+            using = ''
+
+        if name == 'PRIMARY':
+            return '  PRIMARY KEY (%s)%s' % (columns, using)
+        if index_type in ('FULLTEXT', 'SPATIAL'):
+            flavor = '%s ' % index_type
+        elif not int(rows[0][2]):
+            flavor = 'UNIQUE '
+        else:
+            flavor = ''
+        return '  %sKEY %s (%s)%s' % (flavor, quote(name), columns, using)
+
+    def _information_schema_constraint(self, name, rows, schema, quote):
+        ref_schema, ref_table = rows[0][3], rows[0][4]
+        if ref_schema != schema:
+            ref_table = '%s.%s' % (quote(ref_schema), quote(ref_table))
+        else:
+            ref_table = quote(ref_table)
+        line = '  CONSTRAINT %s FOREIGN KEY (%s) REFERENCES %s (%s)' % (
+            quote(name),
+            ','.join(quote(row[2]) for row in rows),
+            ref_table,
+            ','.join(quote(row[5]) for row in rows)
         )
+        for rule, text in ((rows[0][6], 'DELETE'), (rows[0][7], 'UPDATE')):
+            if rule and rule != 'RESTRICT':
+                line += ' ON %s %s' % (text, rule)
+        return line
+
+    def _information_schema_table_options(self, row, table_charset,
+                                          collations):
+        engine, collation, create_options, comment = \
+            [row[i] for i in range(2, 6)]
+        options = []
+        if engine:
+            options.append('ENGINE=%s' % engine)
+        if table_charset:
+            options.append('DEFAULT CHARSET=%s' % table_charset)
+        if collation and not collations.get(collation, (None, True))[1]:
+            options.append('COLLATE=%s' % collation)
+        for option in (create_options or '').split():
+            if '=' in option:
+                key, value = option.split('=', 1)
+                options.append('%s=%s' % (key.upper(), value))
+        if comment:
+            options.append("COMMENT='%s'" % comment.replace("'", "''"))
+        return ' '.join(options)
 
     @util.memoized_property
     def _tabledef_parser(self):
@@ -0,0 +1,100 @@
+# mysql/dml.py
+# Copyright (C) 2005-2015 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from ...sql.elements import ClauseElement, _cache_key, _NoCacheKey
+from ...sql.dml import Insert as StandardInsert
+from ...sql.expression import alias
+from ...sql.base import _generative
+from ...util.langhelpers import public_factory
+from ... import exc, util
+
+__all__ = ('Insert', 'insert')
+
+
+class Insert(StandardInsert):
+    """MySQL-specific implementation of INSERT.
+
+    Adds methods for MySQL-specific syntaxes such as ON DUPLICATE KEY UPDATE.
+
+    .. versionadded:: 1.0.7
+
+    """
+
+    _inherit_cache_key = True
+
+    @property
+    def inserted(self):
+        """Provide the "inserted" namespace for an ON DUPLICATE KEY UPDATE
+        statement.
+
+        MySQL's ON DUPLICATE KEY UPDATE clause allows reference to the row
+        that would be inserted, via a special function called ``VALUES()``.
+        This attribute provides all columns in this row to be referenceable
+        such that they will render within a ``VALUES()`` function inside the
+        ON DUPLICATE KEY UPDATE clause.  The attribute is named ``.inserted``
+        so as not to conflict with the existing :meth:`.Insert.values`
+        method.
+
+        .. seealso::
+
+            :ref:`mysql_insert_on_duplicate_key_update`
+
+        """
+        return self.inserted_alias.columns
+
+    @util.memoized_property
+    def inserted_alias(self):
+        return alias(self.table, name='inserted')
+
+    @_generative
+    def on_duplicate_key_update(self, **kw):
+        """
+        Specifies the ON DUPLICATE KEY UPDATE clause.
+
+        :param \**kw: Column keys linked to UPDATE values.  The values may
+         be any SQL expression or supported literal Python values; columns
+         of :attr:`.Insert.inserted` render as ``VALUES(column)``, referring
+         to the value which would have been inserted.
+
+        .. warning:: This dictionary does **not** take into account
+           Python-specified default UPDATE values or generation functions,
+           e.g. those specified using :paramref:`.Column.onupdate`.
+           These values will not be exercised for an ON DUPLICATE KEY
+           UPDATE style of UPDATE, unless values are manually specified
+           here.
+
+        .. seealso::
+
+            :ref:`mysql_insert_on_duplicate_key_update`
+
+        """
+        self._post_values_clause = OnDuplicateClause(self.inserted_alias, kw)
+
+
+insert = public_factory(Insert, '.dialects.mysql.insert')
+
+
+class OnDuplicateClause(ClauseElement):
+    __visit_name__ = 'on_duplicate_key_update'
+
+    def __init__(self, inserted_alias, update):
+        self.inserted_alias = inserted_alias
+        if not update or not isinstance(update, dict):
+            raise exc.ArgumentError(
+                'update parameter must be a non-empty dictionary')
+        self.update = update
+
+    def _gen_cache_key(self, anon_map, bindparams):
+        update = []
+        for key in sorted(self.update):
+            value = self.update[key]
+            if not isinstance(value, ClauseElement):
+                # literal values are converted to bound parameters
+                # at compile time
+                raise _NoCacheKey()
+            update.append((key, _cache_key(value, anon_map, bindparams)))
+        return (self.__class__, tuple(update))
@@ -159,6 +159,18 @@ def create_engine(*args, **kwargs):
            By default, result row names match case-sensitively.
            In version 0.7 and prior, all matches were case-insensitive.
 
+    :param compiled_cache_size=500: maximum number of :class:`.Compiled`
+        objects retained in the :class:`.Engine`-wide compiled cache.
+        SQL expression constructs are cached on a key derived from their
+        structure, not including the values of bound parameters, so that
+        statements which are constructed repeatedly in the same form are
+        compiled only once.  The cache is available as
+        :attr:`.Engine.compiled_cache`, which reports hit, miss and
+        eviction counts via :meth:`.CompiledCache.stats`.  Set to ``0``
+        or ``None`` to disable the cache.
+
+        .. versionadded:: 1.0.7
+
     :param connect_args: a dictionary of options which will be
         passed directly to the DBAPI's ``connect()`` method as
         additional keyword arguments.  See the example
@@ -185,6 +197,17 @@ def create_engine(*args, **kwargs):
         connections. Usage of this function causes connection
         parameters specified in the URL argument to be bypassed.
 
+    :param dialect_state_cache=None: a
+        :class:`~sqlalchemy.engine.util.DialectStateCache`
+        in which the state the dialect detects on first connect, such
+        as the connection charset and server SQL mode, is stored and
+        from which it is loaded by subsequently created engines, which
+        then skip those queries.  Intended for deployments which create
+        many engines against the same database, such as the worker
+        processes of a pre-forking server.
+
+        .. versionadded:: 1.0.7
+
     :param echo=False: if True, the Engine will log all statements
         as well as a repr() of their parameter lists to the engines
         logger, which defaults to sys.stdout. The ``echo`` attribute of
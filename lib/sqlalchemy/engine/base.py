@@ -16,7 +16,7 @@ import sys
 from .. import exc, util, log, interfaces
 from ..sql import util as sql_util
 from .interfaces import Connectable, ExceptionContext
-from .util import _distill_params
+from .util import _distill_params, CompiledCache
 import contextlib
 
 
@@ -202,6 +202,13 @@ class Connection(Connectable):
           used by the ORM internally supersedes a cache dictionary
           specified here.
 
+          A dictionary passed here takes the place of the
+          :attr:`.Engine.compiled_cache` which is otherwise used;
+          passing ``None`` disables compiled caching altogether.
+
+          .. versionchanged:: 1.0.7 A value of ``None`` disables the
+             :class:`.Engine`-wide compiled cache.
+
         :param isolation_level: Available on: :class:`.Connection`.
           Set the transaction isolation level for
           the lifespan of this :class:`.Connection` object (*not* the
@@ -272,6 +279,20 @@ class Connection(Connectable):
 
           .. versionadded:: 0.7.6
 
+        :param row_format: Available on: Connection, statement.
+          When set to ``'tuple'``, the :class:`.ResultProxy` returns
+          each row from :meth:`.ResultProxy.fetchone`,
+          :meth:`.ResultProxy.fetchmany`, :meth:`.ResultProxy.fetchall`
+          and iteration as a plain Python tuple, with the result processors
+          of each column applied up front, instead of as a
+          :class:`.RowProxy`.  Values can then only be accessed by
+          integer position.  This skips the per-row cost of constructing
+          a :class:`.RowProxy`, which is significant for large
+          Core result sets.  The option is not supported for
+          ORM :class:`.Query` objects, which target row values by column.
+
+          .. versionadded:: 1.0.7
+
         :param stream_results: Available on: Connection, statement.
           Indicate to the dialect that results should be
           "streamed" and not pre-buffered, if possible.  This is a limitation
@@ -990,31 +1011,90 @@ class Connection(Connectable):
             keys = []
 
         dialect = self.dialect
+        inline = len(distilled_params) > 1
+        extracted_params = None
         if 'compiled_cache' in self._execution_options:
-            key = dialect, elem, tuple(sorted(keys)), len(distilled_params) > 1
-            compiled_sql = self._execution_options['compiled_cache'].get(key)
-            if compiled_sql is None:
+            compiled_cache = self._execution_options['compiled_cache']
+            if compiled_cache is not None:
+                key = dialect, elem, tuple(sorted(keys)), inline
+                compiled_sql = compiled_cache.get(key)
+                if compiled_sql is None:
+                    compiled_sql = elem.compile(
+                        dialect=dialect, column_keys=keys,
+                        inline=inline)
+                    compiled_cache[key] = compiled_sql
+            else:
                 compiled_sql = elem.compile(
                     dialect=dialect, column_keys=keys,
-                    inline=len(distilled_params) > 1)
-                self._execution_options['compiled_cache'][key] = compiled_sql
+                    inline=inline)
+        elif self.engine.compiled_cache is not None:
+            compiled_sql, extracted_params = self._compiled_from_cache(
+                self.engine.compiled_cache, dialect, elem, keys, inline)
         else:
             compiled_sql = elem.compile(
                 dialect=dialect, column_keys=keys,
-                inline=len(distilled_params) > 1)
-
-        ret = self._execute_context(
-            dialect,
-            dialect.execution_ctx_cls._init_compiled,
-            compiled_sql,
-            distilled_params,
-            compiled_sql, distilled_params
-        )
+                inline=inline)
+
+        if extracted_params is not None:
+            ret = self._execute_context(
+                dialect,
+                dialect.execution_ctx_cls._init_compiled,
+                compiled_sql,
+                distilled_params,
+                compiled_sql, distilled_params, elem, extracted_params
+            )
+        else:
+            ret = self._execute_context(
+                dialect,
+                dialect.execution_ctx_cls._init_compiled,
+                compiled_sql,
+                distilled_params,
+                compiled_sql, distilled_params
+            )
         if self._has_events or self.engine._has_events:
             self.dispatch.after_execute(self,
                                         elem, multiparams, params, ret)
         return ret
 
+    def _compiled_from_cache(self, compiled_cache, dialect, elem, keys,
+                             inline):
+        """Retrieve a :class:`.Compiled` for the given element from the
+        engine-wide compiled cache, compiling and storing it if not
+        present.
+
+        Returns a tuple of the :class:`.Compiled` and the list of
+        :class:`.BindParameter` objects extracted from ``elem`` if the
+        :class:`.Compiled` was retrieved from the cache, else ``None``.
+
+        """
+        cache_key = elem._generate_cache_key()
+        if cache_key is None:
+            return elem.compile(
+                dialect=dialect, column_keys=keys, inline=inline), None
+
+        cache_key, extracted_params = cache_key
+        key = cache_key, tuple(sorted(keys)), inline
+        try:
+            compiled_sql = compiled_cache.get(key)
+        except TypeError:
+            # a component of the key isn't hashable
+            return elem.compile(
+                dialect=dialect, column_keys=keys, inline=inline), None
+
+        if compiled_sql is not None:
+            return compiled_sql, extracted_params
+
+        compiled_sql = elem.compile(
+            dialect=dialect, column_keys=keys, inline=inline)
+
+        # only store the compiled form if each of its bound parameters
+        # can be supplied by a subsequent statement of the same key
+        if compiled_sql._cacheable and \
+                compiled_sql._establish_cache_key_bindparams(
+                    extracted_params):
+            compiled_cache[key] = compiled_sql
+        return compiled_sql, None
+
     def _execute_compiled(self, compiled, multiparams, params):
         """Execute a sql.Compiled object."""
 
@@ -1683,9 +1763,21 @@ class Engine(Connectable, log.Identified):
     _has_events = False
     _connection_cls = Connection
 
+    compiled_cache = None
+    """The :class:`.CompiledCache` used by this :class:`.Engine` to
+    cache :class:`.Compiled` objects across statements of the same
+    structure, or ``None`` if disabled.
+
+    The size of the cache is configured using the
+    :paramref:`.create_engine.compiled_cache_size` parameter.
+
+    .. versionadded:: 1.0.7
+
+    """
+
     def __init__(self, pool, dialect, url,
                  logging_name=None, echo=None, proxy=None,
-                 execution_options=None
+                 execution_options=None, compiled_cache_size=500
                  ):
         # 默认的Engine做啥了?
         self.pool = pool
@@ -1696,6 +1788,8 @@ class Engine(Connectable, log.Identified):
             self.logging_name = logging_name
         self.echo = echo
         self.engine = self
+        if compiled_cache_size:
+            self.compiled_cache = CompiledCache(compiled_cache_size)
         log.instance_logger(self, echoflag=echo)
 
         if proxy:
@@ -2110,6 +2204,7 @@ class OptionEngine(Engine):
         self.dialect = proxied.dialect
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
+        self.compiled_cache = proxied.compiled_cache
         log.instance_logger(self, echoflag=self.echo)
         self.dispatch = self.dispatch._join(proxied.dispatch)
         self._execution_options = proxied._execution_options
@@ -27,6 +27,11 @@ AUTOCOMMIT_REGEXP = re.compile(
     r'\s*(?:UPDATE|INSERT|CREATE|DELETE|DROP|ALTER)',
     re.I | re.UNICODE)
 
+# When we're handed literal SQL, ensure it's a SELECT query
+SERVER_SIDE_CURSOR_RE = re.compile(
+    r'\s*SELECT',
+    re.I | re.UNICODE)
+
 
 class DefaultDialect(interfaces.Dialect):
     """Default implementation of Dialect"""
@@ -108,6 +113,9 @@ class DefaultDialect(interfaces.Dialect):
     supports_empty_insert = True
     supports_multivalues_insert = False
 
+    supports_server_side_cursors = False
+    server_side_cursors = False
+
     server_version_info = None
 
     construct_arguments = None
@@ -258,6 +266,29 @@ class DefaultDialect(interfaces.Dialect):
 
         self.do_rollback(connection.connection)
 
+    # attributes established by initialize(), other than
+    # server_version_info, which may be saved by a DialectStateCache
+    _initialize_state_attrs = (
+        'default_schema_name', 'default_isolation_level',
+        'returns_unicode_strings', 'description_encoding')
+
+    def _get_initialize_state(self):
+        """Return a dictionary of the state established by
+        :meth:`.initialize`, suitable for serialization."""
+
+        return dict(
+            (key, getattr(self, key)) for key in self._initialize_state_attrs
+        )
+
+    def _set_initialize_state(self, state):
+        """Establish state returned by a previous call to
+        :meth:`._get_initialize_state`, in place of :meth:`.initialize`."""
+
+        for key in self._initialize_state_attrs:
+            setattr(self, key, state[key])
+        if self.description_encoding is None:
+            self._description_decoder = None
+
     def on_connect(self):
         """return a callable which sets up a newly created DBAPI connection.
 
@@ -363,6 +394,27 @@ class DefaultDialect(interfaces.Dialect):
         insp = reflection.Inspector.from_engine(connection)
         return insp.reflecttable(table, include_columns, exclude_columns)
 
+    def _prefetch_reflection(self, connection, table_names,
+                             schema=None, **kw):
+        """Fetch reflection information for many tables in bulk, ahead of
+        the per-table reflection methods being called with the same
+        ``info_cache``.
+
+        The default implementation does nothing.
+
+        """
+
+    def _reflection_fingerprint(self, connection, schema=None):
+        """Return a string which changes whenever the structure of the
+        tables in the given schema changes, for use by
+        :class:`.ReflectionSnapshot`.
+
+        The default implementation returns None, indicating that
+        reflection snapshots aren't supported.
+
+        """
+        return None
+
     def get_pk_constraint(self, conn, table_name, schema=None, **kw):
         """Compatibility method, adapts the result of get_primary_keys()
         for those dialects which don't implement get_pk_constraint().
@@ -471,9 +523,11 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     executemany = False
     compiled = None
     statement = None
+    invoked_statement = None
     result_column_struct = None
     _is_implicit_returning = False
     _is_explicit_returning = False
+    _is_server_side = False
 
     # a hook for SQLite's translation of
     # result column names
@@ -514,8 +568,17 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     @classmethod
     def _init_compiled(cls, dialect, connection, dbapi_connection,
-                       compiled, parameters):
-        """Initialize execution context for a Compiled construct."""
+                       compiled, parameters, invoked_statement=None,
+                       extracted_parameters=None):
+        """Initialize execution context for a Compiled construct.
+
+        ``invoked_statement`` and ``extracted_parameters`` are passed
+        when the :class:`.Compiled` was retrieved from the compiled cache
+        on behalf of a structurally equivalent statement; execution
+        options, result columns and bound values are then taken from
+        that statement.
+
+        """
 
         self = cls.__new__(cls)
         self.root_connection = connection
@@ -527,11 +590,21 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         if not compiled.can_execute:
             raise exc.ArgumentError("Not an executable clause")
 
-        self.execution_options = compiled.statement._execution_options.union(
+        if invoked_statement is None or \
+                invoked_statement is compiled.statement:
+            invoked_statement = compiled.statement
+            extracted_parameters = None
+            result_columns = compiled._result_columns
+        else:
+            result_columns = compiled._result_columns_for_statement(
+                invoked_statement)
+        self.invoked_statement = invoked_statement
+
+        self.execution_options = invoked_statement._execution_options.union(
             connection._execution_options)
 
         self.result_column_struct = (
-            compiled._result_columns, compiled._ordered_columns)
+            result_columns, compiled._ordered_columns)
 
         self.unicode_statement = util.text_type(compiled)
         if not dialect.supports_unicode_statements:
@@ -545,10 +618,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         self.isdelete = compiled.isdelete
 
         if not parameters:
-            self.compiled_parameters = [compiled.construct_params()]
+            self.compiled_parameters = [
+                compiled.construct_params(
+                    extracted_parameters=extracted_parameters)]
         else:
             self.compiled_parameters = \
-                [compiled.construct_params(m, _group_number=grp) for
+                [compiled.construct_params(
+                    m, _group_number=grp,
+                    extracted_parameters=extracted_parameters) for
                  grp, m in enumerate(parameters)]
 
             self.executemany = len(parameters) > 1
@@ -570,6 +647,12 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         processors = compiled._bind_processors
 
+        if compiled.contains_expanding_parameters:
+            processors = dict(processors)
+            positiontup = self._expand_in_parameters(compiled, processors)
+        elif compiled.positional:
+            positiontup = self.compiled.positiontup
+
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
@@ -577,7 +660,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         if dialect.positional:
             for compiled_params in self.compiled_parameters:
                 param = []
-                for key in self.compiled.positiontup:
+                for key in positiontup:
                     if key in processors:
                         param.append(processors[key](compiled_params[key]))
                     else:
@@ -613,6 +696,82 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         return self
 
+    def _expand_in_parameters(self, compiled, processors):
+        """handle special 'expanding' parameters, IN lists that are rendered
+        on a per-parameter basis for an otherwise fixed SQL statement string.
+
+        The statement string and the compiled parameters of this context
+        are modified in place; the given dictionary of bind processors is
+        extended to include the expanded parameter names, and the
+        positional names in effect are returned if the dialect is
+        positional.
+
+        """
+        if self.executemany:
+            raise exc.InvalidRequestError(
+                "'expanding' parameters can't be used with "
+                "executemany()")
+
+        if self.dialect.paramstyle == 'numeric':
+            raise NotImplementedError(
+                "'expanding' bind parameters not supported with "
+                "'numeric' paramstyle at this time.")
+
+        compiled_params = self.compiled_parameters[0]
+        if compiled.positional:
+            positiontup = []
+            names = compiled.positiontup
+        else:
+            positiontup = None
+            names = set(compiled.bind_names.values())
+
+        replacement_expressions = {}
+        replacement_keys = {}
+        for name in names:
+            parameter = compiled.binds[name]
+            if name in replacement_expressions:
+                # the same parameter rendered more than once
+                positiontup.extend(replacement_keys[name])
+            elif parameter.expanding:
+                values = compiled_params.pop(name)
+                if not values:
+                    raise exc.InvalidRequestError(
+                        "'expanding' parameter '%s' can't be used with an "
+                        "empty list" % parameter.key)
+                to_update = [
+                    ("%s_%s" % (name, i), value)
+                    for i, value in enumerate(values, 1)
+                ]
+                replacement_expressions[name] = ", ".join(
+                    compiled.bindtemplate % {"name": key}
+                    for key, value in to_update
+                )
+                compiled_params.update(to_update)
+                if name in processors:
+                    processor = processors[name]
+                    processors.update(
+                        (key, processor) for key, value in to_update)
+                replacement_keys[name] = [key for key, value in to_update]
+                if compiled.positional:
+                    positiontup.extend(replacement_keys[name])
+            elif compiled.positional:
+                positiontup.append(name)
+
+        def process_expanding(m):
+            return replacement_expressions[m.group(1)]
+
+        self.unicode_statement = re.sub(
+            r"\[EXPANDING_(\S+?)\]",
+            process_expanding,
+            self.unicode_statement
+        )
+        if not self.dialect.supports_unicode_statements:
+            self.statement = self.unicode_statement.encode(
+                self.dialect.encoding)
+        else:
+            self.statement = self.unicode_statement
+        return positiontup
+
     @classmethod
     def _init_statement(cls, dialect, connection, dbapi_connection,
                         statement, parameters):
@@ -742,7 +901,48 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         return AUTOCOMMIT_REGEXP.match(statement)
 
     def create_cursor(self):
-        return self._dbapi_connection.cursor()
+        if self._use_server_side_cursor():
+            self._is_server_side = True
+            return self.create_server_side_cursor()
+        else:
+            self._is_server_side = False
+            return self._dbapi_connection.cursor()
+
+    def _use_server_side_cursor(self):
+        if not self.dialect.supports_server_side_cursors:
+            return False
+
+        if self.dialect.server_side_cursors:
+            use_server_side = \
+                self.execution_options.get('stream_results', True) and (
+                    (self.compiled and isinstance(self.compiled.statement,
+                                                  expression.Selectable)
+                     or
+                     (
+                        (not self.compiled or
+                         isinstance(self.compiled.statement,
+                                    expression.TextClause))
+                        and self.statement and SERVER_SIDE_CURSOR_RE.match(
+                            self.statement))
+                     )
+                )
+        else:
+            use_server_side = \
+                self.execution_options.get('stream_results', False)
+
+        return use_server_side
+
+    def create_server_side_cursor(self):
+        """Return a new DBAPI cursor which streams rows from the server
+        as they are fetched, rather than buffering the full result.
+
+        Called by :meth:`.create_cursor` when the ``stream_results``
+        execution option is in effect, or when the dialect was created
+        with ``server_side_cursors=True``; only invoked for dialects
+        which set ``supports_server_side_cursors``.
+
+        """
+        raise NotImplementedError()
 
     def pre_exec(self):
         pass
@@ -792,7 +992,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         pass
 
     def get_result_proxy(self):
-        return result.ResultProxy(self)
+        if self._is_server_side:
+            return result.BufferedRowResultProxy(self)
+        else:
+            return result.ResultProxy(self)
 
     @property
     def rowcount(self):
@@ -99,6 +99,11 @@ class Dialect(object):
       ``UPDATE`` and ``DELETE`` statements when executed via
       executemany.
 
+    supports_server_side_cursors
+      Indicate whether the DB-API offers a cursor which streams rows
+      from the server as they are fetched, used when the
+      ``stream_results`` execution option is set.
+
     preexecute_autoincrement_sequences
       True if 'implicit' primary key functions must be executed separately
       in order to get their value.   This is currently oriented towards
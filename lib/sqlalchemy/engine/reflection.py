@@ -33,6 +33,7 @@ from ..util import deprecated
 from ..util import topological
 from .. import inspection
 from .base import Connectable
+import os
 
 
 @util.decorator
@@ -506,6 +507,16 @@ class Inspector(object):
         return self.dialect.get_unique_constraints(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw)
 
+    def _prefetch_reflection(self, table_names, schema=None):
+        """Give the dialect a chance to load reflection information for
+        all of the given tables at once, which subsequent calls to
+        :meth:`.Inspector.reflecttable` for those tables on this
+        :class:`.Inspector` will make use of.
+
+        """
+        self.dialect._prefetch_reflection(
+            self.bind, table_names, schema, info_cache=self.info_cache)
+
     def reflecttable(self, table, include_columns, exclude_columns=()):
         """Given a Table object, load its internal constructs based on
         introspection.
@@ -683,7 +694,7 @@ class Inspector(object):
             if referred_schema is not None:
                 sa_schema.Table(referred_table, table.metadata,
                                 autoload=True, schema=referred_schema,
-                                autoload_with=self.bind,
+                                autoload_with=self,
                                 **reflection_options
                                 )
                 for column in referred_columns:
@@ -691,7 +702,7 @@ class Inspector(object):
                         [referred_schema, referred_table, column]))
             else:
                 sa_schema.Table(referred_table, table.metadata, autoload=True,
-                                autoload_with=self.bind,
+                                autoload_with=self,
                                 **reflection_options
                                 )
                 for column in referred_columns:
@@ -786,3 +797,109 @@ class Inspector(object):
                     constrained_cols.append(constrained_col)
             table.append_constraint(
                 sa_schema.UniqueConstraint(*constrained_cols, name=conname))
+
+
+class ReflectionSnapshot(object):
+    """Persistent snapshot of the information reflected from a database
+    schema.
+
+    When passed to :meth:`.MetaData.reflect` or
+    :meth:`.AutomapBase.prepare`, the results of the reflection queries
+    are stored in a local file, along with a fingerprint of the schema
+    which the dialect produces using a single inexpensive query.  Later
+    processes reflecting the same schema, whose fingerprint is unchanged,
+    construct their :class:`.Table` objects from the snapshot without
+    running any further reflection queries::
+
+        from sqlalchemy.engine.reflection import ReflectionSnapshot
+
+        snapshot = ReflectionSnapshot("/var/run/myapp/reflection.pickle")
+
+        metadata = MetaData()
+        metadata.reflect(engine, snapshot=snapshot)
+
+    Entries are keyed on the URL of the engine, not including the
+    password, and the name of the schema.  The file is written using
+    ``pickle`` and therefore must only be loaded from a trusted location.
+
+    Only dialects which implement a schema fingerprint support snapshots;
+    for other dialects, reflection proceeds as usual.  On MySQL, the
+    fingerprint is derived from the names, types, creation times and
+    collations of the tables in ``information_schema.TABLES``; changes
+    which don't alter these, such as ``ALTER TABLE`` operations which are
+    performed without rebuilding the table or changes to the definition of
+    a view, require that :meth:`.ReflectionSnapshot.invalidate` be called.
+
+    .. versionadded:: 1.0.7
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def _key(self, url, schema):
+        return "%r %s" % (url, schema)
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as file_:
+                return util.pickle.load(file_)
+        except Exception:
+            # missing, truncated or corrupt, or referring to classes
+            # which no longer exist or have moved; reflect as though no
+            # snapshot were present
+            return {}
+
+    def _store(self, entries):
+        # write to a per-process file and rename, so that concurrent
+        # readers never see a partially written file
+        tmp_path = "%s.%d.tmp" % (self.path, os.getpid())
+        with open(tmp_path, "wb") as file_:
+            util.pickle.dump(entries, file_, util.pickle.HIGHEST_PROTOCOL)
+        try:
+            os.rename(tmp_path, self.path)
+        except OSError:
+            # windows won't rename over an existing file
+            os.remove(self.path)
+            os.rename(tmp_path, self.path)
+
+    def restore(self, inspector, schema=None):
+        """Populate the cache of the given :class:`.Inspector` from the
+        snapshot, if the fingerprint of the schema matches.
+
+        Returns the current fingerprint of the schema, or None if the
+        dialect does not support fingerprints.
+
+        """
+        fingerprint = inspector.dialect._reflection_fingerprint(
+            inspector.bind, schema)
+        if fingerprint is None:
+            return None
+
+        entry = self._load().get(self._key(inspector.engine.url, schema))
+        if entry is not None and entry[0] == fingerprint:
+            inspector.info_cache.update(entry[1])
+        return fingerprint
+
+    def save(self, inspector, fingerprint, schema=None):
+        """Store the contents of the cache of the given :class:`.Inspector`
+        as the snapshot for the given fingerprint."""
+
+        entries = self._load()
+        entries[self._key(inspector.engine.url, schema)] = (
+            fingerprint, inspector.info_cache)
+        self._store(entries)
+
+    def invalidate(self, url=None):
+        """Remove the snapshots stored for the given URL, or for all URLs
+        if None, so that the next reflection queries the database."""
+
+        if url is None:
+            entries = {}
+        else:
+            prefix = "%r " % (url, )
+            entries = dict(
+                (key, entry) for key, entry in self._load().items()
+                if not key.startswith(prefix)
+            )
+        self._store(entries)
@@ -11,6 +11,7 @@ and :class:`.RowProxy."""
 
 from .. import exc, util
 from ..sql import expression, sqltypes
+import array
 import collections
 import operator
 
@@ -33,6 +34,26 @@ except ImportError:
         obj.__setstate__(state)
         return obj
 
+try:
+    from sqlalchemy.cresultproxy import process_rows_as_tuples
+except ImportError:
+    def process_rows_as_tuples(rows, processors):
+        processors = [
+            (index, processor)
+            for index, processor in enumerate(processors)
+            if processor is not None
+        ]
+        if not processors:
+            return [tuple(row) for row in rows]
+
+        result = []
+        for row in rows:
+            row = list(row)
+            for index, processor in processors:
+                row[index] = processor(row[index])
+            result.append(tuple(row))
+        return result
+
 try:
     from sqlalchemy.cresultproxy import BaseRowProxy
 except ImportError:
@@ -199,9 +220,12 @@ class ResultMetaData(object):
         else:
             num_ctx_cols = None
 
-        if num_ctx_cols and \
-                cols_are_ordered and \
-                num_ctx_cols == len(metadata):
+        self._ordered_ctx_match = bool(
+            num_ctx_cols and
+            cols_are_ordered and
+            num_ctx_cols == len(metadata))
+
+        if self._ordered_ctx_match:
             # case 1 - SQL expression statement, number of columns
             # in result matches number of cols in compiled.  This is the
             # vast majority case for SQL expression constructs.  In this
@@ -216,7 +240,8 @@ class ResultMetaData(object):
                         type_, key, metadata[idx][1]
                     ),
                     obj,
-                    None
+                    None,
+                    type_
                 ) for idx, (key, name, obj, type_)
                 in enumerate(result_columns)
             ]
@@ -274,7 +299,8 @@ class ResultMetaData(object):
                     mapped_type, colname, coltype)
 
                 raw.append(
-                    (idx, colname, colname, processor, obj, untranslated)
+                    (idx, colname, colname, processor, obj, untranslated,
+                     mapped_type)
                 )
 
         # keymap indexes by integer index...
@@ -287,6 +313,9 @@ class ResultMetaData(object):
         # views like __iter__ and slices
         self._processors = [elem[3] for elem in raw]
 
+        # result types in key order, used by columnar fetches
+        self._types = [elem[6] for elem in raw]
+
         if num_ctx_cols:
             # keymap by primary string...
             by_key = dict([
@@ -414,6 +443,12 @@ class ResultMetaData(object):
             return self._key_fallback(key, False) is not None
 
     def _getter(self, key):
+        index = self._index(key)
+        if index is None:
+            return None
+        return operator.itemgetter(index)
+
+    def _index(self, key):
         if key in self._keymap:
             processor, obj, index = self._keymap[key]
         else:
@@ -427,7 +462,59 @@ class ResultMetaData(object):
                 "Ambiguous column name '%s' in result set! "
                 "try 'use_labels' option on select statement." % key)
 
-        return operator.itemgetter(index)
+        return index
+
+    def _adapt_to_result_columns(self, orig_result_columns, result_columns):
+        """Return a copy of this :class:`.ResultMetaData`, built for
+        ``orig_result_columns``, which additionally targets the column
+        objects added to ``result_columns``.
+
+        Used when a cached :class:`.Compiled` is executed on behalf of
+        another statement having the same structure; only the keymap is
+        copied, while the processors and keys are shared.
+
+        """
+        adapted = self.__class__.__new__(self.__class__)
+        adapted.__dict__.update(self.__dict__)
+        adapted._keymap = keymap = self._keymap.copy()
+        case_sensitive = self.case_sensitive
+        for orig, new in zip(orig_result_columns, result_columns):
+            added = new[2][len(orig[2]):]
+            if not added:
+                continue
+            name = new[1] if case_sensitive else new[1].lower()
+            processor, obj, index = keymap[name]
+            keymap[name] = rec = (processor, new[2], index)
+            for obj in added:
+                keymap[obj] = rec
+                # an anonymous label has a name distinct from that of
+                # the label it corresponds to; make it available for
+                # targeting by name as well, as is done for the
+                # anonymous labels of the compiled statement itself
+                obj_name = getattr(obj, 'name', None)
+                if isinstance(obj_name, util.string_types):
+                    if not case_sensitive:
+                        obj_name = obj_name.lower()
+                    keymap.setdefault(obj_name, rec)
+        return adapted
+
+    @util.memoized_property
+    def _array_typecodes(self):
+        """Return an ``array`` module typecode, or None, per column.
+
+        Columns of a plain integer or non-decimal floating point type
+        are buffered in an ``array.array`` by columnar fetches.
+
+        """
+        typecodes = []
+        for type_ in self._types:
+            if isinstance(type_, sqltypes.Integer):
+                typecodes.append('l')
+            elif isinstance(type_, sqltypes.Float) and not type_.asdecimal:
+                typecodes.append('d')
+            else:
+                typecodes.append(None)
+        return typecodes
 
     def __getstate__(self):
         return {
@@ -444,6 +531,7 @@ class ResultMetaData(object):
         # the row has been processed at pickling time so we don't need any
         # processor anymore
         self._processors = [None for _ in range(len(state['keys']))]
+        self._types = [None for _ in range(len(state['keys']))]
         self._keymap = keymap = {}
         for key, index in state['_pickled_keymap'].items():
             # not preserving "obj" here, unfortunately our
@@ -473,9 +561,15 @@ class ResultProxy(object):
     data using ``TypeEngine`` objects, which are referenced from
     the originating SQL statement that produced this result set.
 
+    When the ``row_format='tuple'`` execution option is in effect, rows
+    are returned as plain tuples with all processing already applied,
+    rather than as :class:`.RowProxy` objects; see
+    :meth:`.Connection.execution_options`.
+
     """
 
     _process_row = RowProxy
+    _tuple_rows = False
     out_parameters = None
     _can_close_connection = False
     _metadata = None
@@ -489,30 +583,65 @@ class ResultProxy(object):
         self.connection = context.root_connection
         self._echo = self.connection._echo and \
             context.engine._should_log_debug()
+        self._tuple_rows = \
+            context.execution_options.get('row_format') == 'tuple'
         self._init_metadata()
 
     def _getter(self, key):
         return self._metadata._getter(key)
 
+    def _index(self, key):
+        return self._metadata._index(key)
+
     def _has_key(self, key):
         return self._metadata._has_key(key)
 
     def _init_metadata(self):
         metadata = self._cursor_description()
         if metadata is not None:
-            if self.context.compiled and \
-                    'compiled_cache' in self.context.execution_options:
-                if self.context.compiled._cached_metadata:
-                    self._metadata = self.context.compiled._cached_metadata
-                else:
-                    self._metadata = self.context.compiled._cached_metadata = \
-                        ResultMetaData(self, metadata)
+            if self.context.compiled is not None and \
+                    self.context.result_column_struct:
+                self._metadata = self._compiled_metadata(
+                    self.context.compiled, metadata)
             else:
                 self._metadata = ResultMetaData(self, metadata)
             if self._echo:
                 self.context.engine.logger.debug(
                     "Col %r", tuple(x[0] for x in metadata))
 
+    def _compiled_metadata(self, compiled, metadata):
+        """Return a :class:`.ResultMetaData` for a result of the given
+        :class:`.Compiled`, sharing one built by a previous execution
+        where the cursor description is the same.
+
+        Metadata is shared only among results of the same class, as
+        subclasses such as :class:`.BufferedColumnResultProxy` modify
+        the metadata they're given.
+
+        """
+        key = self.__class__, tuple((rec[0], rec[1]) for rec in metadata)
+        cache = compiled._cached_metadata
+        if cache is None:
+            cache = compiled._cached_metadata = {}
+
+        result_columns = self.context.result_column_struct[0]
+        if result_columns is compiled._result_columns:
+            try:
+                return cache[key]
+            except KeyError:
+                cached = cache[key] = ResultMetaData(self, metadata)
+                return cached
+
+        # the compiled object is executed on behalf of a statement of
+        # the same structure; its columns need to be added as targets
+        # to the shared metadata
+        cached = cache.get(key)
+        if cached is not None and cached._ordered_ctx_match:
+            return cached._adapt_to_result_columns(
+                compiled._result_columns, result_columns)
+        else:
+            return ResultMetaData(self, metadata)
+
     def keys(self):
         """Return the current set of string keys for rows."""
         if self._metadata:
@@ -913,6 +1042,10 @@ class ResultProxy(object):
             return default
 
     def process_rows(self, rows):
+        if self._tuple_rows:
+            return self._process_tuple_rows(
+                rows, self._metadata._processors)
+
         process_row = self._process_row
         metadata = self._metadata
         keymap = metadata._keymap
@@ -928,6 +1061,120 @@ class ResultProxy(object):
             return [process_row(metadata, row, processors, keymap)
                     for row in rows]
 
+    def _process_tuple_rows(self, rows, processors):
+        if self._echo:
+            log = self.context.engine.logger.debug
+            for row in rows:
+                log("Row %r", row)
+        return process_rows_as_tuples(rows, processors)
+
+    def process_columns(self, rows, processors=None):
+        """Transpose raw DBAPI rows into per-column sequences.
+
+        Result processors are applied one column at a time.  The
+        container of each column is chosen as described at
+        :meth:`.ResultProxy.fetch_columns`.
+
+        .. versionadded:: 1.0.7
+
+        """
+        metadata = self._metadata
+        if processors is None:
+            processors = metadata._processors
+        if self._echo:
+            log = self.context.engine.logger.debug
+            for row in rows:
+                log("Row %r", row)
+
+        if rows:
+            columns = list(zip(*rows))
+        else:
+            columns = [() for key in metadata.keys]
+
+        result = []
+        for processor, typecode, values in zip(
+                processors, metadata._array_typecodes, columns):
+            if processor is not None:
+                values = [processor(value) for value in values]
+            if typecode is not None:
+                try:
+                    values = array.array(typecode, values)
+                except (TypeError, OverflowError):
+                    # NULLs, or values the typecode can't hold
+                    values = list(values)
+            else:
+                values = list(values)
+            result.append(values)
+        return result
+
+    def fetch_columns(self, size=None):
+        """Fetch rows and return them as a list of per-column sequences.
+
+        The sequences are in the same order as :meth:`.ResultProxy.keys`;
+        no :class:`.RowProxy` is constructed.
+
+        The container of a column depends on its type and on the values
+        fetched, not on whether the type has a result processor:
+
+        * a column whose type is :class:`.Integer` or a :class:`.Float`
+          with ``asdecimal=False``, or a subclass of these, is returned
+          as an ``array.array`` of typecode ``'l'`` or ``'d'``
+          respectively, unless a value is None or doesn't fit the
+          typecode, in which case it's returned as a list;
+
+        * all other columns, including those of a :class:`.TypeDecorator`,
+          are returned as lists.
+
+        Both containers support ``len()``, indexing and iteration.
+
+        :param size: if None, all remaining rows are fetched and the
+         result is soft-closed, as with :meth:`.ResultProxy.fetchall`;
+         otherwise up to this many rows are fetched, as with
+         :meth:`.ResultProxy.fetchmany`.
+
+        .. versionadded:: 1.0.7
+
+        .. seealso::
+
+            :meth:`.ResultProxy.iterate_columns`
+
+        """
+        try:
+            if size is None:
+                columns = self.process_columns(self._fetchall_impl())
+                self._soft_close()
+            else:
+                rows = self._fetchmany_impl(size)
+                columns = self.process_columns(rows)
+                if len(rows) == 0:
+                    self._soft_close()
+            return columns
+        except Exception as e:
+            self.connection._handle_dbapi_exception(
+                e, None, None,
+                self.cursor, self.context)
+
+    def iterate_columns(self, size=1000):
+        """Iterate through the result in chunks of per-column sequences.
+
+        Each chunk is the result of :meth:`.ResultProxy.fetch_columns`
+        for up to ``size`` rows, so that very large results may be
+        consumed column-wise with bounded memory, particularly in
+        conjunction with the ``stream_results`` execution option.  As the
+        container of an integer or floating point column depends on the
+        values fetched, the same column may be an ``array.array`` in one
+        chunk and a list in another, such as when only the latter
+        contains NULLs.
+
+        .. versionadded:: 1.0.7
+
+        """
+        while True:
+            columns = self.fetch_columns(size)
+            if not columns or not len(columns[0]):
+                break
+            yield columns
+
     def fetchall(self):
         """Fetch all rows, just like DB-API ``cursor.fetchall()``.
 
@@ -1063,7 +1310,9 @@ class BufferedRowResultProxy(ResultProxy):
     ``cursor.description`` to be available immediately, when
     interfacing with a DB-API that requires rows to be consumed before
     this information is available (currently psycopg2, when used with
-    server-side cursors).
+    server-side cursors).  It is also used for MySQLdb and PyMySQL
+    server-side cursors, so that rows are streamed from the server in
+    growing batches rather than fetched all at once.
 
     The pre-fetching behavior fetches only one row initially, and then
     grows its buffer size by a fixed amount with each successive need
@@ -1225,6 +1474,10 @@ class BufferedColumnResultProxy(ResultProxy):
     def _init_metadata(self):
         super(BufferedColumnResultProxy, self)._init_metadata()
         metadata = self._metadata
+        if getattr(metadata, '_orig_processors', None) is not None:
+            # metadata shared with a previous result of the same
+            # compiled statement, already set up
+            return
         # orig_processors will be used to preprocess each row when they are
         # constructed.
         metadata._orig_processors = metadata._processors
@@ -1235,6 +1488,12 @@ class BufferedColumnResultProxy(ResultProxy):
             keymap[k] = (None, obj, index)
         self._metadata._keymap = keymap
 
+    def process_rows(self, rows):
+        if self._tuple_rows:
+            return self._process_tuple_rows(
+                rows, self._metadata._orig_processors)
+        return super(BufferedColumnResultProxy, self).process_rows(rows)
+
     def fetchall(self):
         # can't call cursor.fetchall(), since rows must be
         # fully processed before requesting more from the DBAPI.
@@ -1258,3 +1517,14 @@ class BufferedColumnResultProxy(ResultProxy):
                 break
             l.append(row)
         return l
+
+    def fetch_columns(self, size=None):
+        # can't call cursor.fetchall(), since rows must be
+        # fully processed before requesting more from the DBAPI.
+        if size is None:
+            rows = self.fetchall()
+        else:
+            rows = self.fetchmany(size)
+        return self.process_columns(
+            [tuple(row) for row in rows],
+            [None for key in self._metadata.keys])
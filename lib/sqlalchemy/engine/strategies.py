@@ -144,6 +144,7 @@ class DefaultEngineStrategy(EngineStrategy):
                 engine_args[k] = pop_kwarg(k)
 
         _initialize = kwargs.pop('_initialize', True)
+        dialect_state_cache = kwargs.pop('dialect_state_cache', None)
 
         # all kwargs should be consumed
         if kwargs:
@@ -178,7 +179,10 @@ class DefaultEngineStrategy(EngineStrategy):
                 c = base.Connection(engine, connection=dbapi_connection,
                                     _has_events=False)
                 c._execution_options = util.immutabledict()
-                dialect.initialize(c)
+                if dialect_state_cache is not None:
+                    dialect_state_cache.initialize(dialect, c, u)
+                else:
+                    dialect.initialize(c)
             event.listen(pool, 'first_connect', first_connect, once=True)
 
         dialect_cls.engine_created(engine)
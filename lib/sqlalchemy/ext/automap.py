@@ -699,7 +699,8 @@ class AutomapBase(object):
             collection_class=list,
             name_for_scalar_relationship=name_for_scalar_relationship,
             name_for_collection_relationship=name_for_collection_relationship,
-            generate_relationship=generate_relationship):
+            generate_relationship=generate_relationship,
+            snapshot=None):
         """Extract mapped classes and relationships from the :class:`.MetaData` and
         perform mappings.
 
@@ -715,6 +716,12 @@ class AutomapBase(object):
          reflection if present; else, the :class:`.MetaData` should already be
          bound to some engine else the operation will fail.
 
+        :param snapshot: a :class:`.ReflectionSnapshot` passed along to
+         :meth:`.MetaData.reflect`, allowing the reflected schema to be
+         loaded from a local file when it hasn't changed.
+
+         .. versionadded:: 1.0.7
+
         :param classname_for_table: callable function which will be used to
          produce new class names, given a table name.  Defaults to
          :func:`.classname_for_table`.
@@ -740,7 +747,8 @@ class AutomapBase(object):
             cls.metadata.reflect(
                 engine,
                 extend_existing=True,
-                autoload_replace=False
+                autoload_replace=False,
+                snapshot=snapshot
             )
 
         table_to_map_config = dict(
@@ -15,7 +15,16 @@ the source distribution.
 
 """
 
-from .. import util
+import collections
+import heapq
+import itertools
+import sys
+
+from .. import util, exc as sa_exc
+from ..util import threading
+from ..sql import expression, operators, sqltypes
+from ..orm import attributes, persistence, cache as orm_cache
+from ..orm.base import _class_to_mapper
 from ..orm.session import Session
 from ..orm.query import Query
 
@@ -29,6 +38,11 @@ class ShardedQuery(Query):
         self.query_chooser = self.session.query_chooser
         self._shard_id = None
 
+    def _generate_cache_key(self):
+        # the shards queried are chosen per execution, using the
+        # choosers of the Session
+        return None
+
     def set_shard(self, shard_id):
         """return a new query, limited to a single shard ID.
 
@@ -40,27 +54,129 @@ class ShardedQuery(Query):
         q._shard_id = shard_id
         return q
 
+    def _connection_for_shard(self, shard_id):
+        return self._connection_from_session(
+            mapper=self._mapper_zero(),
+            shard_id=shard_id)
+
+    def _execute_on_shards(self, shard_ids, statement):
+        workers = self.session.shard_workers
+        if workers and workers > 1 and len(shard_ids) > 1:
+            def execute(conn):
+                return conn.execute(statement, self._params)
+
+            return _run_concurrently(
+                [
+                    (self._connection_for_shard(shard_id), execute)
+                    for shard_id in shard_ids
+                ],
+                workers, cleanup=lambda result: result.close())
+        else:
+            return (
+                self._connection_for_shard(shard_id).execute(
+                    statement, self._params)
+                for shard_id in shard_ids
+            )
+
     def _execute_and_instances(self, context):
-        def iter_for_shard(shard_id):
+        def iter_for_shard(shard_id, result):
             context.attributes['shard_id'] = shard_id
-            result = self._connection_from_session(
-                mapper=self._mapper_zero(),
-                shard_id=shard_id).execute(
-                context.statement,
-                self._params)
             return self.instances(result, context)
 
         if self._shard_id is not None:
-            return iter_for_shard(self._shard_id)
+            return iter_for_shard(
+                self._shard_id,
+                self._connection_for_shard(self._shard_id).execute(
+                    context.statement, self._params))
         else:
+            shard_ids = list(self.query_chooser(self))
+            if len(shard_ids) > 1:
+                merge = self._ordered_merge_context(context)
+                if merge is not None:
+                    return self._execute_ordered_merge(shard_ids, *merge)
+
             partial = []
-            for shard_id in self.query_chooser(self):
-                partial.extend(iter_for_shard(shard_id))
+            for shard_id, result in zip(
+                    shard_ids,
+                    self._execute_on_shards(shard_ids, context.statement)):
+                partial.extend(iter_for_shard(shard_id, result))
 
-            # if some kind of in memory 'sorting'
-            # were done, this is where it would happen
             return iter(partial)
 
+    def _ordered_merge_context(self, context):
+        """Return the context, statement and sort order used to query
+        multiple shards with an ordered merge of their results, or None
+        if the query isn't ordered or its ordering can't be merged.
+
+        LIMIT and OFFSET are pushed down to each shard as a LIMIT of
+        their sum; the returned statement also selects each ORDER BY
+        expression under an anonymous label, so that rows can be compared
+        regardless of the entities being loaded.
+
+        """
+        if context.multi_row_eager_loaders:
+            return None
+
+        if self._limit is not None or self._offset is not None:
+            q = self._clone()
+            if self._limit is not None:
+                q._limit = self._limit + (self._offset or 0)
+            q._offset = None
+            context = q._compile_context()
+            context.statement.use_labels = True
+
+        statement = context.statement
+        if not statement._order_by_clause.clauses:
+            return None
+
+        collation_key = self.session.collation_key
+        order = []
+        for elem in statement._order_by_clause.clauses:
+            nulls_first = None
+            if isinstance(elem, expression.UnaryExpression) and \
+                    elem.modifier in (
+                        operators.nullsfirst_op, operators.nullslast_op):
+                nulls_first = elem.modifier is operators.nullsfirst_op
+                elem = elem.element
+            descending = False
+            if isinstance(elem, expression.UnaryExpression) and \
+                    elem.modifier in (operators.desc_op, operators.asc_op):
+                descending = elem.modifier is operators.desc_op
+                elem = elem.element
+            if isinstance(elem, expression.Label):
+                elem = elem.element
+            if not isinstance(elem, expression.ColumnElement):
+                return None
+            if issubclass(
+                    elem.type._type_affinity,
+                    (sqltypes.String, sqltypes.NullType)):
+                # strings are compared as the database's collation does
+                # only when a key is given; e.g. MySQL's default
+                # collations are case insensitive
+                if collation_key is None:
+                    return None
+                key = collation_key
+            else:
+                key = None
+            if nulls_first is None:
+                # NULL is ordered before other values in ascending
+                # order, as on MySQL and SQLite
+                nulls_first = not descending
+            label = elem.label(None)
+            statement = statement.column(label)
+            order.append((label, descending, nulls_first, key))
+
+        return context, statement, order
+
+    def _execute_ordered_merge(self, shard_ids, context, statement, order):
+        results = list(self._execute_on_shards(shard_ids, statement))
+        return self.instances(
+            _MergedResult(
+                results,
+                _merge_ordered(results, order, self._offset, self._limit),
+                shard_ids, context),
+            context)
+
     def get(self, ident, **kwargs):
         if self._shard_id is not None:
             return super(ShardedQuery, self).get(ident)
@@ -76,7 +192,8 @@ class ShardedQuery(Query):
 
 class ShardedSession(Session):
     def __init__(self, shard_chooser, id_chooser, query_chooser, shards=None,
-                 query_cls=ShardedQuery, **kwargs):
+                 query_cls=ShardedQuery, shard_workers=None,
+                 mapping_shard_chooser=None, collation_key=None, **kwargs):
         """Construct a ShardedSession.
 
         :param shard_chooser: A callable which, passed a Mapper, a mapped
@@ -92,16 +209,62 @@ class ShardedSession(Session):
 
         :param query_chooser: For a given Query, returns the list of shard_ids
           where the query should be issued.  Results from all shards returned
-          will be combined together into a single listing.
+          will be combined together into a single listing.  When the query
+          has an ORDER BY, the results of each shard are merged in that
+          order, and LIMIT / OFFSET are applied to the merged results; each
+          shard is queried with a LIMIT of the sum of the two.  The
+          ``shard_id`` entry in ``QueryContext.attributes`` is set to the
+          shard of each row as it's processed.  Joined eager loading of
+          collections, ORDER BY expressions other than column expressions,
+          and string ORDER BY expressions when no ``collation_key`` is
+          given disable the merge, and results are concatenated in shard
+          order.
 
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param shard_workers: When greater than one, a query against
+          multiple shards executes its statement on each shard concurrently,
+          using up to this many threads; results are then processed into
+          objects in the calling thread, in the order given by
+          ``query_chooser``.  Shards whose connections share the same DBAPI
+          connection execute one after the other.  If execution fails on
+          any shard, the exception of the first such shard in that order
+          is raised once all shards have finished.  The DBAPI connections
+          must support use from a thread other than the one which created
+          them.  Defaults to None, where shards are queried one at a time.
+          The bulk methods of :class:`.ShardedSession` similarly run the
+          statements for each shard concurrently.
+
+          .. versionadded:: 1.0.7
+
+        :param mapping_shard_chooser: A callable which, passed a Mapper and
+          a dictionary as given to :meth:`.ShardedSession.bulk_insert_mappings`
+          or :meth:`.ShardedSession.bulk_update_mappings`, returns the shard
+          ID where the row resides.  Required by those methods.
+
+          .. versionadded:: 1.0.7
+
+        :param collation_key: A callable which, passed a string value of
+          an ORDER BY expression, returns a value which compares in Python
+          as the database's collation orders the string; e.g.
+          ``lambda value: value`` for a binary collation, or
+          ``lambda value: value.lower()`` as an approximation of a case
+          insensitive collation such as MySQL's default.  Required in
+          order for the results of a query ordered by a string expression
+          to be merged; otherwise the results of each shard are
+          concatenated.
+
+          .. versionadded:: 1.0.7
+
         """
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
         self.shard_chooser = shard_chooser
         self.id_chooser = id_chooser
         self.query_chooser = query_chooser
+        self.shard_workers = shard_workers
+        self.mapping_shard_chooser = mapping_shard_chooser
+        self.collation_key = collation_key
         self.__binds = {}
         self.connection_callable = self.connection
         if shards is not None:
@@ -129,3 +292,309 @@ class ShardedSession(Session):
 
     def bind_shard(self, shard_id, bind):
         self.__binds[shard_id] = bind
+
+    def bulk_save_objects(
+            self, objects, return_defaults=False, update_changed_only=True):
+        """Perform a bulk save of the given list of objects, partitioned
+        by shard.
+
+        Each object is assigned to a shard using ``shard_chooser``, and
+        each shard receives the INSERT and UPDATE statements for its own
+        objects only.  Otherwise works like
+        :meth:`.Session.bulk_save_objects`.
+
+        Returns a dictionary of shard ID to the number of objects
+        assigned to that shard.  This is not a database rowcount.
+
+        .. versionadded:: 1.0.7
+
+        """
+        counts = {}
+        for (mapper, isupdate), states in itertools.groupby(
+            (attributes.instance_state(obj) for obj in objects),
+            lambda state: (state.mapper, state.key is not None)
+        ):
+            for shard_id, count in self._bulk_save_mappings(
+                    mapper, states, isupdate, True,
+                    return_defaults, update_changed_only).items():
+                counts[shard_id] = counts.get(shard_id, 0) + count
+        return counts
+
+    def bulk_insert_mappings(self, mapper, mappings, return_defaults=False):
+        """Perform a bulk insert of the given list of mapping dictionaries,
+        partitioned by shard.
+
+        Each dictionary is assigned to a shard using
+        ``mapping_shard_chooser``, and one "executemany" INSERT is emitted
+        per shard.  Otherwise works like
+        :meth:`.Session.bulk_insert_mappings`.
+
+        Returns a dictionary of shard ID to the number of mappings
+        assigned to that shard.  This is not a database rowcount.
+
+        .. versionadded:: 1.0.7
+
+        """
+        return self._bulk_save_mappings(
+            mapper, mappings, False, False, return_defaults, False)
+
+    def bulk_update_mappings(self, mapper, mappings):
+        """Perform a bulk update of the given list of mapping dictionaries,
+        partitioned by shard.
+
+        Each dictionary is assigned to a shard using
+        ``mapping_shard_chooser``, and one "executemany" UPDATE is emitted
+        per shard.  Otherwise works like
+        :meth:`.Session.bulk_update_mappings`.
+
+        Returns a dictionary of shard ID to the number of mappings
+        assigned to that shard.  This is not a database rowcount.
+
+        .. versionadded:: 1.0.7
+
+        """
+        return self._bulk_save_mappings(
+            mapper, mappings, True, False, False, False)
+
+    def _bulk_save_mappings(
+            self, mapper, mappings, isupdate, isstates,
+            return_defaults, update_changed_only):
+        mapper = _class_to_mapper(mapper)
+
+        partitions = util.OrderedDict()
+        for mapping in mappings:
+            if isstates:
+                shard_id = self.shard_chooser(mapper, mapping.obj())
+            elif self.mapping_shard_chooser is None:
+                raise sa_exc.InvalidRequestError(
+                    "ShardedSession requires a mapping_shard_chooser in "
+                    "order to use bulk_insert_mappings() or "
+                    "bulk_update_mappings()")
+            else:
+                shard_id = self.mapping_shard_chooser(mapper, mapping)
+            partitions.setdefault(shard_id, []).append(mapping)
+
+        self._flushing = True
+        transaction = self.begin(subtransactions=True)
+        try:
+            def save(connection, shard_mappings):
+                if isupdate:
+                    persistence._bulk_update(
+                        mapper, shard_mappings, transaction,
+                        isstates, update_changed_only,
+                        connection=connection)
+                else:
+                    persistence._bulk_insert(
+                        mapper, shard_mappings, transaction,
+                        isstates, return_defaults,
+                        connection=connection)
+                return len(shard_mappings)
+
+            calls = [
+                (transaction.connection(mapper, shard_id=shard_id),
+                 lambda connection, shard_mappings=shard_mappings:
+                 save(connection, shard_mappings))
+                for shard_id, shard_mappings in partitions.items()
+            ]
+
+            workers = self.shard_workers
+            if workers and workers > 1 and len(calls) > 1:
+                counts = _run_concurrently(calls, workers)
+            else:
+                counts = [fn(connection) for connection, fn in calls]
+
+            if isupdate:
+                orm_cache.invalidate_mapper(self, mapper)
+            transaction.commit()
+
+        except:
+            with util.safe_reraise():
+                transaction.rollback(_capture_exception=True)
+        finally:
+            self._flushing = False
+
+        return dict(zip(partitions, counts))
+
+
+def _run_concurrently(calls, workers, cleanup=None):
+    """Invoke each of the given ``(connection, fn)`` pairs as
+    ``fn(connection)`` using a pool of up to ``workers`` threads,
+    returning the list of return values in the same order.
+
+    Calls which use the same DBAPI connection are run in sequence
+    by a single thread.  If any call raises, ``cleanup`` is invoked
+    for each value returned by the others, and the exception of the
+    first failing call is re-raised.
+
+    """
+    by_dbapi_connection = util.OrderedDict()
+    for index, (conn, fn) in enumerate(calls):
+        by_dbapi_connection.setdefault(
+            conn.connection.connection, []).append((index, conn, fn))
+
+    tasks = collections.deque(by_dbapi_connection.values())
+    results = [None] * len(calls)
+    errors = {}
+
+    def run():
+        while True:
+            try:
+                task = tasks.popleft()
+            except IndexError:
+                return
+            for index, conn, fn in task:
+                try:
+                    results[index] = fn(conn)
+                except Exception:
+                    errors[index] = sys.exc_info()
+                    break
+
+    threads = [
+        threading.Thread(target=run)
+        for i in range(min(workers, len(tasks)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        if cleanup is not None:
+            for index, result in enumerate(results):
+                if index not in errors and result is not None:
+                    cleanup(result)
+        util.reraise(*errors[min(errors)])
+    return results
+
+
+class _MergeKey(object):
+    """Sort key of a row in an ordered merge of shard results."""
+
+    __slots__ = 'values', 'order'
+
+    def __init__(self, values, order):
+        self.values = values
+        self.order = order
+
+    def _compare(self, other):
+        for (label, descending, nulls_first, key), left, right in zip(
+                self.order, self.values, other.values):
+            if key is not None:
+                if left is not None:
+                    left = key(left)
+                if right is not None:
+                    right = key(right)
+            if left == right:
+                continue
+            elif left is None:
+                return -1 if nulls_first else 1
+            elif right is None:
+                return 1 if nulls_first else -1
+            elif descending:
+                return -1 if left > right else 1
+            else:
+                return -1 if left < right else 1
+        return 0
+
+    def __lt__(self, other):
+        return self._compare(other) < 0
+
+    def __eq__(self, other):
+        return self._compare(other) == 0
+
+    def __ne__(self, other):
+        return self._compare(other) != 0
+
+
+def _merge_ordered(results, order, offset, limit):
+    """Merge rows from the given results, each ordered by ``order``,
+    into a single ordered stream of ``(index, row)`` tuples, where
+    ``index`` is the position of the row's result, applying ``offset``
+    and ``limit`` to the merged stream."""
+
+    heap = []
+    for index, result in enumerate(results):
+        getters = [result._getter(label) for label, d, n, k in order]
+        rows = iter(result)
+        for row in rows:
+            heap.append(
+                (_MergeKey([g(row) for g in getters], order),
+                 index, row, rows, getters))
+            break
+    heapq.heapify(heap)
+
+    skip = offset or 0
+    remaining = limit
+    while heap and remaining != 0:
+        key, index, row, rows, getters = heap[0]
+        for next_row in rows:
+            heapq.heapreplace(
+                heap,
+                (_MergeKey([g(next_row) for g in getters], order),
+                 index, next_row, rows, getters))
+            break
+        else:
+            heapq.heappop(heap)
+
+        if skip:
+            skip -= 1
+            continue
+        if remaining is not None:
+            remaining -= 1
+        yield index, row
+
+    for result in results:
+        result.close()
+
+
+class _MergedResult(object):
+    """Present a merged stream of rows from several shard results to
+    :meth:`.Query.instances`, with the result metadata of the first.
+
+    The results all derive from the same statement, so columns are
+    located at the same positions in each.
+
+    """
+
+    def __init__(self, results, rows, shard_ids, context):
+        self._results = results
+        self._rows = rows
+        self._shard_ids = shard_ids
+        self._context = context
+
+    def __getattr__(self, key):
+        return getattr(self._results[0], key)
+
+    def fetchall(self):
+        return _ShardRows(list(self._rows), self._shard_ids, self._context)
+
+    def fetchmany(self, size=None):
+        return _ShardRows(
+            list(itertools.islice(self._rows, size)),
+            self._shard_ids, self._context)
+
+    def close(self):
+        for result in self._results:
+            result.close()
+
+
+class _ShardRows(object):
+    """A batch of rows from a :class:`._MergedResult`, which sets the
+    ``shard_id`` of the query context to that of each row as it's
+    iterated, and so before the row is processed."""
+
+    __slots__ = '_rows', '_shard_ids', '_context'
+
+    def __init__(self, rows, shard_ids, context):
+        self._rows = rows
+        self._shard_ids = shard_ids
+        self._context = context
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        attributes = self._context.attributes
+        for index, row in self._rows:
+            attributes['shard_id'] = self._shard_ids[index]
+            yield row
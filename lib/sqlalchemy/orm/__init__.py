@@ -63,6 +63,7 @@ from .session import (
 from .scoping import (
     scoped_session
 )
+from .cache import SecondLevelCache, QueryCache
 from . import mapper as mapperlib
 from .query import AliasOption, Query, Bundle
 from ..util.langhelpers import public_factory
@@ -235,6 +236,8 @@ lazyload = strategy_options.lazyload._unbound_fn
 lazyload_all = strategy_options.lazyload_all._unbound_all_fn
 subqueryload = strategy_options.subqueryload._unbound_fn
 subqueryload_all = strategy_options.subqueryload_all._unbound_all_fn
+selectinload = strategy_options.selectinload._unbound_fn
+selectinload_all = strategy_options.selectinload_all._unbound_all_fn
 immediateload = strategy_options.immediateload._unbound_fn
 noload = strategy_options.noload._unbound_fn
 defaultload = strategy_options.defaultload._unbound_fn
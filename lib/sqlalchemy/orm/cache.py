@@ -0,0 +1,389 @@
+# orm/cache.py
+# Copyright (C) 2005-2015 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""Process-wide "second level" cache of loaded column state, consulted
+by :meth:`.Query.get` and by simple many-to-one lazy loads, as well as
+the cache of compiled :class:`.Query` objects.
+
+"""
+
+import time
+import weakref
+
+from .. import util, event
+from ..engine.util import CompiledCache
+from . import attributes
+
+
+class QueryCache(CompiledCache):
+    """Bounded cache of the compiled form of :class:`.Query` objects,
+    keyed on their structure.
+
+    A :class:`.QueryCache` is associated with a :class:`.Session` using
+    the :paramref:`.Session.query_cache` parameter, typically via
+    :class:`.sessionmaker` so that it's shared among all sessions::
+
+        Session = sessionmaker(bind=engine, query_cache=QueryCache(1000))
+
+    When a :class:`.Query` is invoked, a key is generated from its
+    entities, criteria, joins, ordering, loader options and similar
+    state, not including the values of bound parameters.  The
+    :class:`.QueryContext` and SELECT statement compiled for the first
+    :class:`.Query` of a given key are retained, and a subsequent
+    :class:`.Query` of the same key is executed using these along with
+    its own parameter values, skipping the work of compilation; this
+    is the same savings provided by :mod:`sqlalchemy.ext.baked`,
+    without the need to restructure the code that builds queries.
+
+    Queries which can't be represented by a key are compiled as usual;
+    these include those which use :meth:`.Query.from_statement`,
+    aliased joins, :meth:`.Query.with_hints`, :meth:`.Query.correlate`,
+    options other than loader options, :func:`.subqueryload`, and
+    queries for which a :meth:`.QueryEvents.before_compile` listener is
+    established.  Values passed to :meth:`.Query.limit` and
+    :meth:`.Query.offset` are part of the key.
+
+    Counts of cache hits, misses and evictions are maintained and may
+    be retrieved using :meth:`.QueryCache.stats`.
+
+    .. versionadded:: 1.0.7
+
+    """
+
+    def __init__(self, capacity=500, threshold=.5):
+        super(QueryCache, self).__init__(capacity, threshold)
+
+
+class SecondLevelCache(object):
+    """A process-wide cache of the column attributes of mapped instances,
+    keyed on identity key.
+
+    A :class:`.SecondLevelCache` is associated with a mapping using the
+    :paramref:`.mapper.second_level_cache` parameter::
+
+        reference_cache = SecondLevelCache(capacity=5000, ttl=300)
+
+        class Currency(Base):
+            __tablename__ = 'currency'
+            __mapper_args__ = {"second_level_cache": reference_cache}
+
+    When :meth:`.Query.get`, or the lazy load of a many-to-one which
+    refers to the primary key of the target, doesn't locate the object
+    in the :class:`.Session` identity map, the cache is consulted before
+    any SQL is emitted.  On a hit, the instance is constructed in the
+    :class:`.Session` from the cached column values, as though it had
+    been loaded from a row; relationships load as usual on access.  On a
+    miss, the row is loaded from the database and its column values are
+    stored in the cache.
+
+    Entries are invalidated when the corresponding object is flushed by
+    any :class:`.Session`, and again when the transaction of that
+    :class:`.Session` ends; a :meth:`.Query.update` or
+    :meth:`.Query.delete` against the mapping invalidates all of its
+    entries, as do :meth:`.Session.bulk_update_mappings` and
+    :meth:`.Session.bulk_save_objects`.
+    Changes made to the database by other means, such as ``ON UPDATE
+    CASCADE`` or other processes, aren't detected; the ``ttl`` should be
+    chosen accordingly.  Loads which take place in a :class:`.Session`
+    that has flushed changes in its current transaction don't populate
+    the cache, nor do loads of an entry within a transaction which began
+    before that entry was last invalidated, as under an isolation level
+    such as REPEATABLE READ that transaction may still read the rows as
+    they were before the change.
+
+    Loader options of the query aren't applied to instances produced
+    from the cache, and the :meth:`.InstanceEvents.load` event is emitted
+    for them with a ``context`` of None.  Values are shared between the
+    instances produced for each :class:`.Session`, so mutable column
+    values should not be mutated in place.
+
+    This implementation is an in-process LRU cache; subclasses may
+    store entries elsewhere by overriding :meth:`.get`, :meth:`.set`,
+    :meth:`.invalidate` and :meth:`.invalidate_class`.  Keys and values
+    are picklable.
+
+    .. versionadded:: 1.0.7
+
+    """
+
+    def __init__(self, capacity=1000, ttl=None, threshold=.5):
+        """Construct a new :class:`.SecondLevelCache`.
+
+        :param capacity: the number of entries to retain; once the number
+         of entries exceeds ``capacity`` by the given ``threshold``, the
+         least recently used entries are discarded.
+
+        :param ttl: number of seconds after which an entry expires, or
+         None for entries to remain until invalidated or evicted.
+
+        :param threshold: fraction of ``capacity`` by which the cache may
+         grow before it's pruned back to ``capacity``.
+
+        """
+        self.ttl = ttl
+        self._entries = _CountingLRUCache(capacity, threshold)
+        self.hits = self.misses = self.expirations = \
+            self.invalidations = 0
+
+    def get(self, key):
+        """Return the cached value for the given identity key, or None."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires, value = entry
+        if expires is not None and expires < time.time():
+            self._entries.pop(key, None)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Store a value for the given identity key."""
+
+        if self.ttl is not None:
+            expires = time.time() + self.ttl
+        else:
+            expires = None
+        self._entries[key] = (expires, value)
+
+    def invalidate(self, key):
+        """Remove the entry for the given identity key, if present."""
+
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def invalidate_class(self, class_):
+        """Remove all entries whose identity key refers to the given
+        class, which is the class of the base mapper of an inheritance
+        hierarchy."""
+
+        for key in list(self._entries):
+            if key[0] is class_:
+                self.invalidate(key)
+
+    def clear(self):
+        """Remove all entries and reset statistics."""
+
+        self._entries.clear()
+        self.hits = self.misses = self.expirations = \
+            self.invalidations = 0
+
+    def stats(self):
+        """Return a dictionary of ``hits``, ``misses``, ``hit_rate``,
+        ``expirations``, ``invalidations``, ``evictions``, ``size`` and
+        ``capacity`` for this cache."""
+
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": total and float(self.hits) / total or 0.0,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "evictions": self._entries.evictions,
+            "size": len(self._entries),
+            "capacity": self._entries.capacity
+        }
+
+
+class _CountingLRUCache(util.LRUCache):
+    def __init__(self, capacity, threshold):
+        super(_CountingLRUCache, self).__init__(capacity, threshold)
+        self.evictions = 0
+
+    def pop(self, key, default=None):
+        item = dict.pop(self, key, None)
+        if item is None:
+            return default
+        return item[1]
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.evictions += 1
+
+    def clear(self):
+        dict.clear(self)
+        self.evictions = 0
+
+
+def _cache_for(mapper):
+    return mapper.base_mapper.second_level_cache
+
+
+def get_instance(session, mapper, key):
+    """Produce an instance for the given identity key from the second
+    level cache of the given mapper, or return None."""
+
+    cache = _cache_for(mapper)
+    value = cache.get(key)
+    if value is None:
+        return None
+
+    class_, values = value
+    if not issubclass(class_, mapper.class_):
+        return None
+
+    # may have been produced by an autoflush or a lazy load
+    # elsewhere in the meantime
+    instance = session.identity_map.get(key)
+    if instance is not None:
+        return instance
+
+    manager = attributes.manager_of_class(class_)
+    submapper = manager.mapper
+    instance = manager.new_instance()
+    state = attributes.instance_state(instance)
+    dict_ = attributes.instance_dict(instance)
+    state.key = key
+    state.session_id = session.hash_key
+    session.identity_map._add_unpresent(state, key)
+
+    dict_.update(values)
+    for prop in submapper.column_attrs:
+        if not prop.deferred and prop.key not in values:
+            state.expired_attributes.add(prop.key)
+    state._commit_all(dict_, session.identity_map)
+    if manager.dispatch.load:
+        manager.dispatch.load(state, None)
+    return instance
+
+
+def set_instance(session, mapper, instance):
+    """Store the column values of the given instance, which was just
+    loaded, in the second level cache of the given mapper."""
+
+    if session in _flushed:
+        return
+    state = attributes.instance_state(instance)
+    if state.key is None or state.modified:
+        return
+    cache = _cache_for(mapper)
+    began = _began.get(session)
+    if began is not None and began < max(
+            _invalidated.get((cache, state.key), 0),
+            _invalidated.get((cache, state.key[0]), 0)):
+        return
+    dict_ = state.dict
+    expired = state.expired_attributes
+    values = dict(
+        (prop.key, dict_[prop.key])
+        for prop in state.manager.mapper.column_attrs
+        if prop.key in dict_ and prop.key not in expired
+    )
+    cache.set(state.key, (state.class_, values))
+
+
+# sessions which have flushed changes to cached mappings in their current
+# transaction, along with the invalidations to repeat once the
+# transaction ends; a concurrent load in another Session may have
+# re-populated the entries from the not-yet-changed rows in the meantime.
+_flushed = weakref.WeakKeyDictionary()
+
+# generation at which the current transaction of each Session acquired
+# its first connection, and the generation at which each identity key or
+# class was last invalidated, per cache.  A Session doesn't populate
+# entries invalidated since its transaction began, as the rows it reads
+# may predate the change.
+_generation = util.counter()
+_began = weakref.WeakKeyDictionary()
+_invalidated = {}
+_began_mutex = util.threading.Lock()
+
+
+def _invalidate_entries(cache, key, class_):
+    if key is not None:
+        cache.invalidate(key)
+    else:
+        cache.invalidate_class(class_)
+    _invalidated[(cache, key if key is not None else class_)] = \
+        _generation()
+
+
+def _invalidate(session, cache, key, class_):
+    _invalidate_entries(cache, key, class_)
+    _flushed.setdefault(session, set()).add((cache, key, class_))
+
+
+def _after_begin(session, transaction, connection):
+    if session not in _began:
+        with _began_mutex:
+            _began[session] = _generation()
+
+
+def _transaction_ended(session, transaction):
+    if transaction._parent is not None:
+        return
+    for cache, key, class_ in _flushed.pop(session, ()):
+        _invalidate_entries(cache, key, class_)
+
+    with _began_mutex:
+        _began.pop(session, None)
+
+        # invalidations older than every transaction in progress are
+        # no longer needed
+        if len(_invalidated) > 1000:
+            oldest = min(list(_began.values()) + [_generation()])
+            for entry, generation in list(_invalidated.items()):
+                if generation < oldest:
+                    _invalidated.pop(entry, None)
+
+
+def _after_flush(session, flush_context):
+    for state in flush_context.states:
+        if state.key is None:
+            continue
+        cache = _cache_for(state.manager.mapper)
+        if cache is not None:
+            _invalidate(session, cache, state.key, None)
+
+
+@util.dependencies("sqlalchemy.orm.mapperlib")
+def _after_bulk_operation(mapperlib, update_context):
+    session = update_context.session
+    if update_context.mapper is not None:
+        invalidate_mapper(session, update_context.mapper)
+        return
+
+    # a Query against a Table; invalidate each mapping of that table
+    table = update_context.primary_table
+    for mapper in set(
+            mapper.base_mapper
+            for mapper in list(mapperlib._mapper_registry)
+            if table in mapper.tables):
+        invalidate_mapper(session, mapper)
+
+
+def invalidate_mapper(session, mapper):
+    """Invalidate all second level cache entries for the given mapper's
+    inheritance hierarchy, on behalf of a bulk operation in the given
+    :class:`.Session`."""
+
+    cache = _cache_for(mapper)
+    if cache is not None:
+        _invalidate(session, cache, None, mapper.base_mapper.class_)
+
+
+_events_installed = False
+
+
+@util.dependencies("sqlalchemy.orm.session")
+def _install_events(sessionlib):
+    global _events_installed
+    if _events_installed:
+        return
+    _events_installed = True
+
+    Session = sessionlib.Session
+    event.listen(Session, "after_begin", _after_begin)
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "after_bulk_update", _after_bulk_operation)
+    event.listen(Session, "after_bulk_delete", _after_bulk_operation)
+    event.listen(Session, "after_transaction_end", _transaction_ended)
@@ -15,14 +15,17 @@ as well as some of the attribute loading strategies.
 from __future__ import absolute_import
 
 from .. import util
-from . import attributes, exc as orm_exc
+from . import attributes, exc as orm_exc, cache as _cache
+from .. import sql
 from ..sql import util as sql_util
 from . import strategy_options
+from . import path_registry
 
 from .util import _none_set, state_str
 from .base import _SET_DEFERRED_EXPIRED, _DEFER_FOR_STATE
 from .. import exc as sa_exc
 import collections
+import weakref
 
 _new_runid = util.counter()
 
@@ -76,6 +79,9 @@ def instances(query, cursor, context):
             if filtered:
                 rows = util.unique_list(rows, filter_fn)
 
+            for path, post_load in context.post_load_paths.items():
+                post_load.invoke(context, path)
+
             for row in rows:
                 yield row
 
@@ -168,6 +174,18 @@ def load_on_ident(query, key,
     else:
         ident = None
 
+    use_cache = False
+    if ident is not None and refresh_state is None and \
+            only_load_props is None and lockmode is None and \
+            query._for_update_arg is None and \
+            not query._populate_existing:
+        mapper = query._mapper_zero()
+        if mapper.base_mapper.second_level_cache is not None:
+            instance = _cache.get_instance(query.session, mapper, key)
+            if instance is not None:
+                return instance
+            use_cache = True
+
     if refresh_state is None:
         q = query._clone()
         q._get_condition()
@@ -216,10 +234,213 @@ def load_on_ident(query, key,
     q._order_by = None
 
     try:
-        return q.one()
+        instance = q.one()
     except orm_exc.NoResultFound:
         return None
 
+    if use_cache:
+        _cache.set_instance(query.session, mapper, instance)
+    return instance
+
+
+def load_on_identities(query, keys, chunksize=500):
+    """Load the given identity keys, returning a list of instances in
+    the same order, with None for those which don't exist.
+
+    As with :func:`.load_on_ident` via :meth:`.Query.get`, the identity
+    map and second level cache are consulted first; the remaining keys,
+    along with those of expired instances, are loaded using IN against
+    the primary key, ``chunksize`` keys at a time.
+
+    """
+    session = query.session
+    mapper = query._mapper_zero()
+
+    use_identity_map = not query._populate_existing and \
+        not mapper.always_refresh and \
+        query._for_update_arg is None
+    use_cache = use_identity_map and \
+        mapper.base_mapper.second_level_cache is not None
+
+    found = {}
+    expired = {}
+    to_load = util.OrderedSet()
+    for key in keys:
+        if key in found or key in to_load:
+            continue
+
+        if use_identity_map:
+            instance = session.identity_map.get(key)
+            if instance is not None:
+                # reject calls for id in identity map but class
+                # mismatch.
+                if not issubclass(instance.__class__, mapper.class_):
+                    found[key] = None
+                    continue
+                state = attributes.instance_state(instance)
+                if not state.expired:
+                    found[key] = instance
+                    continue
+                # expired - loading the row refreshes it, else it
+                # no longer exists
+                expired[key] = state
+            elif use_cache:
+                instance = _cache.get_instance(session, mapper, key)
+                if instance is not None:
+                    found[key] = instance
+                    continue
+
+        if None in key[1]:
+            # NULL in the primary key can't be matched using IN
+            found[key] = load_on_ident(query, key)
+        else:
+            to_load.add(key)
+
+    for instance in _load_on_pk_identities(
+            query, [key[1] for key in to_load], chunksize):
+        state = attributes.instance_state(instance)
+        found[state.key] = instance
+        if use_cache and state.key not in expired:
+            _cache.set_instance(session, mapper, instance)
+
+    deleted = [
+        state for key, state in expired.items() if found.get(key) is None]
+    if deleted:
+        session._remove_newly_deleted(deleted)
+
+    return [found.get(key) for key in keys]
+
+
+def load_expired_attributes(query, states, attribute_names=None,
+                            chunksize=500):
+    """Load the expired attributes of the given persistent states using
+    IN against the primary key, ``chunksize`` states at a time, returning
+    the list of states for which no row was found.
+
+    ``attribute_names`` limits the columns selected to those given, along
+    with the primary key; only attributes which are unloaded are
+    populated, as is the case when a :class:`.Query` returns a row for an
+    instance that's already present in the :class:`.Session`.
+
+    """
+    mapper = query._mapper_zero()
+
+    # as with load_on_ident(), pending changes aren't flushed
+    q = query.autoflush(False)
+    if attribute_names:
+        q._get_options(only_load_props=set(attribute_names).union(
+            mapper._columntoproperty[col].key
+            for col in mapper.primary_key))
+
+    loaded = set()
+    for instance in _load_on_pk_identities(
+            q, [state.key[1] for state in states], chunksize):
+        loaded.add(attributes.instance_state(instance))
+
+    return [state for state in states if state not in loaded]
+
+
+def _expired_siblings(mapper, state, attribute_names, limit):
+    """Return up to ``limit`` states of the given mapper loaded in the
+    same result as the given state, which have any of the given
+    attributes expired."""
+
+    if state._lazy_batch is None:
+        return []
+
+    siblings = []
+    for ref in state._lazy_batch.states:
+        if len(siblings) >= limit:
+            break
+        other = ref()
+        if other is not None and \
+                other is not state and \
+                other.manager.mapper is mapper and \
+                other.session_id == state.session_id and \
+                other.key is not None and \
+                None not in other.key[1] and \
+                not other.expired_attributes.isdisjoint(attribute_names):
+            siblings.append(other)
+    return siblings
+
+
+def _load_on_pk_identities(query, primary_key_identities, chunksize):
+    """Run the given :class:`.Query` restricted to chunks of the given
+    primary key identities using IN, yielding the instances loaded."""
+
+    mapper = query._mapper_zero()
+    pk_cols = mapper.primary_key
+
+    q = query._clone()
+    q._get_condition()
+    q._order_by = None
+    if len(pk_cols) == 1:
+        q = q.filter(
+            pk_cols[0].in_(sql.bindparam('primary_keys', expanding=True)))
+
+    primary_key_identities = list(primary_key_identities)
+    while primary_key_identities:
+        chunk = primary_key_identities[0:chunksize]
+        primary_key_identities = primary_key_identities[chunksize:]
+
+        if len(pk_cols) == 1:
+            chunk_q = q.params(primary_keys=[ident[0] for ident in chunk])
+        else:
+            chunk_q = q.filter(sql.tuple_(*pk_cols).in_(chunk))
+
+        for instance in chunk_q:
+            yield instance
+
+
+class _LazyLoadBatch(object):
+    """The instances loaded by a single result, for use by lazy loaders
+    configured with :paramref:`.relationship.lazy_batch_size`, by
+    batched deferred column loaders and by the load of expired
+    attributes when :paramref:`.Session.expired_batch_size` is set."""
+
+    __slots__ = 'states', 'cursors', '_compact_at'
+
+    def __init__(self):
+        self.states = []
+        self.cursors = {}
+        self._compact_at = 64
+
+    def add_state(self, state, dict_, row):
+        if state._lazy_batch is not self:
+            state._lazy_batch = self
+            if len(self.states) >= self._compact_at:
+                self._compact()
+            self.states.append(weakref.ref(state))
+
+    def _compact(self):
+        # drop the instances which have been garbage collected, such
+        # as those of a yield_per() result which were already consumed
+        self.states = [ref for ref in self.states if ref() is not None]
+        self.cursors.clear()
+        self._compact_at = max(64, len(self.states) * 2)
+
+    def unloaded(self, key, is_loaded):
+        """Iterate the live states for which ``is_loaded(state)`` is
+        false.
+
+        States ahead of the first such state are skipped by later scans
+        for the same ``key``, so that loading the batch a piece at a
+        time doesn't rescan those loaded already.
+
+        """
+        states = self.states
+        idx = self.cursors.get(key, 0)
+        advance = True
+        while idx < len(states):
+            state = states[idx]()
+            idx += 1
+            if state is None or is_loaded(state):
+                if advance:
+                    self.cursors[key] = idx
+            else:
+                advance = False
+                yield state
+
 
 def _setup_entity_query(
     context, mapper, query_entity,
@@ -297,6 +518,13 @@ def _instance_processor(
     quick_populators = path.get(
         context.attributes, "memoized_setups", _none_set)
 
+    populate_existing = context.populate_existing or mapper.always_refresh
+
+    generate = context.query._execution_options.get(
+        "generate_row_processors", False) and \
+        not refresh_state and not populate_existing
+    quick_cols = []
+
     for prop in props:
         if prop in quick_populators:
             # this is an inlined path just for column-based attributes.
@@ -315,6 +543,8 @@ def _instance_processor(
                 getter = result._getter(col)
                 if getter:
                     populators["quick"].append((prop.key, getter))
+                    if generate:
+                        quick_cols.append((prop.key, col))
                 else:
                     # fall back to the ColumnProperty itself, which
                     # will iterate through all of its columns
@@ -325,14 +555,22 @@ def _instance_processor(
             prop.create_row_processor(
                 context, path, mapper, result, adapter, populators)
 
+    if context.session.expired_batch_size and not refresh_state and \
+            path.get(context.attributes, "lazy_batch") is None:
+        # track the instances loaded by this result, so that the load
+        # of expired attributes on one of them can load its siblings
+        batch = _LazyLoadBatch()
+        path.set(context.attributes, "lazy_batch", batch)
+        populators["new"].append((None, batch.add_state))
+
     propagate_options = context.propagate_options
-    if propagate_options:
-        load_path = context.query._current_path + path \
-            if context.query._current_path.path else path
+    load_path = context.query._current_path + path \
+        if context.query._current_path.path else path
 
     session_identity_map = context.session.identity_map
 
-    populate_existing = context.populate_existing or mapper.always_refresh
+    post_load = PostLoad.for_context(context, load_path, only_load_props)
+
     load_evt = bool(mapper.class_manager.dispatch.load)
     refresh_evt = bool(mapper.class_manager.dispatch.refresh)
     instance_state = attributes.instance_state
@@ -440,6 +678,9 @@ def _instance_processor(
                     else:
                         state._commit_all(dict_, session_identity_map)
 
+                if post_load:
+                    post_load.add_state(state, True)
+
         else:
             # partial population routines, for objects that were already
             # in the Session, but a row matches them; apply eager loaders
@@ -463,8 +704,18 @@ def _instance_processor(
 
                     state._commit(dict_, to_load)
 
+            if post_load and context.invoke_all_eagers:
+                post_load.add_state(state, False)
+
         return instance
 
+    if generate:
+        generated = _generated_instance_processor(
+            mapper, context, result, pk_cols, populators, quick_cols,
+            load_path, post_load, _instance)
+        if generated is not None:
+            _instance = generated
+
     if mapper.polymorphic_map and not _polymorphic_from and not refresh_state:
         # if we are doing polymorphic, dispatch to a different _instance()
         # method specific to the subclass mapper
@@ -475,6 +726,172 @@ def _instance_processor(
     return _instance
 
 
+def _generated_instance_processor(
+        mapper, context, result, pk_cols, populators, quick_cols,
+        load_path, post_load, fallback):
+    """Produce a row processor for the given mapper which is generated as
+    Python source specific to the result columns and populators in use.
+
+    The generated function handles rows which produce a new instance,
+    with column-based attributes populated inline from the row; rows
+    which match an instance that's already in the identity map are passed
+    to the ``fallback`` processor.  The code is cached on the mapper,
+    keyed on the structure of the load, so that it's generated once
+    for each distinct combination of columns and loader options.
+
+    Returns None if the load can't be handled by generated code.
+
+    """
+    if len(quick_cols) != len(populators["quick"]):
+        return None
+    pk_indexes = tuple(result._index(col) for col in pk_cols)
+    if None in pk_indexes:
+        return None
+    quick = tuple((key, result._index(col)) for key, col in quick_cols)
+    expire = tuple(
+        key for key, set_callable in populators["expire"] if set_callable)
+
+    key = (
+        pk_indexes, quick, expire,
+        bool(populators["new"]), bool(populators["delayed"]),
+        bool(context.propagate_options),
+        bool(mapper.class_manager.dispatch.load),
+        post_load is not None
+    )
+
+    cache = mapper._generated_row_processors
+    factory = cache.get(key)
+    if factory is None:
+        factory = cache[key] = _generate_instance_factory(*key)
+
+    if mapper.allow_partial_pks:
+        is_not_primary_key = _none_set.issuperset
+    else:
+        is_not_primary_key = _none_set.intersection
+
+    return factory(
+        mapper._identity_class, context.session.identity_map,
+        mapper.class_manager.new_instance,
+        attributes.instance_state, attributes.instance_dict,
+        is_not_primary_key, context.session.hash_key, context.runid,
+        context, context.propagate_options, load_path,
+        populators["new"], populators["delayed"], post_load, fallback)
+
+
+def _generate_instance_factory(
+        pk_indexes, quick, expire, has_new, has_delayed,
+        propagate_options, load_evt, post_load):
+    lines = [
+        "def make_instance_processor(",
+        "        identity_class, identity_map, new_instance,",
+        "        instance_state, instance_dict, is_not_primary_key,",
+        "        session_id, runid, context, load_options, load_path,",
+        "        new_populators, delayed_populators, post_load, fallback):",
+        "    get = identity_map.get",
+        "    add_unpresent = identity_map._add_unpresent",
+        "",
+        "    def _instance(row):",
+        "        identitykey = (identity_class, (%s, ))" % ", ".join(
+            "row[%d]" % index for index in pk_indexes),
+        "        if get(identitykey) is not None:",
+        "            return fallback(row)",
+        "        if is_not_primary_key(identitykey[1]):",
+        "            return None",
+        "        instance = new_instance()",
+        "        dict_ = instance_dict(instance)",
+        "        state = instance_state(instance)",
+        "        state.key = identitykey",
+        "        state.session_id = session_id",
+        "        add_unpresent(state, identitykey)",
+    ]
+    if propagate_options:
+        lines.extend([
+            "        state.load_options = load_options",
+            "        state.load_path = load_path",
+        ])
+    lines.append("        state.runid = runid")
+    lines.extend(
+        "        dict_[%r] = row[%d]" % (key, index) for key, index in quick)
+    if expire:
+        lines.append("        expired_attributes = state.expired_attributes")
+        lines.extend(
+            "        expired_attributes.add(%r)" % key for key in expire)
+    if has_new:
+        lines.extend([
+            "        for key, populator in new_populators:",
+            "            populator(state, dict_, row)",
+        ])
+    if has_delayed:
+        lines.extend([
+            "        for key, populator in delayed_populators:",
+            "            populator(state, dict_, row)",
+        ])
+    if load_evt:
+        lines.append("        state.manager.dispatch.load(state, context)")
+    lines.extend([
+        "        if state.modified:",
+        "            state._commit_all(dict_, identity_map)",
+    ])
+    if post_load:
+        lines.append("        post_load.add_state(state, True)")
+    lines.extend([
+        "        return instance",
+        "    return _instance",
+        ""
+    ])
+    return util.langhelpers._exec_code_in_env(
+        "\n".join(lines), {}, "make_instance_processor")
+
+
+class PostLoad(object):
+    """Track loaders and states for "post load" operations, which are
+    invoked for each batch of rows once all of the batch's instances have
+    been populated.
+
+    """
+    __slots__ = 'loaders', 'states', 'load_keys'
+
+    def __init__(self):
+        self.loaders = {}
+        self.states = util.OrderedDict()
+        self.load_keys = None
+
+    def add_state(self, state, overwrite):
+        self.states[state] = overwrite
+
+    def invoke(self, context, path):
+        if not self.states:
+            return
+        path = path_registry.PathRegistry.coerce(path)
+        for token, limit_to_mapper, loader, arg, kw in \
+                list(self.loaders.values()):
+            states = [
+                (state, overwrite)
+                for state, overwrite in self.states.items()
+                if state.manager.mapper.isa(limit_to_mapper)
+            ]
+            if states:
+                loader(context, path, states, self.load_keys, *arg, **kw)
+        self.states.clear()
+
+    @classmethod
+    def for_context(cls, context, path, only_load_props):
+        pl = context.post_load_paths.get(path.path)
+        if pl is not None and only_load_props:
+            pl.load_keys = only_load_props
+        return pl
+
+    @classmethod
+    def callable_for_path(
+            cls, context, path, limit_to_mapper, token,
+            loader_callable, *arg, **kw):
+        if path.path in context.post_load_paths:
+            pl = context.post_load_paths[path.path]
+        else:
+            pl = context.post_load_paths[path.path] = PostLoad()
+        pl.loaders[token] = (token, limit_to_mapper, loader_callable, arg, kw)
+
+
 def _populate_full(
         context, row, state, dict_, isnew,
         loaded_instance, populate_existing, populators):
@@ -657,11 +1074,29 @@ def load_scalar_attributes(mapper, state, attribute_names):
                 state_str(state))
             return
 
-        result = load_on_ident(
-            session.query(mapper),
-            identity_key,
-            refresh_state=state,
-            only_load_props=attribute_names)
+        batch_size = session.expired_batch_size
+        siblings = None
+        if has_key and batch_size and batch_size > 1 and \
+                None not in identity_key[1]:
+            siblings = _expired_siblings(
+                mapper, state, attribute_names, batch_size - 1)
+
+        if siblings:
+            # siblings whose row is missing remain expired, raising
+            # ObjectDeletedError when accessed as they would otherwise
+            missing = load_expired_attributes(
+                session.query(mapper), [state] + siblings,
+                attribute_names, chunksize=batch_size)
+            if state in missing:
+                result = None
+            else:
+                result = state.obj()
+        else:
+            result = load_on_ident(
+                session.query(mapper),
+                identity_key,
+                refresh_state=state,
+                only_load_props=attribute_names)
 
     # if instance is pending, a refresh operation
     # may not complete (even if PK attributes are assigned)
@@ -24,6 +24,7 @@ from collections import deque
 from .. import sql, util, log, exc as sa_exc, event, schema, inspection
 from ..sql import expression, visitors, operators, util as sql_util
 from . import instrumentation, attributes, exc as orm_exc, loading
+from . import cache as _cache
 from . import properties
 from . import util as orm_util
 from .interfaces import MapperProperty, InspectionAttr, _MappedAttribute
@@ -115,6 +116,7 @@ class Mapper(InspectionAttr):
                  confirm_deleted_rows=True,
                  eager_defaults=False,
                  legacy_is_orphan=False,
+                 second_level_cache=None,
                  _compiled_cache_size=100,
                  ):
         """Return a new :class:`~.Mapper` object.
@@ -459,6 +461,19 @@ class Mapper(InspectionAttr):
            This is normally simply the primary key of the ``local_table``, but
            can be overridden here.
 
+        :param second_level_cache: A :class:`.SecondLevelCache` which
+           is consulted by :meth:`.Query.get` and by many-to-one lazy
+           loads against the primary key of this mapper, before SQL is
+           emitted, when the object isn't present in the identity map.
+           May only be set on the base mapper of an inheritance
+           hierarchy; inheriting mappers share the same cache.
+
+           .. versionadded:: 1.0.7
+
+           .. seealso::
+
+                :class:`.SecondLevelCache`
+
         :param version_id_col: A :class:`.Column`
            that will be used to keep a running version id of rows
            in the table.  This is used to detect concurrent updates or
@@ -568,6 +583,9 @@ class Mapper(InspectionAttr):
         self._reconstructor = None
         self._deprecated_extensions = util.to_list(extension or [])
         self.allow_partial_pks = allow_partial_pks
+        self.second_level_cache = second_level_cache
+        if second_level_cache is not None:
+            _cache._install_events()
 
         if self.inherits and not self.concrete:
             self.confirm_deleted_rows = False
@@ -902,6 +920,12 @@ class Mapper(InspectionAttr):
                 raise sa_exc.ArgumentError(
                     "Class '%s' does not inherit from '%s'" %
                     (self.class_.__name__, self.inherits.class_.__name__))
+            if self.second_level_cache is not None:
+                raise sa_exc.ArgumentError(
+                    "second_level_cache may only be configured on the "
+                    "base mapper of an inheritance hierarchy; mapper for "
+                    "class '%s' inherits from '%s'" %
+                    (self.class_.__name__, self.inherits.class_.__name__))
             if self.non_primary != self.inherits.non_primary:
                 np = not self.non_primary and "primary" or "non-primary"
                 raise sa_exc.ArgumentError(
@@ -2569,6 +2593,10 @@ class Mapper(InspectionAttr):
     def _compiled_cache(self):
         return util.LRUCache(self._compiled_cache_size)
 
+    @_memoized_configured_property
+    def _generated_row_processors(self):
+        return util.LRUCache(self._compiled_cache_size)
+
     @_memoized_configured_property
     def _sorted_tables(self):
         table_to_mapper = {}
@@ -25,12 +25,13 @@ from . import loading
 
 
 def _bulk_insert(
-        mapper, mappings, session_transaction, isstates, return_defaults):
+        mapper, mappings, session_transaction, isstates, return_defaults,
+        connection=None):
     base_mapper = mapper.base_mapper
 
     cached_connections = _cached_connection_dict(base_mapper)
 
-    if session_transaction.session.connection_callable:
+    if connection is None and session_transaction.session.connection_callable:
         raise NotImplementedError(
             "connection_callable / per-instance sharding "
             "not supported in bulk_insert()")
@@ -44,7 +45,8 @@ def _bulk_insert(
     else:
         mappings = list(mappings)
 
-    connection = session_transaction.connection(base_mapper)
+    if connection is None:
+        connection = session_transaction.connection(base_mapper)
     for table, super_mapper in base_mapper._sorted_tables.items():
         if not mapper.isa(super_mapper):
             continue
@@ -77,7 +79,7 @@ def _bulk_insert(
 
 
 def _bulk_update(mapper, mappings, session_transaction,
-                 isstates, update_changed_only):
+                 isstates, update_changed_only, connection=None):
     base_mapper = mapper.base_mapper
 
     cached_connections = _cached_connection_dict(base_mapper)
@@ -97,12 +99,13 @@ def _bulk_update(mapper, mappings, session_transaction,
     else:
         mappings = list(mappings)
 
-    if session_transaction.session.connection_callable:
-        raise NotImplementedError(
-            "connection_callable / per-instance sharding "
-            "not supported in bulk_update()")
+    if connection is None:
+        if session_transaction.session.connection_callable:
+            raise NotImplementedError(
+                "connection_callable / per-instance sharding "
+                "not supported in bulk_update()")
 
-    connection = session_transaction.connection(base_mapper)
+        connection = session_transaction.connection(base_mapper)
 
     for table, super_mapper in base_mapper._sorted_tables.items():
         if not mapper.isa(super_mapper):
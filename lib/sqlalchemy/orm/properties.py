@@ -35,7 +35,7 @@ class ColumnProperty(StrategizedProperty):
     strategy_wildcard_key = 'column'
 
     __slots__ = (
-        '_orig_columns', 'columns', 'group', 'deferred',
+        '_orig_columns', 'columns', 'group', 'deferred', 'batch',
         'instrument', 'comparator_factory', 'descriptor', 'extension',
         'active_history', 'expire_on_flush', 'info', 'doc',
         'strategy_class', '_creation_order', '_is_polymorphic_discriminator',
@@ -73,6 +73,15 @@ class ColumnProperty(StrategizedProperty):
            :class:`.ColumnProperty.Comparator` which provides custom SQL
            clause generation for comparison operations.
 
+        :param batch=False:
+              when True along with ``deferred``, the load of the attribute
+              on an instance also loads it for all other instances that
+              were loaded by the same :class:`.Query` result and haven't
+              yet loaded it, using IN against the primary key.  See also
+              :func:`~sqlalchemy.orm.defer`.
+
+              .. versionadded:: 1.0.7
+
         :param group:
             a group name for this property when marked as deferred.
 
@@ -122,6 +131,7 @@ class ColumnProperty(StrategizedProperty):
                         for c in columns]
         self.group = kwargs.pop('group', None)
         self.deferred = kwargs.pop('deferred', False)
+        self.batch = kwargs.pop('batch', False)
         self.instrument = kwargs.pop('_instrument', True)
         self.comparator_factory = kwargs.pop('comparator_factory',
                                              self.__class__.Comparator)
@@ -163,6 +173,13 @@ class ColumnProperty(StrategizedProperty):
             self.parent.class_manager,
             strategies.LoadDeferredColumns(self.key), self.key)
 
+    @util.dependencies("sqlalchemy.orm.state", "sqlalchemy.orm.strategies")
+    def _memoized_attr__deferred_batch_column_loader(
+            self, state, strategies):
+        return state.InstanceState._instance_level_callable_processor(
+            self.parent.class_manager,
+            strategies.LoadDeferredColumns(self.key, batch=True), self.key)
+
     @property
     def expression(self):
         """Return the primary column or expression for this ColumnProperty.
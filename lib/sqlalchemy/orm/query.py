@@ -19,11 +19,12 @@ database to return iterable result sets.
 
 """
 
+import copy
 from itertools import chain
 
 from . import (
     attributes, interfaces, object_mapper, persistence,
-    exc as orm_exc, loading
+    exc as orm_exc, loading, strategy_options
 )
 from .base import _entity_descriptor, _is_aliased_class, \
     _is_mapped_class, _orm_columns, _generative, InspectionAttr
@@ -35,9 +36,11 @@ from .. import sql, util, log, exc as sa_exc, inspect, inspection
 from ..sql.expression import _interpret_as_from
 from ..sql import (
     util as sql_util,
-    expression, visitors
+    expression, visitors, operators
 )
 from ..sql.base import ColumnCollection
+from ..sql.elements import _NoCacheKey, _cache_key, _label_reference, \
+    _textual_label_reference
 from . import properties
 
 __all__ = ['Query', 'QueryContext', 'aliased']
@@ -709,11 +712,25 @@ class Query(object):
         (e.g. approximately 1000) is used, even with DBAPIs that buffer
         rows (which are most).
 
-        The :meth:`.Query.yield_per` method **is not compatible with most
-        eager loading schemes, including subqueryload and joinedload with
-        collections**.  For this reason, it may be helpful to disable
-        eager loads, either unconditionally with
-        :meth:`.Query.enable_eagerloads`::
+        Collections which are configured for joined or subquery eager
+        loading, either on the mapping or using :func:`.joinedload` or
+        :func:`.subqueryload`, are loaded using "selectin" eager loading
+        when :meth:`.Query.yield_per` is in effect; after each batch of
+        ``count`` rows is fetched, one additional SELECT loads the
+        collections of that batch's instances using IN against their
+        primary keys, as is the case for :func:`.selectinload`.  The
+        collections of each batch are therefore fully populated while
+        memory use remains proportional to ``count``.  Joined eager
+        loading of many-to-one and other scalar references proceeds as
+        usual.  Collections established using :func:`.contains_eager`
+        aren't compatible with :meth:`.Query.yield_per`.
+
+        .. versionchanged:: 1.0.7 joined and subquery eager loading of
+           collections is performed using "selectin" loading of each batch
+           when :meth:`.Query.yield_per` is used, rather than raising.
+
+        It may still be helpful to disable eager loads, either
+        unconditionally with :meth:`.Query.enable_eagerloads`::
 
             q = sess.query(Object).yield_per(100).enable_eagerloads(False)
 
@@ -729,14 +746,6 @@ class Query(object):
             present in more than one batch of rows, end-user changes
             to attributes will be overwritten.
 
-            In particular, it's usually impossible to use this setting
-            with eagerly loaded collections (i.e. any lazy='joined' or
-            'subquery') since those collections will be cleared for a
-            new load when encountered in a subsequent result batch.
-            In the case of 'subquery' loading, the full result for all
-            rows is fetched which generally defeats the purpose of
-            :meth:`~sqlalchemy.orm.query.Query.yield_per`.
-
             Also note that while
             :meth:`~sqlalchemy.orm.query.Query.yield_per` will set the
             ``stream_results`` execution option to True, currently
@@ -818,22 +827,33 @@ class Query(object):
         """
         return self._get_impl(ident, loading.load_on_ident)
 
-    def _get_impl(self, ident, fallback_fn):
+    def _identity_key_from_ident(self, mapper, ident, meth):
         # convert composite types to individual args
         if hasattr(ident, '__composite_values__'):
             ident = ident.__composite_values__()
 
         ident = util.to_list(ident)
 
-        mapper = self._only_full_mapper_zero("get")
-
         if len(ident) != len(mapper.primary_key):
             raise sa_exc.InvalidRequestError(
                 "Incorrect number of values in identifier to formulate "
-                "primary key for query.get(); primary key columns are %s" %
-                ','.join("'%s'" % c for c in mapper.primary_key))
+                "primary key for query.%s(); primary key columns are %s" %
+                (meth, ','.join("'%s'" % c for c in mapper.primary_key)))
+
+        return mapper.identity_key_from_primary_key(ident)
 
-        key = mapper.identity_key_from_primary_key(ident)
+    def _get_many_impl(self, idents, chunksize):
+        mapper = self._only_full_mapper_zero("get_many")
+        keys = [
+            self._identity_key_from_ident(mapper, ident, "get_many")
+            for ident in idents
+        ]
+        self._get_existing_condition()
+        return loading.load_on_identities(self, keys, chunksize)
+
+    def _get_impl(self, ident, fallback_fn):
+        mapper = self._only_full_mapper_zero("get")
+        key = self._identity_key_from_ident(mapper, ident, "get")
 
         if not self._populate_existing and \
                 not mapper.always_refresh and \
@@ -1188,6 +1208,12 @@ class Query(object):
         automatically if the :meth:`~sqlalchemy.orm.query.Query.yield_per()`
         method is used.
 
+        The ORM additionally accepts the ``generate_row_processors``
+        option; when set to True, rows which produce new instances are
+        processed by a function generated specifically for the columns and
+        loader options of the query, rather than by the generic row
+        processor.  The generated code is cached per mapper.
+
         """
         self._execution_options = self._execution_options.union(kwargs)
 
@@ -2318,6 +2344,150 @@ class Query(object):
         """
         self._offset = offset
 
+    def seek(self, bookmark, row_comparison=True):
+        """Limit the results of this :class:`.Query` to those rows which
+        follow the given bookmark in its ORDER BY, for "keyset" or "seek"
+        pagination.
+
+        The ORDER BY of the :class:`.Query` must be composed of column
+        expressions which together are unique and not NULL, each in
+        ascending or descending order; ``bookmark`` is a tuple of the
+        values of these expressions for the last row of the previous
+        page::
+
+            q = session.query(User).order_by(User.name, User.id)
+            page = q.seek(("ed", 8)).limit(20).all()
+
+        Above, the criterion ``(users.name, users.id) > (:name, :id)`` is
+        applied.  Unlike :meth:`.Query.offset`, the database can locate the
+        first row of the page using an index of the ordering columns,
+        without reading each of the rows which precede it.
+
+        :param bookmark: tuple of values, one for each ORDER BY
+         expression.
+
+        :param row_comparison: when True, the default, a row value
+         comparison is rendered if each expression is ordered in the
+         same direction.  When False, or if the directions are mixed, the
+         equivalent form ``name > :name OR (name = :name AND id > :id)``
+         is rendered instead, for backends which don't support row value
+         comparisons, such as SQL Server.
+
+        .. versionadded:: 1.0.7
+
+        .. seealso::
+
+            :meth:`.Query.keyset_pages`
+
+        """
+        order = self._keyset_order()
+        if len(bookmark) != len(order):
+            raise sa_exc.ArgumentError(
+                "Bookmark %r has %d values; ORDER BY of this Query has %d "
+                "expressions" % (bookmark, len(bookmark), len(order)))
+
+        descending = set(desc for col, desc in order)
+        if row_comparison and len(order) > 1 and len(descending) == 1:
+            cols = sql.tuple_(*[col for col, desc in order])
+            if descending.pop():
+                criterion = cols < tuple(bookmark)
+            else:
+                criterion = cols > tuple(bookmark)
+        else:
+            clauses = []
+            for idx, (col, desc) in enumerate(order):
+                equal = [
+                    order[prev][0] == bookmark[prev] for prev in range(idx)
+                ]
+                if desc:
+                    clauses.append(sql.and_(*equal + [col < bookmark[idx]]))
+                else:
+                    clauses.append(sql.and_(*equal + [col > bookmark[idx]]))
+            criterion = sql.or_(*clauses)
+        return self.filter(criterion)
+
+    def keyset_pages(self, page_size, bookmark=None, row_comparison=True):
+        """Iterate through the results of this :class:`.Query` in pages of
+        the given size, using :meth:`.Query.seek` to locate each page.
+
+        Yields tuples of ``(page, bookmark)``, where ``page`` is a list of
+        results and ``bookmark`` is the tuple of ORDER BY values of its
+        last row; a bookmark may be retained, such as in a URL, and passed
+        as the ``bookmark`` argument to resume after that page::
+
+            q = session.query(User).order_by(User.name, User.id)
+            for page, bookmark in q.keyset_pages(100):
+                render(page, next_page=bookmark)
+
+        Each page is loaded by a separate SELECT with a LIMIT of
+        ``page_size``, which also selects the ORDER BY expressions.  The
+        same requirements as those of :meth:`.Query.seek` apply to the
+        ORDER BY of the :class:`.Query`, which may not itself have a LIMIT
+        or OFFSET.
+
+        .. versionadded:: 1.0.7
+
+        """
+        if self._limit is not None or self._offset is not None:
+            raise sa_exc.InvalidRequestError(
+                "Keyset pagination can't be used on a Query which has "
+                "LIMIT or OFFSET applied")
+        return self._keyset_pages(
+            self._keyset_order(), page_size, bookmark, row_comparison)
+
+    def _keyset_pages(self, order, page_size, bookmark, row_comparison):
+        labels = [col.label(None) for col, desc in order]
+        num_entities = len(self._entities)
+        single_entity = num_entities == 1 and \
+            self._entities[0].supports_single_entity
+
+        while True:
+            q = self
+            if bookmark is not None:
+                q = q.seek(bookmark, row_comparison)
+            rows = q.add_columns(*labels).limit(page_size).all()
+            if not rows:
+                return
+
+            bookmark = tuple(rows[-1][num_entities:])
+            if single_entity:
+                page = [row[0] for row in rows]
+            else:
+                keyed_tuple = util.lightweight_named_tuple(
+                    'result', rows[0]._real_fields[:num_entities])
+                page = [keyed_tuple(row[:num_entities]) for row in rows]
+            yield page, bookmark
+
+            if len(rows) < page_size:
+                return
+
+    def _keyset_order(self):
+        if not self._order_by:
+            raise sa_exc.InvalidRequestError(
+                "Keyset pagination requires that the Query have an "
+                "ORDER BY of unique columns")
+
+        order = []
+        for elem in self._order_by:
+            desc = False
+            if isinstance(elem, expression.UnaryExpression) and \
+                    elem.modifier in (operators.desc_op, operators.asc_op):
+                desc = elem.modifier is operators.desc_op
+                elem = elem.element
+            if isinstance(elem, expression.Label):
+                elem = elem.element
+            if not isinstance(elem, expression.ColumnElement) or \
+                    isinstance(elem, (
+                        _label_reference, _textual_label_reference)) or \
+                    isinstance(elem, expression.UnaryExpression) and \
+                    elem.modifier is not None:
+                raise sa_exc.InvalidRequestError(
+                    "Keyset pagination requires that each ORDER BY "
+                    "expression be a column expression in ascending or "
+                    "descending order; got %r" % elem)
+            order.append((elem, desc))
+        return order
+
     @_generative(_no_statement_condition)
     def distinct(self, *criterion):
         """Apply a ``DISTINCT`` to the query and return the newly resulting
@@ -2509,11 +2679,150 @@ class Query(object):
             return None
 
     def __iter__(self):
-        context = self._compile_context()
+        query, context = self, None
+        query_cache = getattr(self.session, 'query_cache', None)
+        if query_cache is not None:
+            context = self._cached_context(query_cache)
+        if context is None:
+            context = self._compile_context()
+        else:
+            query = context.query
         context.statement.use_labels = True
         if self._autoflush and not self._populate_existing:
             self.session._autoflush()
-        return self._execute_and_instances(context)
+        return query._execute_and_instances(context)
+
+    def _generate_cache_key(self):
+        """Return a structural cache key for this :class:`.Query`, along
+        with the list of :class:`.BindParameter` objects within it.
+
+        The key is equal for any two queries which would compile into
+        the same :class:`.QueryContext`, regardless of the values present
+        in their bound parameters; see
+        :meth:`.ClauseElement._generate_cache_key`.  ``None`` is returned
+        if the query can't be cached, such as when it makes use of
+        :meth:`.Query.from_statement`, aliased joins, or options other
+        than loader options.
+
+        """
+        if self._statement is not None or \
+                self._refresh_state is not None or \
+                self._only_load_props or \
+                self._filter_aliases is not None or \
+                self._from_obj_alias is not None or \
+                self._correlate or \
+                self._with_hints or \
+                self.dispatch.before_compile:
+            return None
+
+        for opt in self._with_options:
+            if not isinstance(opt, strategy_options.Load):
+                return None
+
+        attrs = []
+        for key, value in self._attributes.items():
+            if isinstance(value, strategy_options.Load):
+                value = (
+                    value.strategy, value.path.path,
+                    tuple(sorted(value.local_opts.items())),
+                    value.propagate_to_loaders
+                )
+            attrs.append((key, value))
+
+        anon_map = {}
+        bindparams = []
+        try:
+            key = (
+                self.__class__,
+                tuple(
+                    entity._gen_cache_key(anon_map, bindparams)
+                    for entity in self._entities
+                ),
+                _query_cache_key(self._from_obj, anon_map, bindparams),
+                self._select_from_entity,
+                _query_cache_key(self._criterion, anon_map, bindparams),
+                _query_cache_key(self._order_by, anon_map, bindparams),
+                _query_cache_key(self._group_by, anon_map, bindparams),
+                _query_cache_key(self._having, anon_map, bindparams),
+                _query_cache_key(self._distinct, anon_map, bindparams),
+                _query_cache_key(self._prefixes, anon_map, bindparams),
+                _query_cache_key(self._suffixes, anon_map, bindparams),
+                _query_cache_key(
+                    self._for_update_arg, anon_map, bindparams),
+                _query_cache_key(self._limit, anon_map, bindparams),
+                _query_cache_key(self._offset, anon_map, bindparams),
+                self._yield_per, self._populate_existing,
+                self._invoke_all_eagers, self._version_check,
+                self._enable_eagerloads, self._with_labels,
+                self._enable_single_crit, self._orm_only_adapt,
+                self._current_path.path,
+                tuple(sorted(self._execution_options.items())),
+                frozenset(attrs)
+            )
+        except _NoCacheKey:
+            return None
+        except TypeError:
+            # a loader option argument isn't hashable
+            return None
+        return key, bindparams
+
+    def _cached_context(self, query_cache):
+        """Return a :class:`.QueryContext` for this :class:`.Query` from
+        the given :class:`.QueryCache`, compiling and storing it if not
+        present, or None if this :class:`.Query` can't be cached.
+
+        The context retrieved from the cache refers to a copy of the
+        :class:`.Query` which was compiled, carrying the bound parameter
+        values of this one.
+
+        """
+        cache_key = self._generate_cache_key()
+        if cache_key is None:
+            return None
+        key, bindparams = cache_key
+
+        try:
+            cached = query_cache.get(key)
+        except TypeError:
+            # a component of the key isn't hashable
+            return None
+
+        if cached is None:
+            context = self._compile_context()
+            bind_keys = _statement_bind_keys(context.statement, bindparams)
+
+            # subquery eager loaders establish a Query against the
+            # Session within the context
+            if bind_keys is not None and not any(
+                    isinstance(value, Query)
+                    for value in context.attributes.values()):
+                cached_context = copy.copy(context)
+                cached_context.query = self.with_session(None)
+                cached_context.session = None
+                cached_context.attributes = context.attributes.copy()
+                query_cache[key] = cached_context, bind_keys
+            return context
+
+        cached_context, bind_keys = cached
+        params = {}
+        for position, bind_key in bind_keys:
+            bindparam = bindparams[position]
+            if not bindparam.required:
+                params[bind_key] = bindparam.effective_value
+        params.update(self._params)
+
+        query = cached_context.query._clone()
+        query.session = self.session
+        query._params = params
+        query._autoflush = self._autoflush
+
+        context = copy.copy(cached_context)
+        context.query = query
+        context.session = self.session
+        context.autoflush = self._autoflush
+        context.attributes = cached_context.attributes.copy()
+        context.post_load_paths = {}
+        return context
 
     def _connection_from_session(self, **kw):
         conn = self.session.connection(
@@ -3129,10 +3438,57 @@ class Query(object):
     def __str__(self):
         return str(self._compile_context().statement)
 
+
+def _query_cache_key(value, anon_map, bindparams):
+    """Return the cache key of an element of :class:`.Query` state, which
+    is None, a plain value, a :class:`.ClauseElement`, or a list or
+    tuple of these."""
+
+    if isinstance(value, (list, tuple)):
+        return tuple(
+            _query_cache_key(elem, anon_map, bindparams) for elem in value)
+    elif isinstance(value, expression.ClauseElement):
+        return _cache_key(value, anon_map, bindparams)
+    else:
+        return value
+
+
+def _statement_bind_keys(statement, bindparams):
+    """Relate the bound parameters of a :class:`.Query` cache key to
+    those of the statement it was compiled into.
+
+    Returns a list of ``(position, key)`` tuples, where ``position`` is
+    that of a parameter within ``bindparams`` and ``key`` is the key of
+    the parameter in the statement which is either the same parameter or
+    a copy of it.  Returns None if a parameter of the :class:`.Query`
+    isn't present in the statement.
+
+    """
+    positions = dict(
+        (bindparam, idx) for idx, bindparam in enumerate(bindparams))
+    bind_keys = []
+    found = set()
+
+    def visit_bindparam(bindparam):
+        orig = bindparam
+        while orig is not None and orig not in positions:
+            orig = orig._is_clone_of
+        if orig is not None:
+            bind_keys.append((positions[orig], bindparam.key))
+            found.add(orig)
+
+    visitors.traverse(statement, {}, {'bindparam': visit_bindparam})
+    if len(found) != len(positions):
+        return None
+    return bind_keys
+
+
 from ..sql.selectable import ForUpdateArg
 
 
 class LockmodeArg(ForUpdateArg):
+    _inherit_cache_key = True
+
     @classmethod
     def parse_legacy_query(self, mode):
         if mode in (None, False):
@@ -3173,6 +3529,9 @@ class _QueryEntity(object):
         q.__dict__ = self.__dict__.copy()
         return q
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        raise _NoCacheKey()
+
 
 class _MapperEntity(_QueryEntity):
     """mapper/class/AliasedClass entity"""
@@ -3202,6 +3561,13 @@ class _MapperEntity(_QueryEntity):
             self._label_name = self.mapper.class_.__name__
         self.path = self.entity_zero._path_registry
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, self.mapper,
+            _cache_key(self.selectable, anon_map, bindparams),
+            tuple(self._with_polymorphic or ()), self._label_name
+        )
+
     def set_with_polymorphic(self, query, cls_or_mappers,
                              selectable, polymorphic_on):
         """Receive an update from a call to query.with_polymorphic().
@@ -3644,6 +4010,13 @@ class _ColumnEntity(_QueryEntity):
 
     supports_single_entity = False
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            _cache_key(self.column, anon_map, bindparams),
+            self._label_name, getattr(self.entity_zero, 'mapper', None)
+        )
+
     @property
     def entity_zero_or_selectable(self):
         if self.entity_zero is not None:
@@ -3709,7 +4082,8 @@ class QueryContext(object):
         'primary_columns', 'secondary_columns', 'eager_order_by',
         'eager_joins', 'create_eager_joins', 'propagate_options',
         'attributes', 'statement', 'from_clause', 'whereclause',
-        'order_by', 'labels', '_for_update_arg', 'runid', 'partials'
+        'order_by', 'labels', '_for_update_arg', 'runid', 'partials',
+        'post_load_paths'
     )
 
     def __init__(self, query):
@@ -3746,6 +4120,7 @@ class QueryContext(object):
         self.propagate_options = set(o for o in query._with_options if
                                      o.propagate_to_loaders)
         self.attributes = query._attributes.copy()
+        self.post_load_paths = {}
 
 
 class AliasOption(interfaces.MapperOption):
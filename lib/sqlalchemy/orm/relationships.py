@@ -113,6 +113,7 @@ class RelationshipProperty(StrategizedProperty):
                  active_history=False,
                  cascade_backrefs=True,
                  load_on_pending=False,
+                 lazy_batch_size=None,
                  bake_queries=True,
                  strategy_class=None, _local_remote_pairs=None,
                  query_class=None,
@@ -491,7 +492,7 @@ class RelationshipProperty(StrategizedProperty):
           branch.  When left at its default of ``None``, eager loaders
           will stop chaining when they encounter a the same target mapper
           which is already higher up in the chain.  This option applies
-          both to joined- and subquery- eager loaders.
+          to joined-, subquery- and selectin- eager loaders.
 
           .. seealso::
 
@@ -520,6 +521,14 @@ class RelationshipProperty(StrategizedProperty):
             a subquery of the original statement, for each collection
             requested.
 
+          * ``selectin`` - items should be loaded "eagerly" as the parents
+            are loaded, using one additional SQL statement per batch of
+            parents, which selects the related rows using an IN expression
+            against the primary keys of the parents.  See
+            :ref:`selectin_eager_loading`.
+
+            .. versionadded:: 1.0.7
+
           * ``noload`` - no loading should occur at any time.  This is to
             support "write-only" attributes, or attributes which are
             populated in some manner specific to the application.
@@ -543,6 +552,23 @@ class RelationshipProperty(StrategizedProperty):
 
             :ref:`dynamic_relationship` - detail on the ``dynamic`` option.
 
+        :param lazy_batch_size=None:
+          when set to an integer, a lazy load of this attribute on an
+          instance will also load the attribute for up to
+          ``lazy_batch_size - 1`` other instances which were loaded by the
+          same query and haven't loaded the attribute yet, using a single
+          SELECT with IN.  For a simple many-to-one, targets already
+          present in the identity map are not loaded again.  This greatly
+          reduces the number of statements emitted when iterating through
+          a result and accessing the attribute on each instance, without
+          the need to specify an eager loader up front.
+
+          .. versionadded:: 1.0.7
+
+          .. seealso::
+
+            :ref:`selectin_eager_loading`
+
         :param load_on_pending=False:
           Indicates loading behavior for transient or pending parent objects.
 
@@ -814,6 +840,7 @@ class RelationshipProperty(StrategizedProperty):
         self.extension = extension
         self.bake_queries = bake_queries
         self.load_on_pending = load_on_pending
+        self.lazy_batch_size = lazy_batch_size
         self.comparator_factory = comparator_factory or \
             RelationshipProperty.Comparator
         self.comparator = self.comparator_factory(self, None)
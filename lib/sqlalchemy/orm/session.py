@@ -12,7 +12,7 @@ from .. import util, sql, engine, exc as sa_exc
 from ..sql import util as sql_util, expression
 from . import (
     SessionExtension, attributes, exc, query,
-    loading, identity
+    loading, identity, cache
 )
 from ..inspection import inspect
 from .base import (
@@ -514,7 +514,8 @@ class Session(_SessionClassMethods):
                  autocommit=False, twophase=False,
                  weak_identity_map=True, binds=None, extension=None,
                  info=None,
-                 query_cls=query.Query):
+                 query_cls=query.Query, query_cache=None,
+                 expired_batch_size=None):
         """Construct a new Session.
 
         See also the :class:`.sessionmaker` function which is used to
@@ -598,6 +599,20 @@ class Session(_SessionClassMethods):
            so that all attribute/object access subsequent to a completed
            transaction will load from the most recent database state.
 
+        :param expired_batch_size: when set to an integer greater than
+           one, the load of the expired attributes of an instance also
+           loads the same attributes of up to ``expired_batch_size - 1``
+           other instances of the same mapping loaded by the same query
+           which have them expired, using IN against the primary key, such
+           as after :meth:`~.Session.expire_all` or :meth:`~.commit`.
+           Defaults to None, where each instance is loaded individually.
+
+           .. versionadded:: 1.0.7
+
+           .. seealso::
+
+                :meth:`.Session.refresh_all`
+
         :param extension: An optional
            :class:`~.SessionExtension` instance, or a list
            of such instances, which will receive pre- and post- commit and
@@ -617,6 +632,14 @@ class Session(_SessionClassMethods):
           objects, as returned by the :meth:`~.Session.query` method.
           Defaults to :class:`.Query`.
 
+        :param query_cache: a :class:`.QueryCache` in which the compiled
+          form of :class:`.Query` objects invoked by this :class:`.Session`
+          is cached, keyed on their structure, so that subsequent queries
+          of the same structure skip compilation.  The cache is typically
+          shared among all sessions using :class:`.sessionmaker`.
+
+          .. versionadded:: 1.0.7
+
         :param twophase:  When ``True``, all transactions will be started as
             a "two phase" transaction, i.e. using the "two phase" semantics
             of the database in use along with an XID.  During a
@@ -656,6 +679,8 @@ class Session(_SessionClassMethods):
         self._enable_transaction_accounting = _enable_transaction_accounting
         self.twophase = twophase
         self._query_cls = query_cls
+        self.query_cache = query_cache
+        self.expired_batch_size = expired_batch_size
         if info:
             self.info.update(info)
 
@@ -1248,6 +1273,36 @@ class Session(_SessionClassMethods):
 
         return self._query_cls(entities, self, **kwargs)
 
+    def get_many(self, entity, idents, chunksize=500):
+        """Return a list of instances of the given entity, one for each of
+        the given primary key identifiers and in the same order.
+
+        Each identifier is interpreted as by :meth:`.Query.get`, and
+        None is returned in place of those which don't refer to an
+        existing row.  Instances present in the identity map are returned
+        directly, as are those in the :class:`.SecondLevelCache` of the
+        mapping, if any; the rest are loaded using IN against the primary
+        key, emitting one SELECT for each ``chunksize`` identifiers rather
+        than one per identifier::
+
+            users = session.get_many(User, [5, 7, 12])
+
+        Expired instances are refreshed by the same SELECTs, and are
+        removed from the :class:`.Session` if their row no longer exists.
+
+        :param entity: a mapped class or :class:`.Mapper`.
+
+        :param idents: sequence of scalar or tuple primary key
+         identifiers.
+
+        :param chunksize: maximum number of identifiers to load per
+         SELECT.
+
+        .. versionadded:: 1.0.7
+
+        """
+        return self.query(entity)._get_many_impl(idents, chunksize)
+
     @property
     @util.contextmanager
     def no_autoflush(self):
@@ -1343,6 +1398,55 @@ class Session(_SessionClassMethods):
                 "Could not refresh instance '%s'" %
                 instance_str(instance))
 
+    def refresh_all(self, instances, attribute_names=None, chunksize=500):
+        """Expire and refresh the attributes on each of the given
+        instances.
+
+        This is equivalent to calling :meth:`~.Session.refresh` for each
+        instance, except that the instances of each mapping are loaded
+        using IN against the primary key, emitting one SELECT for each
+        ``chunksize`` instances, rather than one SELECT per instance.
+
+        :param instances: sequence of persistent instances.
+
+        :param attribute_names: optional.  An iterable collection of
+          string attribute names indicating a subset of attributes to
+          be refreshed.
+
+        :param chunksize: maximum number of instances to load per
+          SELECT.
+
+        .. versionadded:: 1.0.7
+
+        .. seealso::
+
+            :meth:`.Session.refresh`
+
+            :paramref:`.Session.expired_batch_size`
+
+        """
+        states = util.OrderedDict()
+        for instance in instances:
+            try:
+                state = attributes.instance_state(instance)
+            except exc.NO_STATE:
+                raise exc.UnmappedInstanceError(instance)
+            states[state] = True
+
+        by_mapper = util.OrderedDict()
+        for state in states:
+            self._expire_state(state, attribute_names)
+            by_mapper.setdefault(_state_mapper(state), []).append(state)
+
+        for mapper, mapper_states in by_mapper.items():
+            missing = loading.load_expired_attributes(
+                self.query(mapper), mapper_states,
+                attribute_names, chunksize)
+            if missing:
+                raise sa_exc.InvalidRequestError(
+                    "Could not refresh instance '%s'" %
+                    state_str(missing[0]))
+
     def expire_all(self):
         """Expires all persistent instances within this Session.
 
@@ -1699,7 +1803,88 @@ class Session(_SessionClassMethods):
         finally:
             self.autoflush = autoflush
 
-    def _merge(self, state, state_dict, load=True, _recursive=None):
+    def merge_all(self, instances, load=True, chunksize=500):
+        """Copy the state of each of the given instances into a
+        corresponding instance within this :class:`.Session`, returning
+        the list of resulting instances in the same order.
+
+        This is equivalent to calling :meth:`.Session.merge` for each
+        instance, except that when ``load`` is True, those instances whose
+        primary key isn't present in the identity map are first loaded
+        using IN against the primary key of their mapping, emitting one
+        SELECT for each ``chunksize`` instances, rather than one SELECT
+        per instance.  Related objects merged by cascade are loaded
+        individually as with :meth:`.Session.merge`.
+
+        :param instances: sequence of instances to be merged.
+
+        :param load: Boolean, when False, the "high performance" mode
+         of :meth:`.Session.merge` is used, which emits no SQL.
+
+        :param chunksize: maximum number of primary keys to load per
+         SELECT.
+
+        .. versionadded:: 1.0.7
+
+        """
+
+        if self._warn_on_events:
+            self._flush_warning("Session.merge_all()")
+
+        states = []
+        for instance in instances:
+            object_mapper(instance)  # verify mapped
+            states.append((
+                attributes.instance_state(instance),
+                attributes.instance_dict(instance)))
+
+        if load:
+            # flush current contents if we expect to load data
+            self._autoflush()
+
+        _recursive = {}
+        autoflush = self.autoflush
+        try:
+            self.autoflush = False
+            if load:
+                preloaded = self._preload_for_merge(states, chunksize)
+            else:
+                preloaded = None
+            return [
+                self._merge(
+                    state, state_dict, load=load, _recursive=_recursive,
+                    _preloaded=preloaded)
+                for state, state_dict in states
+            ]
+        finally:
+            self.autoflush = autoflush
+
+    def _preload_for_merge(self, states, chunksize):
+        """Load the instances corresponding to the given states which
+        aren't present in the identity map, returning a dictionary of
+        identity key to instance, or None where there's no row."""
+
+        keys_by_mapper = util.OrderedDict()
+        for state, state_dict in states:
+            mapper = _state_mapper(state)
+            key = state.key
+            if key is None:
+                key = mapper._identity_key_from_state(state)
+            # keys with NULLs are resolved individually by _merge()
+            if key in self.identity_map or _none_set.intersection(key[1]):
+                continue
+            keys_by_mapper.setdefault(mapper, util.OrderedSet()).add(key)
+
+        preloaded = {}
+        for mapper, keys in keys_by_mapper.items():
+            keys = list(keys)
+            preloaded.update(
+                zip(keys, loading.load_on_identities(
+                    self.query(mapper.class_), keys, chunksize)))
+        return preloaded
+
+    def _merge(self, state, state_dict, load=True, _recursive=None,
+               _preloaded=None):
         mapper = _state_mapper(state)
         if state in _recursive:
             return _recursive[state]
@@ -1731,6 +1916,9 @@ class Session(_SessionClassMethods):
             self._update_impl(merged_state)
             new_instance = True
 
+        elif _preloaded is not None and key in _preloaded:
+            merged = _preloaded[key]
+
         elif not _none_set.intersection(key[1]) or \
             (mapper.allow_partial_pks and
              not _none_set.issuperset(key[1])):
@@ -1744,6 +1932,10 @@ class Session(_SessionClassMethods):
             merged_dict = attributes.instance_dict(merged)
             new_instance = True
             self._save_or_update_state(merged_state)
+            if _preloaded is not None and key in _preloaded:
+                # pending instances aren't in the identity map; further
+                # instances of the same key merge into this one
+                _preloaded[key] = merged
         else:
             merged_state = attributes.instance_state(merged)
             merged_dict = attributes.instance_dict(merged)
@@ -2330,6 +2522,7 @@ class Session(_SessionClassMethods):
                 persistence._bulk_update(
                     mapper, mappings, transaction,
                     isstates, update_changed_only)
+                cache.invalidate_mapper(self, mapper)
             else:
                 persistence._bulk_insert(
                     mapper, mappings, transaction, isstates, return_defaults)
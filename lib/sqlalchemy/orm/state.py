@@ -58,6 +58,7 @@ class InstanceState(interfaces.InspectionAttr):
     expired = False
     deleted = False
     _load_pending = False
+    _lazy_batch = None
     is_instance = True
 
     callables = ()
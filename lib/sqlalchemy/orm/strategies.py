@@ -205,7 +205,19 @@ class DeferredColumnLoader(LoaderStrategy):
         # for the column; this is because in most cases we are
         # working just with the setup_query() directive which does
         # not support this, and the behavior here should be consistent.
-        if not self.is_class_level:
+        if self._is_batched(loadopt):
+            # track the instances loaded by this result, so that the
+            # load of the attribute on one of them can load its
+            # siblings as well
+            batch = path.get(context.attributes, "lazy_batch")
+            if batch is None:
+                batch = loading._LazyLoadBatch()
+                path.set(context.attributes, "lazy_batch", batch)
+            populators["new"].append((self.key, batch.add_state))
+            populators["new"].append(
+                (self.key,
+                 self.parent_property._deferred_batch_column_loader))
+        elif not self.is_class_level:
             set_deferred_for_local_state = \
                 self.parent_property._deferred_column_loader
             populators["new"].append((self.key, set_deferred_for_local_state))
@@ -249,12 +261,21 @@ class DeferredColumnLoader(LoaderStrategy):
                 setup_query(context, entity,
                             path, loadopt, adapter,
                             column_collection, memoized_populators, **kw)
+        elif self._is_batched(loadopt):
+            # not memoized, so that create_row_processor() is called
+            # to establish the batched loader
+            pass
         elif self.is_class_level:
             memoized_populators[self.parent_property] = _SET_DEFERRED_EXPIRED
         else:
             memoized_populators[self.parent_property] = _DEFER_FOR_STATE
 
-    def _load_for_state(self, state, passive):
+    def _is_batched(self, loadopt):
+        if loadopt and 'batch' in loadopt.local_opts:
+            return loadopt.local_opts['batch']
+        return self.parent_property.batch
+
+    def _load_for_state(self, state, passive, batch=False):
         if not state.key:
             return attributes.ATTR_EMPTY
 
@@ -286,19 +307,51 @@ class DeferredColumnLoader(LoaderStrategy):
             )
 
         query = session.query(localparent)
-        if loading.load_on_ident(
+
+        if batch and state._lazy_batch is not None and not state.expired:
+            siblings = self._batch_siblings(state, localparent, group)
+        else:
+            siblings = None
+
+        if siblings:
+            # siblings whose row is missing remain unloaded
+            if state in loading.load_expired_attributes(
+                    query, [state] + siblings, group):
+                raise orm_exc.ObjectDeletedError(state)
+        elif loading.load_on_ident(
                 query, state.key,
                 only_load_props=group, refresh_state=state) is None:
             raise orm_exc.ObjectDeletedError(state)
 
         return attributes.ATTR_WAS_SET
 
+    def _batch_siblings(self, state, localparent, group):
+        """Return the instances loaded in the same result as the given
+        state which haven't loaded any of the given attributes."""
+
+        key = self.key
+        siblings = []
+        for sibling in state._lazy_batch.unloaded(
+                key, lambda sibling: key in sibling.dict):
+            if sibling is state or \
+                    sibling.key is None or sibling.expired or \
+                    sibling.session_id != state.session_id or \
+                    not sibling.manager.mapper.isa(localparent):
+                continue
+            dict_ = sibling.dict
+            if all(k not in dict_ for k in group):
+                siblings.append(sibling)
+        return siblings
+
 
 class LoadDeferredColumns(object):
     """serializable loader object used by DeferredColumnLoader"""
 
-    def __init__(self, key):
+    batch = False
+
+    def __init__(self, key, batch=False):
         self.key = key
+        self.batch = batch
 
     def __call__(self, state, passive=attributes.PASSIVE_OFF):
         key = self.key
@@ -306,7 +359,7 @@ class LoadDeferredColumns(object):
         localparent = state.manager.mapper
         prop = localparent._props[key]
         strategy = prop._strategies[DeferredColumnLoader]
-        return strategy._load_for_state(state, passive)
+        return strategy._load_for_state(state, passive, batch=self.batch)
 
 
 class AbstractRelationshipLoader(LoaderStrategy):
@@ -320,6 +373,18 @@ class AbstractRelationshipLoader(LoaderStrategy):
         self.target = self.parent_property.target
         self.uselist = self.parent_property.uselist
 
+    def _create_selectin_row_processor(
+            self, context, path, loadopt,
+            mapper, result, adapter, populators):
+        """Load the attribute for each batch of rows using the "selectin"
+        loader, in place of eager loaders which can't be combined with
+        :meth:`.Query.yield_per`."""
+
+        self.parent_property._get_strategy_by_cls(SelectInLoader).\
+            create_row_processor(
+                context, path, loadopt,
+                mapper, result, adapter, populators)
+
 
 @log.class_logger
 @properties.RelationshipProperty.strategy_for(lazy="noload")
@@ -525,6 +590,11 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
                     not passive & attributes.RELATED_OBJECT_OK:
                 return attributes.PASSIVE_NO_RESULT
 
+        if self.parent_property.lazy_batch_size and \
+                state._lazy_batch is not None and not pending:
+            return self._emit_batched_lazyload(
+                session, state, ident_key, passive)
+
         return self._emit_lazyload(session, state, ident_key, passive)
 
     def _get_ident_for_use_get(self, session, state, passive):
@@ -611,10 +681,127 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
             else:
                 return None
 
+    def _lazy_batch_siblings(self, state):
+        """Return up to lazy_batch_size - 1 instances loaded in the same
+        result as the given state, which haven't loaded this attribute."""
+
+        limit = self.parent_property.lazy_batch_size - 1
+        key = self.key
+        siblings = []
+        for sibling in state._lazy_batch.unloaded(
+                key, lambda sibling: key in sibling.dict):
+            if len(siblings) >= limit:
+                break
+            if sibling is state or \
+                    sibling.key is None or sibling.expired or \
+                    sibling.session_id != state.session_id or \
+                    not sibling.manager.mapper.isa(self.parent):
+                continue
+            siblings.append(sibling)
+        return siblings
+
+    def _setup_batched_query(self, q, state, passive):
+        q = q._with_invoke_all_eagers(False)
+
+        if passive & attributes.NO_AUTOFLUSH:
+            q = q.autoflush(False)
+
+        if state.load_path:
+            q = q._with_current_path(state.load_path[self.parent_property])
+
+        if state.load_options:
+            q = q._conditional_options(*state.load_options)
+        return q
+
+    def _emit_batched_lazyload(self, session, state, ident_key, passive):
+        siblings = self._lazy_batch_siblings(state)
+        if not siblings:
+            return self._emit_lazyload(session, state, ident_key, passive)
+
+        if self.use_get:
+            return self._emit_batched_get(
+                session, state, ident_key, siblings, passive)
+
+        # load the attribute for all of the states using the same
+        # query as the "selectin" loader
+        selectin = self.parent_property._get_strategy_by_cls(SelectInLoader)
+        q, pk_cols = selectin._selectin_query(session, self.mapper)
+        q = self._setup_batched_query(q, state, passive)
+
+        states = [(state, True)] + [(sibling, False) for sibling in siblings]
+        result = None
+        for loaded_state, overwrite, value in selectin._load_values(
+                q, pk_cols, states, len(states)):
+            if loaded_state is state:
+                result = value
+            elif self.key not in loaded_state.dict:
+                loaded_state.get_impl(self.key).set_committed_value(
+                    loaded_state, loaded_state.dict, value)
+        return result
+
+    def _emit_batched_get(self, session, state, ident_key, siblings, passive):
+        # many-to-one against the primary key of the target; siblings
+        # whose target is already in the identity map are populated from
+        # there, the rest are loaded along with the target of the given
+        # state using a single IN
+        mapper = self.mapper
+        idents = {}
+        found = {}
+        to_load = util.OrderedSet([ident_key[1]])
+        for sibling in siblings:
+            ident = self._get_ident_for_use_get(
+                session, sibling, attributes.PASSIVE_NO_FETCH)
+            if attributes.PASSIVE_NO_RESULT in ident or \
+                    attributes.NEVER_SET in ident or \
+                    _none_set.issuperset(ident):
+                continue
+            ident = tuple(ident)
+            if ident not in found and ident not in to_load:
+                instance = loading.get_from_identity(
+                    session, mapper.identity_key_from_primary_key(ident),
+                    attributes.PASSIVE_NO_FETCH)
+                if instance is attributes.PASSIVE_NO_RESULT:
+                    continue
+                elif instance is None:
+                    to_load.add(ident)
+                else:
+                    found[ident] = instance
+            idents[sibling] = ident
+
+        q = self._setup_batched_query(session.query(mapper), state, passive)
+        pk_cols = mapper.primary_key
+        if len(pk_cols) == 1:
+            q = q.filter(
+                pk_cols[0].in_(
+                    sql.bindparam('primary_keys', expanding=True))).\
+                params(primary_keys=[ident[0] for ident in to_load])
+        else:
+            q = q.filter(sql.tuple_(*pk_cols).in_(list(to_load)))
+
+        for instance in q:
+            found[attributes.instance_state(instance).key[1]] = instance
+
+        for sibling, ident in idents.items():
+            if self.key not in sibling.dict:
+                sibling.get_impl(self.key).set_committed_value(
+                    sibling, sibling.dict, found.get(ident))
+
+        return found.get(ident_key[1])
+
     def create_row_processor(
             self, context, path, loadopt,
             mapper, result, adapter, populators):
         key = self.key
+
+        if self.parent_property.lazy_batch_size:
+            # track the instances loaded by this result, so that a lazy
+            # load on one of them can load its siblings as well
+            batch = path.get(context.attributes, "lazy_batch")
+            if batch is None:
+                batch = loading._LazyLoadBatch()
+                path.set(context.attributes, "lazy_batch", batch)
+            populators["new"].append((self.key, batch.add_state))
+
         if not self.is_class_level:
             # we are not the primary manager for this attribute
             # on this class - set up a
@@ -707,7 +894,8 @@ class SubqueryLoader(AbstractRelationshipLoader):
         if not context.query._enable_eagerloads:
             return
         elif context.query._yield_per:
-            context.query._no_yield_per("subquery")
+            # loaded for each batch of rows by create_row_processor()
+            return
 
         path = path[self.parent_property]
 
@@ -1003,6 +1191,12 @@ class SubqueryLoader(AbstractRelationshipLoader):
                 "population - eager loading cannot be applied." %
                 self)
 
+        if context.query._yield_per:
+            self._create_selectin_row_processor(
+                context, path, loadopt,
+                mapper, result, adapter, populators)
+            return
+
         path = path[self.parent_property]
 
         subq = path.get(context.attributes, 'subquery')
@@ -1072,6 +1266,191 @@ class SubqueryLoader(AbstractRelationshipLoader):
             populators["eager"].append((self.key, collections.loader))
 
 
+@log.class_logger
+@properties.RelationshipProperty.strategy_for(lazy="selectin")
+class SelectInLoader(AbstractRelationshipLoader, util.MemoizedSlots):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    using "select IN" eager loading, where the related rows for each
+    batch of loaded parents are loaded using IN against the parent
+    primary keys.
+
+    """
+
+    __slots__ = 'join_depth', '_omit_join_cols'
+
+    _chunksize = 500
+
+    def __init__(self, parent):
+        super(SelectInLoader, self).__init__(parent)
+        self.join_depth = self.parent_property.join_depth
+
+    def init_class_attribute(self, mapper):
+        self.parent_property.\
+            _get_strategy_by_cls(LazyLoader).\
+            init_class_attribute(mapper)
+
+    def _memoized_attr__omit_join_cols(self):
+        # for a simple one-to-many, the related rows can be selected
+        # by their foreign key columns alone, without a JOIN back to
+        # the parent table.  Returns the foreign key columns in the
+        # order of the parent's primary key, else None.
+        prop = self.parent_property
+        if prop.secondary is not None or \
+                prop.direction is not interfaces.ONETOMANY:
+            return None
+
+        pairs = prop._join_condition.local_remote_pairs
+        local_to_remote = dict(pairs)
+        pk_cols = self.parent.primary_key
+        if len(pairs) != len(pk_cols) or \
+                set(local_to_remote) != set(pk_cols):
+            return None
+
+        if not prop.primaryjoin.compare(
+                sql.and_(*[local == remote for local, remote in pairs])):
+            # additional criteria in the join condition
+            return None
+
+        return [local_to_remote[col] for col in pk_cols]
+
+    def create_row_processor(
+            self, context, path, loadopt,
+            mapper, result, adapter, populators):
+        if not self.parent.class_manager[self.key].impl.supports_population:
+            raise sa_exc.InvalidRequestError(
+                "'%s' does not support object "
+                "population - eager loading cannot be applied." %
+                self)
+
+        if not context.query._enable_eagerloads:
+            return
+
+        selectin_path = context.query._current_path + path
+
+        path_w_prop = path[self.parent_property]
+
+        with_poly_info = path_w_prop.get(
+            context.attributes,
+            "path_with_polymorphic", None)
+        if with_poly_info is not None:
+            effective_entity = with_poly_info.entity
+        else:
+            effective_entity = self.mapper
+
+        # if not via query option, check for
+        # a cycle
+        if not path_w_prop.contains(context.attributes, "loader"):
+            if self.join_depth:
+                if selectin_path.length / 2 > self.join_depth:
+                    return
+            elif selectin_path.contains_mapper(self.mapper):
+                return
+
+        if loadopt is not None:
+            chunksize = loadopt.local_opts.get('chunksize', self._chunksize)
+        else:
+            chunksize = self._chunksize
+
+        loading.PostLoad.callable_for_path(
+            context, selectin_path, self.parent, self.key,
+            self._load_for_path, effective_entity, chunksize)
+
+    def _load_for_path(
+            self, context, path, states, load_only,
+            effective_entity, chunksize):
+
+        if load_only and self.key not in load_only:
+            return
+
+        query = context.query
+
+        q, pk_cols = self._selectin_query(context.session, effective_entity)
+
+        if query._with_options:
+            q = q._with_current_path(path[self.parent_property])
+            q = q._conditional_options(*query._with_options)
+
+        if query._populate_existing:
+            q = q.populate_existing()
+
+        for state, overwrite, value in self._load_values(
+                q, pk_cols, states, chunksize):
+            if not overwrite and self.key in state.dict:
+                continue
+
+            state.get_impl(self.key).set_committed_value(
+                state, state.dict, value)
+
+    def _selectin_query(self, session, effective_entity):
+        """Return a Query for the related entity, along with the columns
+        which correspond to the parent primary key; the Query selects
+        these columns after the entity and is restricted to the
+        ``primary_keys`` parameter when the key is not composite.
+
+        """
+        pk_cols = self._omit_join_cols
+        if pk_cols is not None:
+            q = session.query(effective_entity, *pk_cols)
+        else:
+            pa = orm_util.AliasedClass(self.parent)
+            pa_insp = inspect(pa)
+            pk_cols = [
+                pa_insp._adapt_element(col)
+                for col in self.parent.primary_key
+            ]
+            q = session.query(effective_entity, *pk_cols).\
+                select_from(pa).\
+                join(getattr(pa, self.key).of_type(effective_entity))
+
+        if len(pk_cols) == 1:
+            q = q.filter(
+                pk_cols[0].in_(sql.bindparam('primary_keys', expanding=True)))
+
+        if self.parent_property.order_by:
+            q = q.order_by(*util.to_list(self.parent_property.order_by))
+
+        return q, pk_cols
+
+    def _load_values(self, q, pk_cols, states, chunksize):
+        """Run the given Query for chunks of the given (state, overwrite)
+        pairs, yielding (state, overwrite, value) for each."""
+
+        our_states = [
+            (state.key[1], state, overwrite)
+            for state, overwrite in states
+        ]
+
+        while our_states:
+            chunk = our_states[0:chunksize]
+            our_states = our_states[chunksize:]
+
+            if len(pk_cols) == 1:
+                chunk_q = q.params(
+                    primary_keys=[key[0] for key, state, overwrite in chunk])
+            else:
+                chunk_q = q.filter(
+                    sql.tuple_(*pk_cols).in_(
+                        [key for key, state, overwrite in chunk]))
+
+            data = util.defaultdict(list)
+            for row in chunk_q:
+                data[tuple(row[1:])].append(row[0])
+
+            for key, state, overwrite in chunk:
+                collection = data.get(key, ())
+                if self.uselist:
+                    value = collection
+                else:
+                    if len(collection) > 1:
+                        util.warn(
+                            "Multiple rows returned with "
+                            "uselist=False for eagerly-loaded attribute '%s' "
+                            % self)
+                    value = collection[0] if collection else None
+
+                yield state, overwrite, value
+
+
 @log.class_logger
 @properties.RelationshipProperty.strategy_for(lazy="joined")
 @properties.RelationshipProperty.strategy_for(lazy=False)
@@ -1101,7 +1480,10 @@ class JoinedLoader(AbstractRelationshipLoader):
         if not context.query._enable_eagerloads:
             return
         elif context.query._yield_per and self.uselist:
-            context.query._no_yield_per("joined collection")
+            if loadopt and "eager_from_alias" in loadopt.local_opts:
+                context.query._no_yield_per("joined collection")
+            # loaded for each batch of rows by create_row_processor()
+            return
 
         path = path[self.parent_property]
 
@@ -1482,6 +1864,12 @@ class JoinedLoader(AbstractRelationshipLoader):
                 self
             )
 
+        if context.query._yield_per and self.uselist:
+            self._create_selectin_row_processor(
+                context, path, loadopt,
+                mapper, result, adapter, populators)
+            return
+
         our_path = path[self.parent_property]
 
         eager_adapter = self._create_eager_adapter(
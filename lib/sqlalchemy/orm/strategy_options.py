@@ -778,6 +778,63 @@ def subqueryload_all(*keys):
     return _UnboundLoad._from_keys(_UnboundLoad.subqueryload, keys, True, {})
 
 
+@loader_option()
+def selectinload(loadopt, attr, chunksize=None):
+    """Indicate that the given attribute should be loaded using
+    SELECT IN eager loading.
+
+    This function is part of the :class:`.Load` interface and supports
+    both method-chained and standalone operation.
+
+    examples::
+
+        # selectin-load the "orders" collection on "User"
+        query(User).options(selectinload(User.orders))
+
+        # selectin-load Order.items and then Item.keywords
+        query(Order).options(
+            selectinload(Order.items).selectinload(Item.keywords))
+
+        # lazily load Order.items, but when Items are loaded,
+        # selectin-load the keywords collection
+        query(Order).options(lazyload(Order.items).selectinload(Item.keywords))
+
+    :param chunksize: the maximum number of parent primary key values
+     rendered in each IN expression; defaults to 500.
+
+    .. versionadded:: 1.0.7
+
+    .. seealso::
+
+        :ref:`loading_toplevel`
+
+        :ref:`selectin_eager_loading`
+
+        :func:`.orm.subqueryload`
+
+        :func:`.orm.lazyload`
+
+        :paramref:`.relationship.lazy`
+
+    """
+    loader = loadopt.set_relationship_strategy(attr, {"lazy": "selectin"})
+    if chunksize is not None:
+        loader.local_opts['chunksize'] = chunksize
+    return loader
+
+
+@selectinload._add_unbound_fn
+def selectinload(*keys, **kw):
+    return _UnboundLoad._from_keys(
+        _UnboundLoad.selectinload, keys, False, kw)
+
+
+@selectinload._add_unbound_all_fn
+def selectinload_all(*keys, **kw):
+    return _UnboundLoad._from_keys(
+        _UnboundLoad.selectinload, keys, True, kw)
+
+
 @loader_option()
 def lazyload(loadopt, attr):
     """Indicate that the given attribute should be loaded using "lazy"
@@ -884,7 +941,7 @@ def defaultload(*keys):
 
 
 @loader_option()
-def defer(loadopt, key):
+def defer(loadopt, key, batch=None):
     """Indicate that the given column-oriented attribute should be deferred, e.g.
     not loaded until accessed.
 
@@ -922,8 +979,25 @@ def defer(loadopt, key):
                             defer("another_column")
             )
 
+    When ``batch`` is True, the load of the attribute on one instance
+    also loads it for all other instances loaded by the same query which
+    haven't yet loaded it, using IN against the primary key, so that
+    accessing the attribute on each instance in a loop emits a single
+    SELECT per 500 instances rather than one per instance::
+
+        for doc in session.query(Document).options(
+                defer(Document.body, batch=True)):
+            print(len(doc.body))
+
     :param key: Attribute to be deferred.
 
+    :param batch: when True, the attribute is loaded for all instances
+     of the result as described above; when False, it's loaded for each
+     instance individually.  Defaults to the
+     :paramref:`.column_property.batch` setting of the mapping.
+
+     .. versionadded:: 1.0.7
+
     :param \*addl_attrs: Deprecated; this option supports the old 0.8 style
      of specifying a path as a series of attributes, which is now superseded
      by the method-chained style.
@@ -935,16 +1009,21 @@ def defer(loadopt, key):
         :func:`.orm.undefer`
 
     """
+    if batch is not None:
+        opts = {"batch": batch}
+    else:
+        opts = None
     return loadopt.set_column_strategy(
         (key, ),
-        {"deferred": True, "instrument": True}
+        {"deferred": True, "instrument": True},
+        opts
     )
 
 
 @defer._add_unbound_fn
-def defer(key, *addl_attrs):
+def defer(key, *addl_attrs, **kw):
     return _UnboundLoad._from_keys(
-        _UnboundLoad.defer, (key, ) + addl_attrs, False, {})
+        _UnboundLoad.defer, (key, ) + addl_attrs, False, kw)
 
 
 @loader_option()
@@ -776,6 +776,8 @@ class _ORMJoin(expression.Join):
 
     __visit_name__ = expression.Join.__visit_name__
 
+    _inherit_cache_key = True
+
     def __init__(
             self,
             left, right, onclause=None, isouter=False,
@@ -182,7 +182,7 @@ def _new_annotation_type(cls, base_cls):
 
     annotated_classes[cls] = anno_cls = type(
         "Annotated%s" % cls.__name__,
-        (base_cls, cls), {})
+        (base_cls, cls), {'_inherit_cache_key': True})
     globals()["Annotated%s" % cls.__name__] = anno_cls
     return anno_cls
 
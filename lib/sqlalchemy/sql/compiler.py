@@ -148,6 +148,25 @@ COMPOUND_KEYWORDS = {
 }
 
 
+def _result_column_sources(statement):
+    """Return the column expressions of a statement which are the
+    sources of its result columns, in order."""
+
+    while isinstance(
+            statement, (selectable.CompoundSelect, selectable.FromGrouping)):
+        if isinstance(statement, selectable.CompoundSelect):
+            statement = statement.selects[0]
+        else:
+            statement = statement.element
+
+    if isinstance(statement, selectable.Select):
+        return [column for name, column in statement._columns_plus_names]
+    elif isinstance(statement, selectable.TextAsFrom):
+        return statement.column_args
+    else:
+        return getattr(statement, '_returning', None) or ()
+
+
 class Compiled(object):
 
     """Represent a compiled SQL or DDL expression.
@@ -326,6 +345,40 @@ class SQLCompiler(Compiled):
     driver/DB enforces this
     """
 
+    insert_single_values_expr = None
+    """When an INSERT is compiled with a single set of parameters inside
+    a VALUES expression, the string is assigned here, where it can be
+    used for insert batching schemes to rewrite the VALUES expression.
+
+    """
+
+    _insert_values_bind_count = None
+    """The number of bound parameters present once the VALUES expression
+    of an INSERT has been compiled; if further bound parameters are
+    rendered afterwards, the VALUES expression doesn't account for all
+    parameters of the statement."""
+
+    contains_expanding_parameters = False
+    """True if we've encountered bindparam(..., expanding=True).
+
+    These need to be converted before execution into individual
+    bound parameters, which is handled by the execution context.
+
+    """
+
+    _cacheable = True
+    """set to False at the instance level when the values of bound
+    parameters have been rendered inline into the statement, in which
+    case the compiled form can't be reused by the engine-wide
+    compiled cache.
+    """
+
+    _cache_key_bind_positions = None
+    """dictionary of each bound parameter in :attr:`.bind_names` to its
+    position within the bound parameters of the statement's cache key,
+    when this compiled object is stored in the engine-wide compiled
+    cache."""
+
     def __init__(self, dialect, statement, column_keys=None,
                  inline=False, **kwargs):
         """Construct a new ``DefaultCompiler`` object.
@@ -452,19 +505,51 @@ class SQLCompiler(Compiled):
     def sql_compiler(self):
         return self
 
-    def construct_params(self, params=None, _group_number=None, _check=True):
-        """return a dictionary of bind parameter keys and values"""
+    def construct_params(self, params=None, _group_number=None, _check=True,
+                         extracted_parameters=None):
+        """return a dictionary of bind parameter keys and values
+
+        ``extracted_parameters`` is the list of :class:`.BindParameter`
+        objects of a statement that shares the cache key of this
+        compiled object's statement; when present, the values of these
+        take the place of those which are compiled into this object.
+
+        """
+
+        if extracted_parameters is not None:
+            resolved = dict(
+                (bindparam, extracted_parameters[position])
+                for bindparam, position in
+                self._cache_key_bind_positions.items())
+        else:
+            resolved = None
 
         if params:
             pd = {}
             for bindparam in self.bind_names:
                 name = self.bind_names[bindparam]
+                if resolved:
+                    value_param = resolved.get(bindparam, bindparam)
+                else:
+                    value_param = bindparam
+
                 if bindparam.key in params:
                     pd[name] = params[bindparam.key]
+                elif value_param.key in params:
+                    # keyed on the parameter of the statement being
+                    # executed, which is anonymously named differently
+                    # than that of the statement which was compiled
+                    pd[name] = params[value_param.key]
+                elif bindparam._is_clone_of is not None and \
+                        bindparam._is_clone_of.key in params:
+                    # keyed on the parameter of the statement which was
+                    # compiled, which the compiler has copied under a new
+                    # anonymous key, as when rewriting nested joins
+                    pd[name] = params[bindparam._is_clone_of.key]
                 elif name in params:
                     pd[name] = params[name]
 
-                elif _check and bindparam.required:
+                elif _check and value_param.required:
                     if _group_number:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r, "
@@ -475,15 +560,20 @@ class SQLCompiler(Compiled):
                             "A value is required for bind parameter %r"
                             % bindparam.key)
 
-                elif bindparam.callable:
-                    pd[name] = bindparam.effective_value
+                elif value_param.callable:
+                    pd[name] = value_param.effective_value
                 else:
-                    pd[name] = bindparam.value
+                    pd[name] = value_param.value
             return pd
         else:
             pd = {}
             for bindparam in self.bind_names:
-                if _check and bindparam.required:
+                if resolved:
+                    value_param = resolved.get(bindparam, bindparam)
+                else:
+                    value_param = bindparam
+
+                if _check and value_param.required:
                     if _group_number:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r, "
@@ -494,10 +584,11 @@ class SQLCompiler(Compiled):
                             "A value is required for bind parameter %r"
                             % bindparam.key)
 
-                if bindparam.callable:
-                    pd[self.bind_names[bindparam]] = bindparam.effective_value
+                if value_param.callable:
+                    pd[self.bind_names[bindparam]] = \
+                        value_param.effective_value
                 else:
-                    pd[self.bind_names[bindparam]] = bindparam.value
+                    pd[self.bind_names[bindparam]] = value_param.value
             return pd
 
     @property
@@ -506,11 +597,71 @@ class SQLCompiler(Compiled):
         compiled object, for those values that are present."""
         return self.construct_params(_check=False)
 
+    def _establish_cache_key_bindparams(self, extracted_parameters):
+        """Associate the bound parameters rendered by this compiled object
+        with the given bound parameters of the statement's cache key.
+
+        Returns False if a bound parameter not derived from the
+        statement itself was rendered, such that the compiled form
+        can't be used on behalf of other statements of the same key;
+        parameters generated for the VALUES or SET clause of an INSERT
+        or UPDATE are derived from ``column_keys``, which are part
+        of the key.
+
+        """
+        positions = dict(
+            (bindparam, idx)
+            for idx, bindparam in enumerate(extracted_parameters))
+        bind_positions = {}
+        for bindparam in self.bind_names:
+            if bindparam in positions:
+                bind_positions[bindparam] = positions[bindparam]
+            elif bindparam._is_clone_of in positions:
+                bind_positions[bindparam] = \
+                    positions[bindparam._is_clone_of]
+            elif not bindparam._is_crud:
+                return False
+        self._cache_key_bind_positions = bind_positions
+        return True
+
     @util.dependencies("sqlalchemy.engine.result")
     def _create_result_map(self, result):
         """utility method used for unit tests only."""
         return result.ResultMetaData._create_result_map(self._result_columns)
 
+    def _result_columns_for_statement(self, statement):
+        """Return the ``_result_columns`` of this compiled object, where
+        the columns of the given statement are added as targets alongside
+        the corresponding columns of the compiled statement.
+
+        The given statement is one sharing the cache key of
+        :attr:`.statement`, which is being executed using this compiled
+        object, so that result rows may be targeted using its own
+        column expressions.
+
+        """
+        translate = {}
+        for orig, new in zip(
+                _result_column_sources(self.statement),
+                _result_column_sources(statement)):
+            if orig is not new:
+                translate[orig] = new
+                if isinstance(orig, elements.Label):
+                    translate[orig.element] = new.element
+
+        if not translate:
+            return self._result_columns
+
+        return [
+            (
+                key, name,
+                objs + tuple(
+                    translate[obj] for obj in objs if obj in translate),
+                type_
+            )
+            for key, name, objs, type_ in self._result_columns
+        ]
+
     def default_from(self):
         """Called when a SELECT statement has no froms, and no FROM clause is
         to be appended.
@@ -1090,10 +1241,16 @@ class SQLCompiler(Compiled):
 
         self.binds[bindparam.key] = self.binds[name] = bindparam
 
-        return self.bindparam_string(name, **kwargs)
+        return self.bindparam_string(
+            name, expanding=bindparam.expanding, **kwargs)
 
     def render_literal_bindparam(self, bindparam, **kw):
+        self._cacheable = False
         value = bindparam.effective_value
+        if bindparam.expanding:
+            return "(%s)" % ", ".join(
+                self.render_literal_value(elem, bindparam.type)
+                for elem in value)
         return self.render_literal_value(value, bindparam.type)
 
     def render_literal_value(self, value, type_):
@@ -1152,13 +1309,18 @@ class SQLCompiler(Compiled):
         self.anon_map[derived] = anonymous_counter + 1
         return derived + "_" + str(anonymous_counter)
 
-    def bindparam_string(self, name, positional_names=None, **kw):
+    def bindparam_string(self, name, positional_names=None,
+                         expanding=False, **kw):
         if self.positional:
             if positional_names is not None:
                 positional_names.append(name)
             else:
                 self.positiontup.append(name)
-        return self.bindtemplate % {'name': name}
+        if expanding:
+            self.contains_expanding_parameters = True
+            return "([EXPANDING_%s])" % name
+        else:
+            return self.bindtemplate % {'name': name}
 
     def visit_cte(self, cte, asfrom=False, ashint=False,
                   fromhints=None,
@@ -1813,6 +1975,7 @@ class SQLCompiler(Compiled):
         )
 
     def visit_insert(self, insert_stmt, **kw):
+        toplevel = not self.stack
         self.stack.append(
             {'correlate_froms': set(),
              "asfrom_froms": set(),
@@ -1895,8 +2058,17 @@ class SQLCompiler(Compiled):
                 )
             )
         else:
-            text += " VALUES (%s)" % \
-                ', '.join([c[1] for c in crud_params])
+            insert_single_values_expr = ', '.join([c[1] for c in crud_params])
+            text += " VALUES (%s)" % insert_single_values_expr
+            if toplevel:
+                self.insert_single_values_expr = insert_single_values_expr
+                self._insert_values_bind_count = len(self.bind_names)
+
+        if insert_stmt._post_values_clause is not None:
+            post_values_clause = self.process(
+                insert_stmt._post_values_clause, **kw)
+            if post_values_clause:
+                text += " " + post_values_clause
 
         if self.returning and not self.returning_precedes_values:
             text += " " + returning_clause
@@ -11,8 +11,9 @@ Provide :class:`.Insert`, :class:`.Update` and :class:`.Delete`.
 
 from .base import Executable, _generative, _from_objects, DialectKWArgs
 from .elements import ClauseElement, _literal_as_text, Null, and_, _clone, \
-    _column_as_key
-from .selectable import _interpret_as_from, _interpret_as_select, HasPrefixes
+    _column_as_key, _cache_key, _cache_key_tuple, _NoCacheKey
+from .selectable import _interpret_as_from, _interpret_as_select, \
+    HasPrefixes, _cache_key_set
 from .. import util
 from .. import exc
 
@@ -169,6 +170,27 @@ class UpdateBase(DialectKWArgs, HasPrefixes, Executable, ClauseElement):
         self._hints = self._hints.union(
             {(selectable, dialect_name): text})
 
+    def _gen_dml_cache_key(self, anon_map, bindparams):
+        """Return the cache key elements common to INSERT, UPDATE
+        and DELETE."""
+
+        return (
+            self.__class__,
+            _cache_key(self.table, anon_map, bindparams),
+            tuple(
+                (_cache_key(elem, anon_map, bindparams), dialect_name)
+                for elem, dialect_name in self._prefixes
+            ),
+            frozenset(
+                (_cache_key_set([selectable], anon_map, bindparams),
+                 dialect_name, hint)
+                for (selectable, dialect_name), hint in self._hints.items()
+            ),
+            _cache_key_tuple(self._returning, anon_map, bindparams)
+            if self._returning else None,
+            tuple(sorted(self.dialect_kwargs.items()))
+        )
+
 
 class ValuesBase(UpdateBase):
     """Supplies support for :meth:`.ValuesBase.values` to
@@ -187,6 +209,45 @@ class ValuesBase(UpdateBase):
         if prefixes:
             self._setup_prefixes(prefixes)
 
+    def _gen_values_cache_key(self, anon_map, bindparams):
+        """Return the cache key elements for the VALUES / SET clause.
+
+        Plain Python values given to :meth:`.ValuesBase.values` are
+        converted into bound parameters at compile time, so only
+        SQL expressions can be keyed.
+
+        """
+        if self.parameters is None:
+            parameters = None
+        elif self._has_multi_parameters:
+            parameters = self.parameters
+        else:
+            parameters = [self.parameters]
+
+        if parameters is not None:
+            for params in parameters:
+                for value in params.values():
+                    if not isinstance(value, ClauseElement):
+                        raise _NoCacheKey()
+            parameters = tuple(
+                tuple(
+                    (
+                        _cache_key(key, anon_map, bindparams)
+                        if isinstance(key, ClauseElement) else key,
+                        _cache_key(value, anon_map, bindparams)
+                    )
+                    for key, value in params.items()
+                )
+                for params in parameters
+            )
+
+        return_defaults = self._return_defaults
+        if not isinstance(return_defaults, bool):
+            return_defaults = _cache_key_tuple(
+                return_defaults, anon_map, bindparams)
+
+        return (parameters, self._has_multi_parameters, return_defaults)
+
     @_generative
     def values(self, *args, **kwargs):
         """specify a fixed VALUES clause for an INSERT statement, or the SET
@@ -424,6 +485,10 @@ class Insert(ValuesBase):
 
     _supports_multi_parameters = True
 
+    _post_values_clause = None
+    """An optional clause rendered following the VALUES clause, for
+    dialect-specific INSERT constructs."""
+
     def __init__(self,
                  table,
                  values=None,
@@ -559,6 +624,14 @@ class Insert(ValuesBase):
         if self.select is not None:
             self.select = _clone(self.select)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return self._gen_dml_cache_key(anon_map, bindparams) + \
+            self._gen_values_cache_key(anon_map, bindparams) + (
+                _cache_key(self.select, anon_map, bindparams),
+                tuple(self.select_names or ()),
+                self.include_insert_from_select_defaults, self.inline,
+                _cache_key(self._post_values_clause, anon_map, bindparams))
+
 
 class Update(ValuesBase):
     """Represent an Update construct.
@@ -703,6 +776,12 @@ class Update(ValuesBase):
         self._whereclause = clone(self._whereclause, **kw)
         self.parameters = self.parameters.copy()
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return self._gen_dml_cache_key(anon_map, bindparams) + \
+            self._gen_values_cache_key(anon_map, bindparams) + (
+                _cache_key(self._whereclause, anon_map, bindparams),
+                self.inline)
+
     @_generative
     def where(self, whereclause):
         """return a new update() construct with the given expression added to
@@ -798,3 +877,8 @@ class Delete(UpdateBase):
     def _copy_internals(self, clone=_clone, **kw):
         # TODO: coverage
         self._whereclause = clone(self._whereclause, **kw)
+
+    def _gen_cache_key(self, anon_map, bindparams):
+        return self._gen_dml_cache_key(anon_map, bindparams) + (
+            _cache_key(self._whereclause, anon_map, bindparams),
+        )
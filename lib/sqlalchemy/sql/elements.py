@@ -30,6 +30,73 @@ def _clone(element, **kw):
     return element._clone()
 
 
+class _NoCacheKey(Exception):
+    """Raised within cache key generation when an element
+    can't produce a structural cache key."""
+
+
+def _cache_key(element, anon_map, bindparams):
+    """Return the cache key of the given child element.
+
+    ``None`` is returned for an element that is ``None``; raises
+    :class:`._NoCacheKey` if the element isn't cacheable.
+
+    """
+    if element is None:
+        return None
+    key = element._gen_cache_key(anon_map, bindparams)
+    if key is None:
+        raise _NoCacheKey()
+    return key
+
+
+def _cache_key_tuple(elements, anon_map, bindparams):
+    return tuple(
+        _cache_key(element, anon_map, bindparams) for element in elements)
+
+
+def _cache_key_ref(element, anon_map):
+    """Return a back-reference key for an element that has already
+    been keyed within the current statement; otherwise record the element
+    and return ``None``.
+
+    """
+    ident = id(element)
+    if ident in anon_map:
+        return ('ref', anon_map[ident])
+    anon_map[ident] = len(anon_map)
+    return None
+
+
+_anon_label_token = re.compile(r'%\((\d+) ([^)]+)\)s')
+
+
+def _anon_cache_key(name, anon_map):
+    """Return the given name, with the object identifiers of anonymous
+    label tokens replaced by their order of appearance within the
+    current statement.
+
+    """
+    if not isinstance(name, _anonymous_label):
+        return name
+
+    def repl(m):
+        ident = m.group(1)
+        if ident not in anon_map:
+            anon_map[ident] = len(anon_map)
+        return '%%(%d %s)s' % (anon_map[ident], m.group(2))
+    return _anon_label_token.sub(repl, name)
+
+
+def _operator_cache_key(op):
+    if isinstance(op, operators.custom_op):
+        return (
+            operators.custom_op, op.opstring,
+            op.precedence, op.is_comparison)
+    else:
+        return op
+
+
 def collate(expression, collation):
     """Return the clause ``expression COLLATE collation``.
 
@@ -375,6 +442,44 @@ class ClauseElement(Visitable):
         """
         return self is other
 
+    def _generate_cache_key(self):
+        """Return a structural cache key for this :class:`.ClauseElement`,
+        along with the list of :class:`.BindParameter` objects within it.
+
+        The key is a hashable tuple which is equal for any two constructs
+        that would compile into the same SQL string and result structure,
+        regardless of the values present in their bound parameters.  The
+        bound parameters are returned in the order in which they were
+        encountered, so that those of two constructs with equal keys
+        correspond to each other positionally.
+
+        ``None`` is returned if this construct, or any element within it,
+        does not support cache key generation.
+
+        """
+        anon_map = {}
+        bindparams = []
+        try:
+            key = self._gen_cache_key(anon_map, bindparams)
+        except _NoCacheKey:
+            return None
+        if key is None:
+            return None
+        return key, bindparams
+
+    def _gen_cache_key(self, anon_map, bindparams):
+        """Return the cache key for this element, appending the
+        :class:`.BindParameter` objects it contains to ``bindparams``.
+
+        ``anon_map`` is used to relate anonymous names and repeated
+        elements to their position within the statement.  ``None`` is
+        returned if the element can't be cached; a subclass is treated
+        as uncacheable unless it implements this method itself or sets
+        ``_inherit_cache_key = True``.
+
+        """
+        return None
+
     def _copy_internals(self, clone=_clone, **kw):
         """Reassign internal elements to be clones of themselves.
 
@@ -896,6 +1001,7 @@ class BindParameter(ColumnElement):
     def __init__(self, key, value=NO_ARG, type_=None,
                  unique=False, required=NO_ARG,
                  quote=None, callable_=None,
+                 expanding=False,
                  isoutparam=False,
                  _compared_to_operator=None,
                  _compared_to_type=None):
@@ -1081,6 +1187,28 @@ class BindParameter(ColumnElement):
           "OUT" parameter.  This applies to backends such as Oracle which
           support OUT parameters.
 
+        :param expanding:
+          if True, this parameter will be treated as an "expanding" parameter
+          at execution time; the parameter value is expected to be a sequence,
+          rather than a scalar value, and the string SQL statement will
+          be transformed on a per-execution basis to accommodate the sequence
+          with a variable number of parameter slots passed to the DBAPI.
+          This allows a statement which uses the IN operator to be compiled
+          and cached once, regardless of the length of the list of values
+          passed to it::
+
+            stmt = select([users_table]).\\
+                where(users_table.c.id.in_(bindparam('ids', expanding=True)))
+
+            conn.execute(stmt, ids=[1, 2, 3])
+
+          The type of the parameter, if not otherwise given, is that of the
+          elements within the sequence.  An expanding parameter can't be
+          passed an empty sequence, and can't be used with
+          ``executemany()``; the "numeric" paramstyle is not supported.
+
+          .. versionadded:: 1.0.7
+
         .. seealso::
 
             :ref:`coretutorial_bind_param`
@@ -1122,13 +1250,18 @@ class BindParameter(ColumnElement):
         self.callable = callable_
         self.isoutparam = isoutparam
         self.required = required
+        self.expanding = expanding
         if type_ is None:
+            if expanding and value:
+                check_value = value[0]
+            else:
+                check_value = value
             if _compared_to_type is not None:
                 self.type = \
                     _compared_to_type.coerce_compared_value(
-                        _compared_to_operator, value)
+                        _compared_to_operator, check_value)
             else:
-                self.type = type_api._type_map.get(type(value),
+                self.type = type_api._type_map.get(type(check_value),
                                                    type_api.NULLTYPE)
         elif isinstance(type_, type):
             self.type = type_()
@@ -1144,7 +1277,11 @@ class BindParameter(ColumnElement):
         cloned.callable = None
         cloned.required = False
         if cloned.type is type_api.NULLTYPE:
-            cloned.type = type_api._type_map.get(type(value),
+            if cloned.expanding and value:
+                check_value = value[0]
+            else:
+                check_value = value
+            cloned.type = type_api._type_map.get(type(check_value),
                                                  type_api.NULLTYPE)
         return cloned
 
@@ -1176,6 +1313,13 @@ class BindParameter(ColumnElement):
             self.key = _anonymous_label(
                 '%%(%d %s)s' % (id(self), self._orig_key or 'param'))
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        bindparams.append(self)
+        return (
+            self.__class__, _anon_cache_key(self.key, anon_map),
+            self.type._static_cache_key, self.isoutparam, self.expanding
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`BindParameter` to the given
         clause."""
@@ -1212,6 +1356,9 @@ class TypeClause(ClauseElement):
     def __init__(self, type):
         self.type = type
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, self.type._static_cache_key)
+
 
 class TextClause(Executable, ClauseElement):
     """Represent a literal SQL text fragment.
@@ -1601,6 +1748,12 @@ class TextClause(Executable, ClauseElement):
     def get_children(self, **kwargs):
         return list(self._bindparams.values())
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, self.text) + tuple(
+            (name, _cache_key(self._bindparams[name], anon_map, bindparams))
+            for name in sorted(self._bindparams)
+        )
+
     def compare(self, other):
         return isinstance(other, TextClause) and other.text == self.text
 
@@ -1625,6 +1778,9 @@ class Null(ColumnElement):
 
         return Null()
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, )
+
     def compare(self, other):
         return isinstance(other, Null)
 
@@ -1684,6 +1840,9 @@ class False_(ColumnElement):
 
         return False_()
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, )
+
     def compare(self, other):
         return isinstance(other, False_)
 
@@ -1750,6 +1909,9 @@ class True_(ColumnElement):
 
         return True_()
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, )
+
     def compare(self, other):
         return isinstance(other, True_)
 
@@ -1801,6 +1963,13 @@ class ClauseList(ClauseElement):
     def get_children(self, **kwargs):
         return self.clauses
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, _operator_cache_key(self.operator),
+            self.group, self.group_contents,
+            _cache_key_tuple(self.clauses, anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[c._from_objects for c in self.clauses]))
@@ -1832,6 +2001,8 @@ class ClauseList(ClauseElement):
 class BooleanClauseList(ClauseList, ColumnElement):
     __visit_name__ = 'clauselist'
 
+    _inherit_cache_key = True
+
     def __init__(self, *arg, **kw):
         raise NotImplementedError(
             "BooleanClauseList has a private constructor")
@@ -1993,6 +2164,10 @@ class Tuple(ClauseList, ColumnElement):
     def _select_iterable(self):
         return (self, )
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return ClauseList._gen_cache_key(self, anon_map, bindparams) + \
+            (self.type._static_cache_key, )
+
     def _bind_param(self, operator, obj):
         return Tuple(*[
             BindParameter(None, o, _compared_to_operator=operator,
@@ -2201,6 +2376,19 @@ class Case(ColumnElement):
         if self.else_ is not None:
             yield self.else_
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            _cache_key(self.value, anon_map, bindparams),
+            tuple(
+                (_cache_key(x, anon_map, bindparams),
+                 _cache_key(y, anon_map, bindparams))
+                for x, y in self.whens
+            ),
+            _cache_key(self.else_, anon_map, bindparams),
+            self.type._static_cache_key
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[x._from_objects for x in
@@ -2322,6 +2510,13 @@ class Cast(ColumnElement):
     def get_children(self, **kwargs):
         return self.clause, self.typeclause
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            _cache_key(self.clause, anon_map, bindparams),
+            _cache_key(self.typeclause, anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return self.clause._from_objects
@@ -2350,6 +2545,12 @@ class Extract(ColumnElement):
     def get_children(self, **kwargs):
         return self.expr,
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, self.field,
+            _cache_key(self.expr, anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return self.expr._from_objects
@@ -2375,6 +2576,10 @@ class _label_reference(ColumnElement):
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, _cache_key(self.element, anon_map, bindparams))
+
     @property
     def _from_objects(self):
         return ()
@@ -2390,6 +2595,9 @@ class _textual_label_reference(ColumnElement):
     def _text_clause(self):
         return TextClause._create_text(self.element)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, self.element)
+
 
 class UnaryExpression(ColumnElement):
     """Define a 'unary' expression.
@@ -2638,6 +2846,14 @@ class UnaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, _operator_cache_key(self.operator),
+            _operator_cache_key(self.modifier),
+            _cache_key(self.element, anon_map, bindparams),
+            self.type._static_cache_key, self.wraps_column_expression
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`UnaryExpression` against the given
         :class:`.ClauseElement`."""
@@ -2670,6 +2886,8 @@ class UnaryExpression(ColumnElement):
 
 class AsBoolean(UnaryExpression):
 
+    _inherit_cache_key = True
+
     def __init__(self, element, operator, negate):
         self.element = element
         self.type = type_api.BOOLEANTYPE
@@ -2742,6 +2960,15 @@ class BinaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.left, self.right
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, _operator_cache_key(self.operator),
+            _cache_key(self.left, anon_map, bindparams),
+            _cache_key(self.right, anon_map, bindparams),
+            self.type._static_cache_key,
+            tuple(sorted(self.modifiers.items()))
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`BinaryExpression` against the
         given :class:`BinaryExpression`."""
@@ -2805,6 +3032,10 @@ class Grouping(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, _cache_key(self.element, anon_map, bindparams))
+
     @property
     def _from_objects(self):
         return self.element._from_objects
@@ -2893,6 +3124,14 @@ class Over(ColumnElement):
         if self.order_by is not None:
             self.order_by = clone(self.order_by, **kw)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            _cache_key(self.func, anon_map, bindparams),
+            _cache_key(self.partition_by, anon_map, bindparams),
+            _cache_key(self.order_by, anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(
@@ -3008,6 +3247,13 @@ class FunctionFilter(ColumnElement):
         if self.criterion is not None:
             self.criterion = clone(self.criterion, **kw)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            _cache_key(self.func, anon_map, bindparams),
+            _cache_key(self.criterion, anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(
@@ -3102,6 +3348,14 @@ class Label(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, _anon_cache_key(self.name, anon_map),
+            _anon_cache_key(self._resolve_label, anon_map),
+            _cache_key(self._element, anon_map, bindparams),
+            self.type._static_cache_key
+        )
+
     def _copy_internals(self, clone=_clone, anonymize_labels=False, **kw):
         self._element = clone(self._element, **kw)
         self.__dict__.pop('element', None)
@@ -3269,6 +3523,15 @@ class ColumnClause(Immutable, ColumnElement):
         else:
             return other.proxy_set.intersection(self.proxy_set)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, _anon_cache_key(self.name, anon_map),
+            getattr(self.name, 'quote', None),
+            _anon_cache_key(self.key, anon_map), self.is_literal,
+            self.type._static_cache_key,
+            _cache_key(self.table, anon_map, bindparams)
+        )
+
     def _get_table(self):
         return self.__dict__['table']
 
@@ -12,7 +12,7 @@ from . import sqltypes, schema
 from .base import Executable, ColumnCollection
 from .elements import ClauseList, Cast, Extract, _literal_as_binds, \
     literal_column, _type_from_args, ColumnElement, _clone,\
-    Over, BindParameter, FunctionFilter
+    Over, BindParameter, FunctionFilter, _cache_key
 from .selectable import FromClause, Select, Alias
 
 from . import operators
@@ -157,6 +157,14 @@ class FunctionElement(Executable, ColumnElement, FromClause):
         self._reset_exported()
         FunctionElement.clauses._reset(self)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, getattr(self, 'name', None),
+            tuple(self.packagenames),
+            _cache_key(self.clause_expr, anon_map, bindparams),
+            self.type._static_cache_key
+        )
+
     def alias(self, name=None, flat=False):
         """Produce a :class:`.Alias` construct against this
         :class:`.FunctionElement`.
@@ -372,6 +380,8 @@ class Function(FunctionElement):
 
     __visit_name__ = 'function'
 
+    _inherit_cache_key = True
+
     def __init__(self, name, *clauses, **kw):
         """Construct a :class:`.Function`.
 
@@ -403,6 +413,11 @@ class _GenericMeta(VisitableType):
             if '__return_type__' in clsdict:
                 cls.type = clsdict['__return_type__']
             register_function(identifier, cls, package)
+
+            # generic functions are distinguished by their name and
+            # return type, which are part of the cache key
+            if '_gen_cache_key' not in clsdict:
+                cls._inherit_cache_key = True
         super(_GenericMeta, cls).__init__(clsname, bases, clsdict)
 
 
@@ -514,6 +529,9 @@ class next_value(GenericFunction):
         self._bind = kw.get('bind', None)
         self.sequence = seq
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, self.sequence)
+
     @property
     def _from_objects(self):
         return []
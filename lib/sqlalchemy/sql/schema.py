@@ -206,6 +206,10 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         proceed by locating an :class:`.Engine` or :class:`.Connection` bound
         to the underlying :class:`.MetaData` object.
 
+        .. versionchanged:: 1.0.7 An :class:`.Inspector` may also be
+           passed, in which case reflection information already cached
+           by that :class:`.Inspector` is reused.
+
         .. seealso::
 
             :paramref:`.Table.autoload`
@@ -487,10 +491,13 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         # allow user-overrides
         self._init_items(*args)
 
-    def _autoload(self, metadata, autoload_with, include_columns,
+    @util.dependencies("sqlalchemy.engine.reflection")
+    def _autoload(self, reflection, metadata, autoload_with, include_columns,
                   exclude_columns=()):
 
-        if autoload_with:
+        if isinstance(autoload_with, reflection.Inspector):
+            autoload_with.reflecttable(self, include_columns, exclude_columns)
+        elif autoload_with:
             autoload_with.run_callable(
                 autoload_with.dialect.reflecttable,
                 self, include_columns, exclude_columns
@@ -698,6 +705,11 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
             else:
                 return []
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        # a Table is keyed on its identity; the number of columns is
+        # included so that a column appended later produces a new key
+        return (self._deannotate(), len(self._columns))
+
     def exists(self, bind=None):
         """Return True if this table exists."""
 
@@ -858,6 +870,8 @@ class Column(SchemaItem, ColumnClause):
 
     __visit_name__ = 'column'
 
+    _inherit_cache_key = True
+
     def __init__(self, *args, **kwargs):
         """
         Construct a new ``Column`` object.
@@ -3475,9 +3489,10 @@ class MetaData(SchemaItem):
         """
         return ddl.sort_tables(sorted(self.tables.values(), key=lambda t: t.key))
 
-    def reflect(self, bind=None, schema=None, views=False, only=None,
-                extend_existing=False,
-                autoload_replace=True,
+    @util.dependencies("sqlalchemy.engine.reflection")
+    def reflect(self, reflection, bind=None, schema=None, views=False,
+                only=None, extend_existing=False,
+                autoload_replace=True, snapshot=None,
                 **dialect_kwargs):
         """Load all available table definitions from the database.
 
@@ -3523,6 +3538,12 @@ class MetaData(SchemaItem):
 
           .. versionadded:: 0.9.1
 
+        :param snapshot: a :class:`.ReflectionSnapshot` in which the
+          reflected information is stored, and from which it is loaded
+          without querying the database when the schema hasn't changed.
+
+          .. versionadded:: 1.0.7
+
         :param \**dialect_kwargs: Additional keyword arguments not mentioned
          above are dialect specific, and passed in the form
          ``<dialectname>_<argname>``.  See the documentation regarding an
@@ -3539,10 +3560,11 @@ class MetaData(SchemaItem):
             bind = _bind_or_error(self)
 
         with bind.connect() as conn:
+            insp = reflection.Inspector.from_engine(conn)
 
             reflect_opts = {
                 'autoload': True,
-                'autoload_with': conn,
+                'autoload_with': insp,
                 'extend_existing': extend_existing,
                 'autoload_replace': autoload_replace
             }
@@ -3555,12 +3577,13 @@ class MetaData(SchemaItem):
             if schema is not None:
                 reflect_opts['schema'] = schema
 
-            available = util.OrderedSet(
-                bind.engine.table_names(schema, connection=conn))
+            if snapshot is not None:
+                fingerprint = snapshot.restore(insp, schema)
+                restored = len(insp.info_cache)
+
+            available = util.OrderedSet(insp.get_table_names(schema))
             if views:
-                available.update(
-                    bind.dialect.get_view_names(conn, schema)
-                )
+                available.update(insp.get_view_names(schema))
 
             if schema is not None:
                 available_w_schema = util.OrderedSet(["%s.%s" % (schema, name)
@@ -3590,9 +3613,16 @@ class MetaData(SchemaItem):
                 load = [name for name in only if extend_existing or
                         name not in current]
 
+            if len(load) > 1:
+                insp._prefetch_reflection(load, schema)
+
             for name in load:
                 Table(name, self, **reflect_opts)
 
+            if snapshot is not None and fingerprint is not None and \
+                    len(insp.info_cache) != restored:
+                snapshot.save(insp, fingerprint, schema)
+
     def append_ddl_listener(self, event_name, listener):
         """Append a DDL event listener to this ``MetaData``.
 
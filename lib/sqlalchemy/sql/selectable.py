@@ -16,7 +16,9 @@ from .elements import _clone, \
     _literal_as_text, _interpret_as_column_or_from, _expand_cloned,\
     _select_iterables, _anonymous_label, _clause_element_as_expr,\
     _cloned_intersection, _cloned_difference, True_, \
-    _literal_as_label_reference, _literal_and_labels_as_label_reference
+    _literal_as_label_reference, _literal_and_labels_as_label_reference, \
+    _cache_key, _cache_key_tuple, _cache_key_ref, _anon_cache_key, \
+    _NoCacheKey
 from .base import Immutable, Executable, _generative, \
     ColumnCollection, ColumnSet, _from_objects, Generative
 from . import type_api
@@ -58,11 +60,36 @@ def _interpret_as_select(element):
     return element
 
 
+def _cache_key_set(elements, anon_map, bindparams):
+    """Return a cache key for an unordered collection of elements,
+    such as the FROM objects passed to :meth:`.Select.correlate`.
+
+    As the collection has no deterministic ordering, elements which
+    contain bound parameters can't be keyed.
+
+    """
+    if elements is None:
+        return None
+    unordered_bindparams = []
+    key = frozenset(
+        _cache_key(elem, anon_map, unordered_bindparams)
+        for elem in elements)
+    if unordered_bindparams:
+        raise _NoCacheKey()
+    return key
+
+
 class _OffsetLimitParam(BindParameter):
     @property
     def _limit_offset_value(self):
         return self.effective_value
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        # several dialects render LIMIT / OFFSET as literal integers,
+        # so the value is part of the key
+        return BindParameter._gen_cache_key(self, anon_map, bindparams) + \
+            (self.effective_value, )
+
 
 def _offset_or_limit_clause(element, name=None, type_=None):
     """Convert the given value to an "offset or limit" clause.
@@ -783,6 +810,18 @@ class Join(FromClause):
     def get_children(self, **kwargs):
         return self.left, self.right, self.onclause
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        ref = _cache_key_ref(self, anon_map)
+        if ref is not None:
+            return ref
+        return (
+            self.__class__,
+            _cache_key(self.left, anon_map, bindparams),
+            _cache_key(self.right, anon_map, bindparams),
+            _cache_key(self.onclause, anon_map, bindparams),
+            self.isouter
+        )
+
     def _match_primaries(self, left, right):
         if isinstance(left, Join):
             left_right = left.right
@@ -1153,6 +1192,16 @@ class Alias(FromClause):
                 yield c
         yield self.element
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        ref = _cache_key_ref(self, anon_map)
+        if ref is not None:
+            return ref
+        return (
+            self.__class__, _anon_cache_key(self.name, anon_map),
+            getattr(self.name, 'quote', None),
+            _cache_key(self.element, anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return [self]
@@ -1253,6 +1302,10 @@ class FromGrouping(FromClause):
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, _cache_key(self.element, anon_map, bindparams))
+
     @property
     def _from_objects(self):
         return self.element._from_objects
@@ -1353,6 +1406,18 @@ class TableClause(Immutable, FromClause):
         else:
             return []
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        ref = _cache_key_ref(self, anon_map)
+        if ref is not None:
+            return ref
+        return (
+            self.__class__, self.name, getattr(self.name, 'quote', None),
+            tuple(
+                (c.key, c.name, c.type._static_cache_key)
+                for c in self._columns
+            )
+        )
+
     @util.dependencies("sqlalchemy.sql.functions")
     def count(self, functions, whereclause=None, **params):
         """return a SELECT COUNT generated against this
@@ -1474,6 +1539,13 @@ class ForUpdateArg(ClauseElement):
         if self.of is not None:
             self.of = [clone(col, **kw) for col in self.of]
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, self.nowait, self.read,
+            _cache_key_tuple(self.of, anon_map, bindparams)
+            if self.of is not None else None
+        )
+
     def __init__(self, nowait=False, read=False, of=None):
         """Represents arguments specified to :meth:`.Select.for_update`.
 
@@ -2184,6 +2256,21 @@ class CompoundSelect(GenerativeSelect):
             + [self._order_by_clause, self._group_by_clause] \
             + list(self.selects)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        ref = _cache_key_ref(self, anon_map)
+        if ref is not None:
+            return ref
+        return (
+            self.__class__, self.keyword,
+            _cache_key_tuple(self.selects, anon_map, bindparams),
+            _cache_key(self._order_by_clause, anon_map, bindparams),
+            _cache_key(self._group_by_clause, anon_map, bindparams),
+            _cache_key(self._limit_clause, anon_map, bindparams),
+            _cache_key(self._offset_clause, anon_map, bindparams),
+            _cache_key(self._for_update_arg, anon_map, bindparams),
+            self.use_labels
+        )
+
     def bind(self):
         if self._bind:
             return self._bind
@@ -2750,6 +2837,46 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
                     self._order_by_clause, self._group_by_clause)
              if x is not None]
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        ref = _cache_key_ref(self, anon_map)
+        if ref is not None:
+            return ref
+
+        # the FROM list is keyed in its final form, as it
+        # also reflects the translation of cloned FROM objects
+        return (
+            self.__class__,
+            tuple(
+                (_cache_key(elem, anon_map, bindparams), dialect_name)
+                for elem, dialect_name in self._prefixes
+            ),
+            _cache_key_tuple(self._raw_columns, anon_map, bindparams),
+            _cache_key_tuple(self._froms, anon_map, bindparams),
+            _cache_key(self._whereclause, anon_map, bindparams),
+            _cache_key(self._having, anon_map, bindparams),
+            _cache_key(self._order_by_clause, anon_map, bindparams),
+            _cache_key(self._group_by_clause, anon_map, bindparams),
+            self._distinct if isinstance(self._distinct, bool)
+            else _cache_key_tuple(self._distinct, anon_map, bindparams),
+            _cache_key(self._limit_clause, anon_map, bindparams),
+            _cache_key(self._offset_clause, anon_map, bindparams),
+            _cache_key(self._for_update_arg, anon_map, bindparams),
+            self._auto_correlate,
+            _cache_key_set(self._correlate, anon_map, bindparams),
+            _cache_key_set(self._correlate_except, anon_map, bindparams),
+            frozenset(
+                (_cache_key_set([selectable], anon_map, bindparams),
+                 dialect_name, hint)
+                for (selectable, dialect_name), hint in self._hints.items()
+            ),
+            self._statement_hints,
+            tuple(
+                (_cache_key(elem, anon_map, bindparams), dialect_name)
+                for elem, dialect_name in self._suffixes
+            ),
+            self.use_labels
+        )
+
     @_generative
     def column(self, column):
         """return a new select() construct with the given column expression
@@ -3310,6 +3437,12 @@ class ScalarSelect(Generative, Grouping):
     def self_group(self, **kwargs):
         return self
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__, _cache_key(self.element, anon_map, bindparams),
+            self.type._static_cache_key
+        )
+
 
 class Exists(UnaryExpression):
     """Represent an ``EXISTS`` clause.
@@ -3317,6 +3450,7 @@ class Exists(UnaryExpression):
     """
     __visit_name__ = UnaryExpression.__visit_name__
     _from_objects = []
+    _inherit_cache_key = True
 
     def __init__(self, *args, **kwargs):
         """Construct a new :class:`.Exists` against an existing
@@ -3424,6 +3558,16 @@ class TextAsFrom(SelectBase):
         self._reset_exported()
         self.element = clone(self.element, **kw)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        ref = _cache_key_ref(self, anon_map)
+        if ref is not None:
+            return ref
+        return (
+            self.__class__,
+            _cache_key(self.element, anon_map, bindparams),
+            _cache_key_tuple(self.column_args, anon_map, bindparams)
+        )
+
     def _scalar_type(self):
         return self.column_args[0].type
 
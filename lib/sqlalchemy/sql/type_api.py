@@ -350,6 +350,28 @@ class TypeEngine(Visitable):
         else:
             return self.__class__
 
+    @util.memoized_property
+    def _static_cache_key(self):
+        """Return a hashable key representing the class and state of
+        this type, for use within the cache key of a statement.
+
+        Types having unhashable state are keyed on their identity.
+
+        """
+        cls = self.__class__
+        try:
+            key = (cls, ) + tuple(
+                (name, _cache_key_value(value))
+                for name, value in sorted(self.__dict__.items())
+                if not isinstance(
+                    getattr(cls, name, None), util.memoized_property)
+            )
+            hash(key)
+        except TypeError:
+            return self
+        else:
+            return key
+
     def dialect_impl(self, dialect):
         """Return a dialect-specific implementation for this
         :class:`.TypeEngine`.
@@ -1130,6 +1152,20 @@ class Variant(TypeDecorator):
         return self.impl.comparator_factory
 
 
+def _cache_key_value(value):
+    if isinstance(value, TypeEngine):
+        return value._static_cache_key
+    elif isinstance(value, (list, tuple)):
+        return tuple(_cache_key_value(elem) for elem in value)
+    elif isinstance(value, dict):
+        return tuple(
+            (key, _cache_key_value(elem))
+            for key, elem in sorted(value.items())
+        )
+    else:
+        return value
+
+
 def _reconstitute_comparator(expression):
     return expression.comparator
 
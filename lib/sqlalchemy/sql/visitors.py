@@ -50,6 +50,11 @@ class VisitableType(type):
             return getattr(visitor, visit_attr)(self, **kw)
 
     Classes having no __visit_name__ attribute will remain unaffected.
+
+    Additionally, a class which inherits a ``_gen_cache_key`` method,
+    but neither defines its own nor sets ``_inherit_cache_key = True``,
+    receives a ``_gen_cache_key`` that returns ``None``; constructs of
+    unknown structure are therefore never cached.
     """
 
     def __init__(cls, clsname, bases, clsdict):
@@ -57,9 +62,18 @@ class VisitableType(type):
                 hasattr(cls, '__visit_name__'):
             _generate_dispatch(cls)
 
+        if '_gen_cache_key' not in cls.__dict__ and \
+                not cls.__dict__.get('_inherit_cache_key', False) and \
+                hasattr(cls, '_gen_cache_key'):
+            cls._gen_cache_key = _no_cache_key
+
         super(VisitableType, cls).__init__(clsname, bases, clsdict)
 
 
+def _no_cache_key(self, anon_map, bindparams):
+    return None
+
+
 def _generate_dispatch(cls):
     """Return an optimized visit dispatch function for the cls
     for use by the compiler.
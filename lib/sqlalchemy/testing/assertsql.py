@@ -75,12 +75,14 @@ class CompiledSQL(SQLMatchRule):
 
         context = execute_observed.context
         compare_dialect = self._compile_dialect(execute_observed)
-        if isinstance(context.compiled.statement, _DDLCompiles):
-            compiled = \
-                context.compiled.statement.compile(dialect=compare_dialect)
+        statement = context.invoked_statement
+        if statement is None:
+            statement = context.compiled.statement
+        if isinstance(statement, _DDLCompiles):
+            compiled = statement.compile(dialect=compare_dialect)
         else:
             compiled = (
-                context.compiled.statement.compile(
+                statement.compile(
                     dialect=compare_dialect,
                     column_keys=context.compiled.column_keys,
                     inline=context.compiled.inline)
@@ -110,7 +110,12 @@ class EnsureZeroed(fixtures.ORMTest):
     def setup(self):
         _sessions.clear()
         _mapper_registry.clear()
-        self.engine = engines.testing_engine(options={"use_reaper": False})
+
+        # the compiled cache retains the statements of mappings which
+        # are discarded, up to its capacity; keep it small so that the
+        # object count levels off early on
+        self.engine = engines.testing_engine(
+            options={"use_reaper": False, "compiled_cache_size": 10})
 
 
 class MemUsageTest(EnsureZeroed):
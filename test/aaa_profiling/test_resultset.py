@@ -40,7 +40,12 @@ class ResultSetTest(fixtures.TestBase, AssertsExecutionResults):
         t.select().execute().fetchall()
         t2.select().execute().fetchall()
 
+        self.conn = testing.db.connect()
+        self.compiled = t.select().compile(dialect=testing.db.dialect)
+        self.conn.execute(self.compiled).close()
+
     def teardown(self):
+        self.conn.close()
         metadata.drop_all()
 
     @profiling.function_call_count()
@@ -51,6 +56,15 @@ class ResultSetTest(fixtures.TestBase, AssertsExecutionResults):
     def test_unicode(self):
         [tuple(row) for row in t2.select().execute().fetchall()]
 
+    @profiling.function_call_count()
+    def test_compiled_reexecute(self):
+        # the ResultMetaData built for the first execution is
+        # shared by each subsequent one
+        compiled = self.compiled
+        conn = self.conn
+        for i in range(100):
+            conn.execute(compiled).close()
+
     def test_contains_doesnt_compile(self):
         row = t.select().execute().first()
         c1 = Column('some column', Integer) + \
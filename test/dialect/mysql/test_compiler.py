@@ -11,6 +11,7 @@ from sqlalchemy import Table, MetaData, Column, select, String, \
     BOOLEAN, LargeBinary, BLOB, SmallInteger, INT, func, cast
 
 from sqlalchemy.dialects.mysql import base as mysql
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.testing import fixtures, AssertsCompiledSQL
 from sqlalchemy.sql import table, column
 import re
@@ -572,3 +573,84 @@ class SQLTest(fixtures.TestBase, AssertsCompiledSQL):
             'PRIMARY KEY (id, other_id)'
             ')PARTITION BY HASH(other_id) PARTITIONS 2'
         )
+
+
+class InsertOnDuplicateTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = mysql.dialect()
+
+    def setup(self):
+        self.table = Table(
+            'foos', MetaData(),
+            Column('id', Integer, primary_key=True),
+            Column('bar', String(10)),
+            Column('baz', String(10)),
+        )
+
+    def test_from_values(self):
+        stmt = insert(self.table).values(
+            [{'id': 1, 'bar': 'ab'}, {'id': 2, 'bar': 'b'}])
+        stmt = stmt.on_duplicate_key_update(
+            bar=stmt.inserted.bar, baz=stmt.inserted.baz)
+        expected_sql = (
+            'INSERT INTO foos (id, bar) VALUES (%s, %s), (%s, %s) '
+            'ON DUPLICATE KEY UPDATE bar = VALUES(bar), baz = VALUES(baz)'
+        )
+        self.assert_compile(stmt, expected_sql)
+
+    def test_from_literal(self):
+        stmt = insert(self.table).values(
+            [{'id': 1, 'bar': 'ab'}, {'id': 2, 'bar': 'b'}])
+        stmt = stmt.on_duplicate_key_update(bar=self.table.c.bar)
+        expected_sql = (
+            'INSERT INTO foos (id, bar) VALUES (%s, %s), (%s, %s) '
+            'ON DUPLICATE KEY UPDATE bar = foos.bar'
+        )
+        self.assert_compile(stmt, expected_sql)
+
+    def test_literal_values(self):
+        stmt = insert(self.table).values(id=1, bar='ab')
+        stmt = stmt.on_duplicate_key_update(baz='newbz')
+        self.assert_compile(
+            stmt,
+            'INSERT INTO foos (id, bar) VALUES (%s, %s) '
+            'ON DUPLICATE KEY UPDATE baz = %s',
+            checkparams={'id': 1, 'bar': 'ab', 'param_1': 'newbz'}
+        )
+
+    def test_none_value(self):
+        stmt = insert(self.table).values(id=1, bar='ab')
+        stmt = stmt.on_duplicate_key_update(baz=None)
+        self.assert_compile(
+            stmt,
+            'INSERT INTO foos (id, bar) VALUES (%s, %s) '
+            'ON DUPLICATE KEY UPDATE baz = NULL',
+            checkparams={'id': 1, 'bar': 'ab'}
+        )
+
+    def test_executemany_values_expr(self):
+        stmt = insert(self.table)
+        stmt = stmt.on_duplicate_key_update(bar=stmt.inserted.bar)
+        compiled = stmt.compile(
+            dialect=self.__dialect__, column_keys=['id', 'bar'])
+        eq_(compiled.insert_single_values_expr, '%s, %s')
+        eq_(
+            str(compiled),
+            'INSERT INTO foos (id, bar) VALUES (%s, %s) '
+            'ON DUPLICATE KEY UPDATE bar = VALUES(bar)'
+        )
+
+    def test_unknown_column(self):
+        stmt = insert(self.table).on_duplicate_key_update(nonexistent='x')
+        assert_raises_message(
+            exc.CompileError,
+            "Unconsumed column names in ON DUPLICATE KEY UPDATE: "
+            "nonexistent",
+            stmt.compile, dialect=self.__dialect__
+        )
+
+    def test_empty_update(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "update parameter must be a non-empty dictionary",
+            insert(self.table).on_duplicate_key_update
+        )
@@ -0,0 +1,80 @@
+from sqlalchemy.testing import fixtures, eq_
+from sqlalchemy.testing.assertions import assert_raises
+from sqlalchemy import exc, testing
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy import Table, Column, Integer, String, func
+
+
+class OnDuplicateTest(fixtures.TablesTest):
+    __only_on__ = 'mysql',
+    __backend__ = True
+    run_define_tables = 'each'
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'foos', metadata,
+            Column('id', Integer, primary_key=True, autoincrement=True),
+            Column('bar', String(10)),
+            Column('baz', String(10)),
+            Column('updated_once', Integer, default=0),
+        )
+
+    def test_bad_args(self):
+        assert_raises(
+            exc.ArgumentError,
+            insert(self.tables.foos, values={}).on_duplicate_key_update
+        )
+
+    def test_on_duplicate_key_update(self):
+        foos = self.tables.foos
+        with testing.db.connect() as conn:
+            conn.execute(insert(foos, dict(id=1, bar='b', baz='bz')))
+            stmt = insert(foos).values(
+                [dict(id=1, bar='ab'), dict(id=2, bar='b')])
+            stmt = stmt.on_duplicate_key_update(bar=stmt.inserted.bar)
+            conn.execute(stmt)
+            eq_(
+                conn.execute(foos.select().order_by(foos.c.id)).fetchall(),
+                [(1, 'ab', 'bz', 0), (2, 'b', None, 0)]
+            )
+
+    def test_on_duplicate_key_update_executemany(self):
+        foos = self.tables.foos
+        with testing.db.connect() as conn:
+            conn.execute(
+                insert(foos),
+                [dict(id=1, bar='b', baz='bz'), dict(id=2, bar='b')])
+            stmt = insert(foos)
+            stmt = stmt.on_duplicate_key_update(
+                bar=stmt.inserted.bar,
+                updated_once=foos.c.updated_once + 1)
+            conn.execute(
+                stmt,
+                [dict(id=1, bar='ab'), dict(id=2, bar='bb'),
+                 dict(id=3, bar='cb')])
+            eq_(
+                conn.execute(foos.select().order_by(foos.c.id)).fetchall(),
+                [(1, 'ab', 'bz', 1), (2, 'bb', None, 1), (3, 'cb', None, 0)]
+            )
+
+    def test_last_inserted_id(self):
+        foos = self.tables.foos
+        with testing.db.connect() as conn:
+            stmt = insert(foos).values({"bar": "b", "baz": "bz"})
+            result = conn.execute(
+                stmt.on_duplicate_key_update(
+                    bar=stmt.inserted.bar, baz="newbz")
+            )
+            eq_(result.inserted_primary_key, [1])
+
+            stmt = insert(foos).values({"id": 1, "bar": "b", "baz": "bz"})
+            result = conn.execute(
+                stmt.on_duplicate_key_update(
+                    bar=stmt.inserted.bar, baz="newbz")
+            )
+            eq_(result.inserted_primary_key, [1])
+            eq_(
+                conn.scalar(func.count(foos.c.id)),
+                1
+            )
@@ -4,8 +4,14 @@ from sqlalchemy.testing import eq_
 from sqlalchemy import *
 from sqlalchemy import sql
 from sqlalchemy.dialects.mysql import base as mysql
-from sqlalchemy.testing import fixtures, AssertsExecutionResults
+from sqlalchemy.engine.reflection import ReflectionSnapshot
+from sqlalchemy.testing import fixtures, AssertsExecutionResults, \
+    ComparesTables
+from sqlalchemy.testing import mock
 from sqlalchemy import testing
+import os
+import shutil
+import tempfile
 
 
 class ReflectionTest(fixtures.TestBase, AssertsExecutionResults):
@@ -376,6 +382,145 @@ class ReflectionTest(fixtures.TestBase, AssertsExecutionResults):
         self.assert_(indexes['uc_a'].unique)
         self.assert_('uc_a' not in constraints)
 
+    @testing.provide_metadata
+    def test_bulk_reflection_matches_per_table(self):
+        meta = self.metadata
+        Table('mysql_bulk_a', meta,
+              Column('id', Integer, primary_key=True),
+              Column('name', String(30), nullable=False,
+                     server_default='some name'),
+              Column('ts', TIMESTAMP, nullable=False,
+                     server_default=text(
+                         'CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP')),
+              Index('ix_name', 'name', unique=True),
+              mysql_engine='InnoDB',
+              mysql_comment="it's a table")
+        Table('mysql_bulk_b', meta,
+              Column('id', Integer, primary_key=True),
+              Column('a_id', Integer,
+                     ForeignKey('mysql_bulk_a.id', ondelete='CASCADE')),
+              Column('data', Numeric(10, 2)),
+              mysql_engine='InnoDB')
+        meta.create_all()
+
+        bulk = MetaData()
+        bulk.reflect(testing.db, only=['mysql_bulk_a', 'mysql_bulk_b'])
+
+        for name in ('mysql_bulk_a', 'mysql_bulk_b'):
+            single = Table(name, MetaData(testing.db), autoload=True)
+            reflected = bulk.tables[name]
+            eq_(
+                [(c.name, repr(c.type), c.nullable, c.primary_key,
+                  c.server_default is not None and
+                  str(c.server_default.arg) or None)
+                 for c in reflected.c],
+                [(c.name, repr(c.type), c.nullable, c.primary_key,
+                  c.server_default is not None and
+                  str(c.server_default.arg) or None)
+                 for c in single.c]
+            )
+            eq_(
+                sorted((i.name, i.unique, [c.name for c in i.columns])
+                       for i in reflected.indexes),
+                sorted((i.name, i.unique, [c.name for c in i.columns])
+                       for i in single.indexes)
+            )
+            eq_(
+                sorted((fk.parent.name, fk.target_fullname, fk.ondelete)
+                       for fk in reflected.foreign_keys),
+                sorted((fk.parent.name, fk.target_fullname, fk.ondelete)
+                       for fk in single.foreign_keys)
+            )
+            eq_(reflected.dialect_kwargs, single.dialect_kwargs)
+
+
+class ReflectionSnapshotTest(fixtures.TablesTest, ComparesTables,
+                             AssertsExecutionResults):
+    __only_on__ = 'mysql'
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('snap_a', metadata,
+              Column('id', Integer, primary_key=True),
+              Column('name', String(30)),
+              mysql_engine='InnoDB')
+        Table('snap_b', metadata,
+              Column('id', Integer, primary_key=True),
+              Column('a_id', Integer, ForeignKey('snap_a.id')),
+              mysql_engine='InnoDB')
+
+    def setup(self):
+        self.dir = tempfile.mkdtemp()
+        self.snapshot = ReflectionSnapshot(
+            os.path.join(self.dir, 'snapshot.pickle'))
+
+    def teardown(self):
+        shutil.rmtree(self.dir)
+
+    def _reflect(self):
+        m = MetaData()
+        m.reflect(testing.db, only=['snap_a', 'snap_b'],
+                  snapshot=self.snapshot)
+        return m
+
+    def test_snapshot_skips_reflection(self):
+        m1 = self._reflect()
+
+        reflected = []
+
+        def go():
+            reflected.append(self._reflect())
+        # only the fingerprint query is emitted
+        self.assert_sql_count(testing.db, go, 1)
+        m2 = reflected[0]
+
+        eq_(sorted(m2.tables), sorted(m1.tables))
+        for name in ('snap_a', 'snap_b'):
+            self.assert_tables_equal(m1.tables[name], m2.tables[name])
+
+    def test_invalidate(self):
+        self._reflect()
+        self.snapshot.invalidate(testing.db.url)
+
+        dialect = testing.db.dialect
+        with mock.patch.object(
+                dialect, '_setup_parser',
+                side_effect=dialect._setup_parser) as setup_parser:
+            m = MetaData()
+            m.reflect(testing.db, only=['snap_a'], snapshot=self.snapshot)
+        eq_(len(setup_parser.mock_calls), 1)
+        eq_(list(m.tables), ['snap_a'])
+
+
+class ReflectionSnapshotFileTest(fixtures.TestBase):
+    def setup(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'snapshot.pickle')
+
+    def teardown(self):
+        shutil.rmtree(self.dir)
+
+    def _assert_empty(self, content):
+        with open(self.path, 'wb') as file_:
+            file_.write(content)
+        eq_(ReflectionSnapshot(self.path)._load(), {})
+
+    def test_missing(self):
+        eq_(ReflectionSnapshot(self.path)._load(), {})
+
+    def test_truncated(self):
+        self._assert_empty(b'')
+
+    def test_corrupt(self):
+        self._assert_empty(b'not a pickle')
+
+    def test_missing_module(self):
+        self._assert_empty(b'cnonexistent_module_xyz\nSomeClass\n.')
+
+    def test_missing_class(self):
+        self._assert_empty(b'csqlalchemy.types\nNonexistentType\n.')
+
 
 class RawReflectionTest(fixtures.TestBase):
     def setup(self):
@@ -414,4 +559,152 @@ class RawReflectionTest(fixtures.TestBase):
         eq_(m.groups(), ('addresses_user_id_fkey', '`user_id`',
                             '`users`', '`id`', None, 'CASCADE', 'SET NULL'))
 
+    def _information_schema_parse(self, columns, keys=(), constraints=(),
+                                  options=''):
+        dialect = self.parser.dialect
+        quote = self.parser.preparer.quote_identifier
+        collations = {
+            'latin1_swedish_ci': ('latin1', True),
+            'latin1_bin': ('latin1', False),
+            'utf8_general_ci': ('utf8', True)
+        }
+        lines = [
+            dialect._information_schema_column(
+                ('t', ) + col, 'latin1', collations, quote)
+            for col in columns
+        ] + [
+            dialect._information_schema_key(name, rows, quote)
+            for name, rows in keys
+        ] + [
+            dialect._information_schema_constraint(name, rows, 'test', quote)
+            for name, rows in constraints
+        ]
+        return self.parser.parse(
+            "CREATE TABLE `t` (\n%s\n) %s" % (",\n".join(lines), options),
+            'utf8')
+
+    def test_information_schema_columns(self):
+        state = self._information_schema_parse([
+            ('id', 'int(11)', 'NO', None, 'auto_increment', None, None),
+            ('name', 'varchar(30)', 'YES', "it's", '', 'latin1',
+             'latin1_swedish_ci'),
+            ('code', 'varchar(10)', 'NO', None, '', 'utf8',
+             'utf8_general_ci'),
+            ('bin', 'varchar(10)', 'YES', None, '', 'latin1', 'latin1_bin'),
+            ('ts', 'timestamp', 'NO', 'CURRENT_TIMESTAMP',
+             'on update CURRENT_TIMESTAMP', None, None),
+        ], keys=[
+            ('PRIMARY', [('t', 'PRIMARY', 0, 'BTREE', 'id', None)]),
+            ('ix_code', [('t', 'ix_code', 0, 'BTREE', 'code', None),
+                         ('t', 'ix_code', 0, 'BTREE', 'name', 5)]),
+        ])
+        eq_(
+            [(col['name'], col['nullable'], col['default'])
+             for col in state.columns],
+            [('id', False, None), ('name', True, "'it''s'"),
+             ('code', False, None), ('bin', True, None),
+             ('ts', False,
+              'CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP')]
+        )
+        eq_(state.columns[0]['autoincrement'], True)
+        eq_(state.columns[2]['type'].charset, 'utf8')
+        eq_(state.columns[3]['type'].collation, 'latin1_bin')
+        eq_(
+            [(key['type'], key['name'], key['columns'])
+             for key in state.keys],
+            [('PRIMARY', None, [('id', '')]),
+             ('UNIQUE', 'ix_code', [('code', ''), ('name', '5')])]
+        )
+
+    def test_information_schema_constraints(self):
+        state = self._information_schema_parse([
+            ('id', 'int(11)', 'NO', None, '', None, None),
+            ('a_id', 'int(11)', 'YES', None, '', None, None),
+        ], constraints=[
+            ('fk_a', [('t', 'fk_a', 'a_id', 'test', 'a', 'id',
+                       'CASCADE', 'RESTRICT')]),
+            ('fk_b', [('t', 'fk_b', 'a_id', 'other', 'b', 'id',
+                       'RESTRICT', 'SET NULL')]),
+        ], options="ENGINE=InnoDB DEFAULT CHARSET=latin1")
+        eq_(
+            [(c['name'], c['table'], c['local'], c['foreign'], c['onupdate'],
+              c['ondelete']) for c in state.constraints],
+            [('fk_a', ['a'], ['a_id'], ['id'], None, 'CASCADE'),
+             ('fk_b', ['other', 'b'], ['a_id'], ['id'], 'SET NULL', None)]
+        )
+        eq_(state.table_options['mysql_engine'], 'InnoDB')
+
+    def test_information_schema_column_parity(self):
+        dialect = self.parser.dialect
+        quote = self.parser.preparer.quote_identifier
+        for row, quoted_defaults, show_create in [
+            (('name', 'varchar(30)', 'YES', "it's", '', None, None),
+             False, "  `name` varchar(30) DEFAULT 'it''s'"),
+            (('d', 'date', 'YES', 'curdate()', 'DEFAULT_GENERATED',
+              None, None),
+             False, "  `d` date DEFAULT (curdate())"),
+            (('ts', 'timestamp', 'NO', 'CURRENT_TIMESTAMP',
+              'DEFAULT_GENERATED on update CURRENT_TIMESTAMP', None, None),
+             False,
+             "  `ts` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP "
+             "ON UPDATE CURRENT_TIMESTAMP"),
+            (('name', 'varchar(30)', 'YES', "'it''s'", '', None, None),
+             True, "  `name` varchar(30) DEFAULT 'it''s'"),
+            (('name', 'varchar(30)', 'YES', 'NULL', '', None, None),
+             True, "  `name` varchar(30) DEFAULT NULL"),
+            (('n', 'int(11)', 'NO', '5', '', None, None),
+             True, "  `n` int(11) NOT NULL DEFAULT 5"),
+            (('ts', 'timestamp', 'NO', 'current_timestamp()',
+              'on update current_timestamp()', None, None),
+             True,
+             "  `ts` timestamp NOT NULL DEFAULT current_timestamp() "
+             "ON UPDATE current_timestamp()"),
+        ]:
+            eq_(
+                dialect._information_schema_column(
+                    ('t', ) + row, 'latin1', {}, quote,
+                    quoted_defaults=quoted_defaults),
+                show_create
+            )
+
+    def test_information_schema_key_parity(self):
+        dialect = self.parser.dialect
+        quote = self.parser.preparer.quote_identifier
+        for name, rows, engine, show_create in [
+            ('ix', [('t', 'ix', 1, 'BTREE', 'a', None)], 'InnoDB',
+             "  KEY `ix` (`a`)"),
+            ('ix', [('t', 'ix', 1, 'HASH', 'a', None)], 'MEMORY',
+             "  KEY `ix` (`a`)"),
+            ('ix', [('t', 'ix', 0, 'BTREE', 'a', None)], 'MEMORY',
+             "  UNIQUE KEY `ix` (`a`) USING BTREE"),
+            ('PRIMARY', [('t', 'PRIMARY', 0, 'BTREE', 'id', None)],
+             'MEMORY', "  PRIMARY KEY (`id`) USING BTREE"),
+            ('ix', [('t', 'ix', 1, 'FULLTEXT', 'a', None)], 'InnoDB',
+             "  FULLTEXT KEY `ix` (`a`)"),
+        ]:
+            eq_(
+                dialect._information_schema_key(
+                    name, rows, quote, engine=engine),
+                show_create
+            )
 
+    def test_prefetch_no_server_version(self):
+        dialect = mysql.dialect()
+        dialect.server_version_info = None
+        connection = mock.Mock()
+        info_cache = {}
+        dialect._prefetch_reflection(
+            connection, ['t'], info_cache=info_cache)
+        eq_(info_cache, {})
+        eq_(connection.mock_calls, [])
+
+    def test_mariadb_version_info(self):
+        dialect = mysql.dialect()
+        for version, expected in [
+            ((5, 6, 10), None),
+            ((10, 2, 7, 'MariaDB'), (10, 2, 7)),
+            ((5, 5, 5, 10, 1, 3, 'MariaDB', 'log'), (10, 1, 3)),
+            (None, None),
+        ]:
+            dialect.server_version_info = version
+            eq_(dialect._mariadb_version_info, expected)
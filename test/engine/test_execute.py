@@ -805,6 +805,163 @@ class CompiledCacheTest(fixtures.TestBase):
         eq_(compile_mock.call_count, 1)
         eq_(len(cache), 1)
 
+    def _cache_engine(self, size):
+        eng = testing_engine(options={"compiled_cache_size": size})
+        # a new engine against an in-memory SQLite database has a
+        # database of its own
+        metadata.create_all(eng)
+        return eng
+
+    def _user_select(self, name):
+        return select([users.c.user_id, users.c.user_name.label('name')]).\
+            where(users.c.user_name == name).order_by(users.c.user_id)
+
+    def test_engine_cache(self):
+        eng = self._cache_engine(10)
+        eng.execute(users.insert(), [
+            {"user_id": 1, "user_name": "u1"},
+            {"user_id": 2, "user_name": "u2"},
+            {"user_id": 3, "user_name": "u3"}
+        ])
+        cache = eng.compiled_cache
+        cache.clear()
+
+        for id_, name in [(1, "u1"), (2, "u2"), (3, "u3")]:
+            stmt = self._user_select(name)
+            row = eng.execute(stmt).first()
+            eq_(row[stmt.c.user_id], id_)
+            eq_(row[stmt.c.name], name)
+            eq_(row["name"], name)
+
+        eq_(
+            cache.stats(),
+            {"hits": 2, "misses": 1, "evictions": 0,
+             "size": 1, "capacity": 10}
+        )
+
+    def test_engine_cache_dml(self):
+        eng = self._cache_engine(10)
+        cache = eng.compiled_cache
+
+        for id_ in range(1, 4):
+            eng.execute(
+                users.insert().values(
+                    user_id=bindparam("id"), user_name=bindparam("name")),
+                id=id_, name="u%d" % id_)
+        for id_ in range(1, 4):
+            eng.execute(
+                users.update().where(users.c.user_id == id_).
+                values(extra_data=bindparam("data")),
+                data="e%d" % id_)
+        eq_(cache.hits, 4)
+        eq_(
+            eng.execute(
+                select([users.c.user_name, users.c.extra_data]).
+                order_by(users.c.user_id)).fetchall(),
+            [("u1", "e1"), ("u2", "e2"), ("u3", "e3")]
+        )
+
+    def test_engine_cache_literal_values_not_cached(self):
+        eng = self._cache_engine(10)
+        cache = eng.compiled_cache
+
+        eng.execute(users.insert().values(user_id=1, user_name="u1"))
+        eng.execute(users.insert().values(user_id=2, user_name="u2"))
+        eq_(cache.stats()["size"], 0)
+        eq_(
+            eng.execute(
+                select([users.c.user_name]).
+                order_by(users.c.user_id)).fetchall(),
+            [("u1", ), ("u2", )]
+        )
+
+    def test_engine_cache_eviction(self):
+        eng = self._cache_engine(2)
+        cache = eng.compiled_cache
+        cols = [users.c.user_id, users.c.user_name, users.c.extra_data]
+
+        for col in cols:
+            eng.execute(select([col]))
+        for col in cols:
+            eng.execute(select([col, users.c.user_id]))
+
+        eq_(cache.misses, 6)
+        eq_(cache.evictions, 4)
+        eq_(len(cache), 2)
+
+    def test_result_metadata_shared(self):
+        testing.db.execute(users.insert(), {"user_id": 1, "user_name": "u1"})
+        stmt = self._user_select(bindparam("name"))
+        compiled = stmt.compile(dialect=testing.db.dialect)
+
+        conn = testing.db.connect()
+        r1 = conn.execute(compiled, name="u1")
+        r2 = conn.execute(compiled, name="u2")
+        is_(r1._metadata, r2._metadata)
+        eq_(len(compiled._cached_metadata), 1)
+        eq_(r1.fetchall(), [(1, "u1")])
+        eq_(r2.fetchall(), [])
+        conn.close()
+
+    def test_result_metadata_adapted_for_cached_statement(self):
+        eng = self._cache_engine(10)
+        eng.execute(users.insert(), [
+            {"user_id": 1, "user_name": "u1"},
+            {"user_id": 2, "user_name": "u2"}
+        ])
+
+        s1 = self._user_select("u1")
+        s2 = self._user_select("u2")
+        r1 = eng.execute(s1)
+        r2 = eng.execute(s2)
+        eq_(eng.compiled_cache.hits, 1)
+        is_(r1._metadata._processors, r2._metadata._processors)
+
+        row = r2.first()
+        eq_(row[s2.c.name], "u2")
+        eq_(row[s2.c.user_id], 2)
+        row = r1.first()
+        eq_(row[s1.c.name], "u1")
+
+    def test_result_metadata_adapted_anon_label(self):
+        eng = self._cache_engine(10)
+        eng.execute(users.insert(), [
+            {"user_id": 1, "user_name": "u1"},
+            {"user_id": 2, "user_name": "u2"}
+        ])
+
+        for id_, name in [(1, "u1"), (2, "u2")]:
+            expr = (users.c.user_id + 5).label(None)
+
+            # params() copies the statement, so that the label
+            # is targeted by its anonymous name
+            stmt = select([expr]).where(
+                users.c.user_name == bindparam("name")).params(name=name)
+            row = eng.execute(stmt).first()
+            eq_(row[expr], id_ + 5)
+        eq_(eng.compiled_cache.hits, 1)
+
+    def test_engine_cache_disabled(self):
+        eng = self._cache_engine(0)
+        is_(eng.compiled_cache, None)
+        is_(eng.execution_options(foo='bar').compiled_cache, None)
+
+        stmt = self._user_select("u1")
+        eq_(eng.execute(stmt).fetchall(), [])
+
+    def test_engine_cache_disabled_per_connection(self):
+        eng = self._cache_engine(10)
+        conn = eng.connect().execution_options(compiled_cache=None)
+
+        conn.execute(self._user_select("u1")).fetchall()
+        conn.execute(self._user_select("u2")).fetchall()
+        eq_(
+            eng.compiled_cache.stats(),
+            {"hits": 0, "misses": 0, "evictions": 0,
+             "size": 0, "capacity": 10}
+        )
+        conn.close()
+
 
 class MockStrategyTest(fixtures.TestBase):
 
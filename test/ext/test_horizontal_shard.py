@@ -1,14 +1,14 @@
 import datetime
 import os
 from sqlalchemy import *
-from sqlalchemy import event
+from sqlalchemy import event, exc
 from sqlalchemy import sql, util
 from sqlalchemy.orm import *
 from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.sql import operators
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.engines import testing_engine
-from sqlalchemy.testing import eq_
+from sqlalchemy.testing import eq_, assert_raises, assert_raises_message
 
 # TODO: ShardTest can be turned into a base for further subclasses
 
@@ -20,6 +20,7 @@ class ShardTest(object):
     __requires__ = 'sqlite',
 
     schema = None
+    shard_workers = None
 
     def setUp(self):
         global db1, db2, db3, db4, weather_locations, weather_reports
@@ -82,6 +83,9 @@ class ShardTest(object):
             else:
                 return shard_chooser(mapper, instance.location)
 
+        def mapping_shard_chooser(mapper, mapping):
+            return shard_lookup[mapping['continent']]
+
         def id_chooser(query, ident):
             return ['north_america', 'asia', 'europe', 'south_america']
 
@@ -110,13 +114,16 @@ class ShardTest(object):
 
         create_session = sessionmaker(class_=ShardedSession,
                 autoflush=True, autocommit=False)
-        create_session.configure(shards={
-            'north_america': db1,
-            'asia': db2,
-            'europe': db3,
-            'south_america': db4,
-            }, shard_chooser=shard_chooser, id_chooser=id_chooser,
-                query_chooser=query_chooser)
+        create_session.configure(
+            shards={
+                'north_america': db1,
+                'asia': db2,
+                'europe': db3,
+                'south_america': db4,
+            },
+            shard_chooser=shard_chooser, id_chooser=id_chooser,
+            query_chooser=query_chooser, shard_workers=cls.shard_workers,
+            mapping_shard_chooser=mapping_shard_chooser)
 
 
     @classmethod
@@ -210,6 +217,171 @@ class ShardTest(object):
             'south_america']
         )
 
+    def test_shard_id_event_ordered(self):
+        canary = []
+
+        def load(instance, ctx):
+            canary.append((instance.id, ctx.attributes["shard_id"]))
+
+        event.listen(WeatherLocation, "load", load)
+        self._fixture_data()
+        sess = create_session(collation_key=lambda value: value)
+
+        eq_(
+            [c.id for c in
+             sess.query(WeatherLocation).order_by(WeatherLocation.city)],
+            [6, 5, 4, 2, 7, 1, 3]
+        )
+        eq_(
+            canary,
+            [(6, 'south_america'), (5, 'europe'), (4, 'europe'),
+             (2, 'north_america'), (7, 'south_america'), (1, 'asia'),
+             (3, 'north_america')]
+        )
+
+    def _bulk_fixture(self):
+        sess = create_session()
+        eq_(
+            sess.bulk_insert_mappings(WeatherLocation, [
+                dict(id=1, continent='Asia', city='Tokyo'),
+                dict(id=2, continent='North America', city='New York'),
+                dict(id=3, continent='North America', city='Toronto'),
+                dict(id=4, continent='Europe', city='London'),
+            ]),
+            {'asia': 1, 'north_america': 2, 'europe': 1}
+        )
+        sess.commit()
+        return sess
+
+    def test_bulk_insert_mappings(self):
+        self._bulk_fixture()
+        eq_(db1.execute(weather_locations.select()).fetchall(), [
+            (2, 'North America', 'New York'),
+            (3, 'North America', 'Toronto')])
+        eq_(db2.execute(weather_locations.select()).fetchall(), [
+            (1, 'Asia', 'Tokyo')])
+        eq_(db3.execute(weather_locations.select()).fetchall(), [
+            (4, 'Europe', 'London')])
+        eq_(db4.execute(weather_locations.select()).fetchall(), [])
+
+    def test_bulk_update_mappings(self):
+        sess = self._bulk_fixture()
+        eq_(
+            sess.bulk_update_mappings(WeatherLocation, [
+                dict(id=2, continent='North America', city='NYC'),
+                dict(id=4, continent='Europe', city='Londres'),
+            ]),
+            {'north_america': 1, 'europe': 1}
+        )
+        sess.commit()
+        eq_(db1.execute(weather_locations.select()).fetchall(), [
+            (2, 'North America', 'NYC'),
+            (3, 'North America', 'Toronto')])
+        eq_(db3.execute(weather_locations.select()).fetchall(), [
+            (4, 'Europe', 'Londres')])
+
+    def test_bulk_save_objects(self):
+        sess = create_session()
+        locations = [
+            WeatherLocation('Asia', 'Tokyo'),
+            WeatherLocation('South America', 'Quito'),
+            WeatherLocation('South America', 'Brasila'),
+        ]
+        for id_, location in enumerate(locations, 1):
+            location.id = id_
+        eq_(
+            sess.bulk_save_objects(locations),
+            {'asia': 1, 'south_america': 2}
+        )
+        sess.commit()
+        eq_(db4.execute(weather_locations.select()).fetchall(), [
+            (2, 'South America', 'Quito'),
+            (3, 'South America', 'Brasila')])
+
+    def test_bulk_mappings_require_chooser(self):
+        sess = create_session(mapping_shard_chooser=None)
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "ShardedSession requires a mapping_shard_chooser",
+            sess.bulk_insert_mappings, WeatherLocation,
+            [dict(id=1, continent='Asia', city='Tokyo')]
+        )
+
+    def test_ordered_merge(self):
+        self._fixture_data()
+        sess = create_session(collation_key=lambda value: value)
+
+        eq_(
+            [c.city for c in
+             sess.query(WeatherLocation).order_by(WeatherLocation.city)],
+            ['Brasila', 'Dublin', 'London', 'New York', 'Quito',
+             'Tokyo', 'Toronto']
+        )
+        eq_(
+            sess.query(WeatherLocation.continent, WeatherLocation.city).
+            order_by(WeatherLocation.continent.desc(),
+                     WeatherLocation.city).all(),
+            [('South America', 'Brasila'), ('South America', 'Quito'),
+             ('North America', 'New York'), ('North America', 'Toronto'),
+             ('Europe', 'Dublin'), ('Europe', 'London'), ('Asia', 'Tokyo')]
+        )
+
+    def test_ordered_merge_non_string(self):
+        sess = self._fixture_data()
+
+        eq_(
+            [c.city for c in
+             sess.query(WeatherLocation).order_by(WeatherLocation.id.desc()).
+             offset(1).limit(3)],
+            ['Brasila', 'Dublin', 'London']
+        )
+
+    def test_ordered_merge_mixed_case(self):
+        self._fixture_data()
+        sess = create_session()
+        sess.add(WeatherLocation('Asia', 'beijing'))
+        sess.commit()
+
+        q = sess.query(WeatherLocation.city).order_by(
+            WeatherLocation.city.collate('NOCASE'))
+
+        # without a collation_key, string orderings aren't merged
+        eq_(
+            [city for city, in q],
+            ['New York', 'Toronto', 'beijing', 'Tokyo', 'Dublin', 'London',
+             'Brasila', 'Quito']
+        )
+
+        sess = create_session(collation_key=lambda value: value.lower())
+        eq_(
+            [city for city, in q.with_session(sess)],
+            ['beijing', 'Brasila', 'Dublin', 'London', 'New York', 'Quito',
+             'Tokyo', 'Toronto']
+        )
+        eq_(
+            [city for city, in q.with_session(sess).offset(1).limit(2)],
+            ['Brasila', 'Dublin']
+        )
+
+    def test_ordered_merge_limit_offset(self):
+        self._fixture_data()
+        sess = create_session(collation_key=lambda value: value)
+
+        q = sess.query(WeatherLocation).order_by(WeatherLocation.city)
+        eq_(
+            [c.city for c in q.offset(1).limit(3)],
+            ['Dublin', 'London', 'New York']
+        )
+        eq_(
+            [c.city for c in q.offset(5)],
+            ['Tokyo', 'Toronto']
+        )
+        eq_(
+            [c.city for c in q.limit(2)],
+            ['Brasila', 'Dublin']
+        )
+
+
 class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
 
     def _init_dbs(self):
@@ -229,6 +401,63 @@ class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
         for i in range(1, 5):
             os.remove("shard%d.db" % i)
 
+    def test_limit_pushdown(self):
+        self._fixture_data()
+        sess = create_session(collation_key=lambda value: value)
+
+        statements = []
+
+        def before_cursor_execute(
+                conn, cursor, stmt, params, context, executemany):
+            statements.append((stmt, params))
+
+        for db in (db1, db2, db3, db4):
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+
+        eq_(
+            [c.city for c in
+             sess.query(WeatherLocation).
+             options(undefer(WeatherLocation.city)).
+             order_by(WeatherLocation.city).offset(1).limit(2)],
+            ['Dublin', 'London']
+        )
+        eq_(len(statements), 4)
+        for stmt, params in statements:
+            # the SQLite dialect renders OFFSET 0 along with any LIMIT
+            assert "LIMIT" in stmt
+            eq_(params, (3, 0))
+
+
+class ConcurrentShardTest(DistinctEngineShardTest):
+    shard_workers = 3
+
+    def _init_dbs(self):
+        return [
+            testing_engine(
+                'sqlite:///shard%d.db' % i,
+                options=dict(
+                    pool_threadlocal=i == 1,
+                    connect_args={"check_same_thread": False}))
+            for i in range(1, 5)
+        ]
+
+    def test_shard_error_propagates(self):
+        sess = self._fixture_data()
+        db3.execute(weather_locations.delete())
+        db3.execute("DROP TABLE weather_locations")
+
+        assert_raises(
+            exc.OperationalError,
+            sess.query(WeatherLocation).all
+        )
+        eq_(
+            set(c.city for c in sess.query(WeatherLocation).
+                options(undefer(WeatherLocation.city)).filter(
+                WeatherLocation.continent.in_(['Asia', 'North America']))),
+            set(['Tokyo', 'New York', 'Toronto'])
+        )
+
+
 class AttachedFileShardTest(ShardTest, fixtures.TestBase):
     schema = "changeme"
 
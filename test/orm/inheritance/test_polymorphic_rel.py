@@ -108,6 +108,18 @@ class _PolymorphicTestBase(object):
         eq_(sess.query(Manager).get(b1.person_id),
             Boss(name="pointy haired boss", golf_swing="fore"))
 
+    def test_get_many(self):
+        sess = create_session()
+        eq_(sess.get_many(Person, [b1.person_id, 999, e1.person_id]),
+            [Boss(name="pointy haired boss", golf_swing="fore"),
+             None,
+             Engineer(name="dilbert", primary_language="java")])
+
+    def test_get_many_subclass(self):
+        sess = create_session()
+        eq_(sess.get_many(Manager, [e1.person_id, b1.person_id]),
+            [None, Boss(name="pointy haired boss", golf_swing="fore")])
+
     def test_multi_join(self):
         sess = create_session()
         e = aliased(Person)
@@ -41,6 +41,48 @@ class DeferredTest(AssertsCompiledSQL, _fixtures.FixtureTest):
              "FROM orders WHERE orders.id = :param_1",
              {'param_1':3})])
 
+    def test_batch(self):
+        """A deferred load which loads for all instances of the result."""
+
+        Order, orders = self.classes.Order, self.tables.orders
+
+        mapper(Order, orders, order_by=orders.c.id, properties={
+            'description': deferred(orders.c.description, batch=True)})
+
+        sess = create_session()
+        l = sess.query(Order).all()
+
+        def go():
+            eq_(
+                [o.description for o in l],
+                ['order 1', 'order 2', 'order 3', 'order 4', 'order 5']
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_batch_no_autoflush(self):
+        """A batched deferred load doesn't flush pending objects."""
+
+        Order, orders = self.classes.Order, self.tables.orders
+        User, users = self.classes.User, self.tables.users
+
+        mapper(Order, orders, order_by=orders.c.id, properties={
+            'description': deferred(orders.c.description, batch=True)})
+        mapper(User, users)
+
+        sess = Session()
+        l = sess.query(Order).all()
+
+        # would raise IntegrityError if flushed
+        sess.add(User(id=7, name='dupe'))
+
+        def go():
+            eq_(
+                [o.description for o in l],
+                ['order 1', 'order 2', 'order 3', 'order 4', 'order 5']
+            )
+        self.assert_sql_count(testing.db, go, 1)
+        sess.rollback()
+
     def test_defer_primary_key(self):
         """what happens when we try to defer the primary key?"""
 
@@ -292,6 +334,43 @@ class DeferredOptionsTest(AssertsCompiledSQL, _fixtures.FixtureTest):
              "FROM orders ORDER BY orders.id",
              {})])
 
+    def test_defer_batch(self):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        mapper(Order, orders)
+
+        sess = create_session()
+        q = sess.query(Order).order_by(Order.id).options(
+            defer('description', batch=True))
+        l = q.all()
+        l[3].description = 'changed'
+
+        def go():
+            eq_(
+                [o.description for o in l],
+                ['order 1', 'order 2', 'order 3', 'changed', 'order 5']
+            )
+        self.sql_eq_(go, [
+            ("SELECT orders.id AS orders_id, "
+             "orders.description AS orders_description "
+             "FROM orders WHERE orders.id IN ([EXPANDING_primary_keys])",
+             {'primary_keys': [1, 2, 3, 5]})])
+
+    def test_defer_batch_false_overrides_mapping(self):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        mapper(Order, orders, properties={
+            'description': deferred(orders.c.description, batch=True)})
+
+        sess = create_session()
+        l = sess.query(Order).order_by(Order.id).options(
+            defer('description', batch=False)).all()
+
+        def go():
+            for o in l:
+                o.description
+        self.assert_sql_count(testing.db, go, 5)
+
     def test_undefer_group(self):
         orders, Order = self.tables.orders, self.classes.Order
 
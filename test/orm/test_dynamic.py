@@ -120,6 +120,21 @@ class DynamicTest(_DynamicFixture, _fixtures.FixtureTest, AssertsCompiledSQL):
             ]
         )
 
+    def test_keyset_pages(self):
+        addresses = self.tables.addresses
+        User, Address = self._user_address_fixture(
+            addresses_args={"order_by": addresses.c.id})
+
+        sess = create_session()
+        u = sess.query(User).get(8)
+        eq_(
+            list(u.addresses.keyset_pages(2)),
+            [
+                ([Address(id=2), Address(id=3)], (3, )),
+                ([Address(id=4)], (4, ))
+            ]
+        )
+
     def test_configured_order_by(self):
         addresses = self.tables.addresses
         User, Address = self._user_address_fixture(
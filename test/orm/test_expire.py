@@ -1380,6 +1380,103 @@ class RefreshTest(_fixtures.FixtureTest):
         s.expunge_all()
         assert_raises_message(sa_exc.InvalidRequestError, r"is not persistent within this Session", lambda: s.refresh(u))
 
+    def test_refresh_all(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        s = create_session()
+        ulist = s.query(User).order_by(User.id).all()
+        for u in ulist:
+            u.name = 'foo'
+
+        def go():
+            s.refresh_all(ulist, chunksize=3)
+        self.assert_sql_count(testing.db, go, 2)
+
+        assert not s.dirty
+        eq_([u.name for u in ulist], ['jack', 'ed', 'fred', 'chuck'])
+
+    def test_refresh_all_attribute_names(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        s = create_session()
+        ulist = s.query(User).order_by(User.id).all()
+        for u in ulist:
+            u.name = 'foo'
+
+        s.refresh_all(ulist[1:], ['name'])
+
+        eq_([u.name for u in ulist], ['foo', 'ed', 'fred', 'chuck'])
+        assert ulist[0] in s.dirty
+        assert not s.is_modified(ulist[1])
+
+    def test_refresh_all_deleted_raises(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        s = create_session()
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).\
+            order_by(User.id).all()
+        testing.db.execute(users.delete().where(users.c.id == 8))
+
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Could not refresh instance",
+            s.refresh_all, [u7, u8]
+        )
+
+    def test_expired_batch_size(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        s = Session(expired_batch_size=3)
+        ulist = s.query(User).order_by(User.id).all()
+        s.expire_all()
+
+        def go():
+            eq_([u.name for u in ulist], ['jack', 'ed', 'fred', 'chuck'])
+        self.assert_sql_count(testing.db, go, 2)
+
+        ulist[0].name = 'foo'
+        s.expire(ulist[1], ['name'])
+        s.expire(ulist[2], ['name'])
+
+        def go():
+            eq_(ulist[1].name, 'ed')
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'name' in ulist[2].__dict__
+        eq_(ulist[0].name, 'foo')
+
+    def test_expired_batch_size_same_result(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        s = Session(expired_batch_size=10)
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).\
+            order_by(User.id).all()
+        u9 = s.query(User).get(9)
+        s.expire_all()
+
+        def go():
+            eq_(u7.name, 'jack')
+            eq_(u8.name, 'ed')
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'name' not in u9.__dict__
+
+    def test_expired_batch_size_deleted(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        s = Session(expired_batch_size=10)
+        u7, u8 = s.query(User).filter(User.id.in_([7, 8])).\
+            order_by(User.id).all()
+        s.expire_all()
+        s.execute(users.delete().where(users.c.id == 8))
+
+        eq_(u7.name, 'jack')
+        assert_raises(orm_exc.ObjectDeletedError, getattr, u8, 'name')
+
     def test_refresh_expired(self):
         User, users = self.classes.User, self.tables.users
 
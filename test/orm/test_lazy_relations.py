@@ -2,7 +2,8 @@
 
 from sqlalchemy.testing import assert_raises
 import datetime
-from sqlalchemy.orm import attributes, exc as orm_exc, configure_mappers
+from sqlalchemy.orm import attributes, exc as orm_exc, configure_mappers, \
+    loading
 import sqlalchemy as sa
 from sqlalchemy import testing, and_
 from sqlalchemy import Integer, String, ForeignKey, SmallInteger, Boolean
@@ -12,6 +13,7 @@ from sqlalchemy.testing.schema import Column
 from sqlalchemy import orm
 from sqlalchemy.orm import mapper, relationship, create_session, Session
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.testing import fixtures
 from test.orm import _fixtures
 from sqlalchemy.testing.assertsql import CompiledSQL
@@ -813,6 +815,166 @@ class M2OGetTest(_fixtures.FixtureTest):
         self.assert_sql_count(testing.db, go, 1)
 
 
+class LazyBatchTest(_fixtures.FixtureTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def test_many_to_one(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User)
+
+        mapper(User, users)
+        mapper(Address, addresses, properties={
+            'user': relationship(User, lazy_batch_size=10)
+        })
+
+        sess = create_session()
+        result = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_(self.static.address_user_result, result)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_many_to_one_in_identity_map(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User)
+
+        mapper(User, users)
+        mapper(Address, addresses, properties={
+            'user': relationship(User, lazy_batch_size=10)
+        })
+
+        sess = create_session()
+        u8 = sess.query(User).get(8)
+        a1, a2 = sess.query(Address).filter(Address.id.in_([1, 2])).\
+            order_by(Address.id).all()
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: a1.user,
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN ([EXPANDING_primary_keys])",
+                {"primary_keys": [7]}
+            )
+        )
+        assert 'user' in a2.__dict__
+        assert a2.user is u8
+
+    def test_one_to_many(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses), lazy_batch_size=2,
+                order_by=addresses.c.id)
+        })
+
+        sess = create_session()
+        result = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(self.static.user_address_result, result)
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_many_to_many(self):
+        keywords, items, item_keywords, Keyword, Item = (
+            self.tables.keywords,
+            self.tables.items,
+            self.tables.item_keywords,
+            self.classes.Keyword,
+            self.classes.Item)
+
+        mapper(Keyword, keywords)
+        mapper(Item, items, properties=dict(
+            keywords=relationship(Keyword, secondary=item_keywords,
+                                  lazy_batch_size=10,
+                                  order_by=keywords.c.id)))
+
+        sess = create_session()
+        result = sess.query(Item).order_by(Item.id).all()
+
+        def go():
+            eq_(self.static.item_keyword_result, result)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_separate_results(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses), lazy_batch_size=10)
+        })
+
+        sess = create_session()
+        u7 = sess.query(User).get(7)
+        u8, u9 = sess.query(User).filter(User.id.in_([8, 9])).\
+            order_by(User.id).all()
+
+        def go():
+            eq_(len(u7.addresses), 1)
+            eq_(len(u8.addresses), 3)
+            eq_(len(u9.addresses), 1)
+        self.assert_sql_count(testing.db, go, 2)
+
+
+    def test_scan_resumes_after_loaded(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses), lazy_batch_size=2,
+                order_by=addresses.c.id)
+        })
+
+        sess = create_session()
+        u7, u8, u9, u10 = sess.query(User).order_by(User.id).all()
+        batch = attributes.instance_state(u7)._lazy_batch
+
+        u7.addresses
+        assert 'addresses' in u8.__dict__
+        u9.addresses
+        eq_(batch.cursors['addresses'], 2)
+        assert 'addresses' in u10.__dict__
+
+    def test_collected_states_pruned(self):
+        class State(object):
+            _lazy_batch = None
+
+        batch = loading._LazyLoadBatch()
+        live = []
+        for i in range(200):
+            state = State()
+            batch.add_state(state, None, None)
+            if i % 10 == 0:
+                live.append(state)
+                gc_collect()
+            del state
+        assert len(batch.states) < 100
+        eq_(
+            [ref() for ref in batch.states if ref() is not None],
+            live
+        )
+
+
 class CorrelatedTest(fixtures.MappedTest):
 
     @classmethod
@@ -1,5 +1,7 @@
 from . import _fixtures
-from sqlalchemy.orm import loading, Session, aliased
+from sqlalchemy.orm import loading, Session, aliased, joinedload, defer, \
+    class_mapper
+from sqlalchemy import event
 from sqlalchemy.testing.assertions import eq_, assert_raises
 from sqlalchemy.util import KeyedTuple
 from sqlalchemy.testing import mock
@@ -35,6 +37,97 @@ class InstancesTest(_fixtures.FixtureTest):
         assert cursor.close.called, "Cursor wasn't closed"
 
 
+class GeneratedRowProcessorTest(_fixtures.FixtureTest):
+    run_setup_mappers = 'each'
+    run_inserts = 'once'
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def _query(self, s, *entities):
+        return s.query(*entities).execution_options(
+            generate_row_processors=True)
+
+    def test_plain_load(self):
+        User = self.classes.User
+        s = Session()
+
+        eq_(
+            self._query(s, User).order_by(User.id).all(),
+            self.static.user_result
+        )
+        assert class_mapper(User)._generated_row_processors
+
+    def test_code_is_cached(self):
+        User = self.classes.User
+        s = Session()
+
+        self._query(s, User).all()
+        s.close()
+        self._query(s, User).filter(User.id > 7).all()
+        eq_(len(class_mapper(User)._generated_row_processors), 1)
+
+        self._query(s, User).options(defer(User.name)).all()
+        eq_(len(class_mapper(User)._generated_row_processors), 2)
+
+    def test_identity_map_preserved(self):
+        User = self.classes.User
+        s = Session()
+
+        u7 = s.query(User).get(7)
+        u7.name = 'modified'
+
+        with s.no_autoflush:
+            result = self._query(s, User).order_by(User.id).all()
+        assert result[0] is u7
+        eq_(u7.name, 'modified')
+        eq_([u.id for u in result], [7, 8, 9, 10])
+        assert u7 in s.dirty
+        assert not any(u in s.dirty for u in result[1:])
+
+    def test_joined_eager(self):
+        User = self.classes.User
+        s = Session()
+
+        eq_(
+            self._query(s, User).options(joinedload(User.addresses)).
+            order_by(User.id).all(),
+            self.static.user_address_result
+        )
+
+    def test_deferred(self):
+        User = self.classes.User
+        s = Session()
+
+        users = self._query(s, User).options(defer(User.name)).\
+            order_by(User.id).all()
+        for u in users:
+            assert 'name' not in u.__dict__
+        eq_(users[0].name, 'jack')
+
+    def test_load_event(self):
+        User = self.classes.User
+        s = Session()
+
+        canary = []
+        event.listen(
+            User, "load", lambda target, ctx: canary.append(target.id))
+        self._query(s, User).order_by(User.id).all()
+        eq_(canary, [7, 8, 9, 10])
+
+    def test_populate_existing_not_generated(self):
+        User = self.classes.User
+        s = Session()
+
+        u7 = s.query(User).get(7)
+        u7.name = 'modified'
+        self._query(s, User).populate_existing().all()
+        eq_(u7.name, 'jack')
+        assert not class_mapper(User)._generated_row_processors
+
+
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = 'once'
     run_inserts = 'once'
@@ -700,6 +700,81 @@ class MergeTest(_fixtures.FixtureTest):
                 "load=False option does not support",
                 sess.merge, u, load=False)
 
+    def test_merge_all(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        sess = create_session()
+        sess.add_all([User(id=7, name='jack'), User(id=8, name='ed'),
+                      User(id=9, name='fred')])
+        sess.flush()
+        sess.expunge_all()
+
+        u8 = sess.query(User).get(8)
+        load = self.load_tracker(User)
+        merged = []
+
+        def go():
+            merged.extend(sess.merge_all([
+                User(id=7, name='jack2'),
+                User(id=10, name='chuck'),
+                User(id=8, name='ed2'),
+                User(id=9, name='fred2'),
+            ], chunksize=2))
+        # 7, 10 and 9 aren't in the identity map; two chunks of two
+        self.assert_sql_count(testing.db, go, 2)
+
+        eq_(merged, [
+            User(id=7, name='jack2'), User(id=10, name='chuck'),
+            User(id=8, name='ed2'), User(id=9, name='fred2')
+        ])
+        assert merged[2] is u8
+        assert merged[1] in sess.new
+        eq_(load.called, 3)
+
+        sess.flush()
+        sess.expunge_all()
+        eq_(
+            sess.query(User).order_by(User.id).all(),
+            [User(id=7, name='jack2'), User(id=8, name='ed2'),
+             User(id=9, name='fred2'), User(id=10, name='chuck')]
+        )
+
+    def test_merge_all_duplicate_new_key(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        sess = create_session()
+        merged = sess.merge_all([
+            User(id=7, name='jack'), User(id=7, name='jack2')])
+        assert merged[0] is merged[1]
+        eq_(merged[0].name, 'jack2')
+        eq_(len(sess.new), 1)
+
+        sess.flush()
+        sess.expunge_all()
+        eq_(sess.query(User).all(), [User(id=7, name='jack2')])
+
+    def test_merge_all_no_load(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        sess = create_session()
+        u7, u8 = User(id=7, name='jack'), User(id=8, name='ed')
+        sess.add_all([u7, u8])
+        sess.flush()
+        sess.close()
+
+        sess = create_session()
+
+        def go():
+            eq_(sess.merge_all([u7, u8], load=False),
+                [User(id=7, name='jack'), User(id=8, name='ed')])
+        self.assert_sql_count(testing.db, go, 0)
+
     def test_no_load_with_backrefs(self):
         """load=False populates relationships in both
         directions without requiring a load"""
@@ -8,7 +8,7 @@ from sqlalchemy.engine import default
 from sqlalchemy.orm import (
     attributes, mapper, relationship, create_session, synonym, Session,
     aliased, column_property, joinedload_all, joinedload, Query, Bundle,
-    subqueryload, backref, lazyload, defer)
+    subqueryload, backref, lazyload, defer, contains_eager)
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as sa
@@ -631,6 +631,88 @@ class GetTest(QueryTest):
         assert u.orders[1].items[2].description == 'item 5'
 
 
+class GetManyTest(QueryTest):
+    def test_get_many(self):
+        User = self.classes.User
+
+        s = create_session()
+        u7 = s.query(User).get(7)
+        result = []
+
+        def go():
+            result.extend(s.get_many(User, [10, 7, 19, 8]))
+            eq_(result, [User(id=10), u7, None, User(id=8)])
+        self.assert_sql_count(testing.db, go, 1)
+        assert s.get_many(User, [7])[0] is u7
+
+        def go():
+            eq_(s.get_many(User, [8, 10, 8]), [User(id=8), User(id=10),
+                                               User(id=8)])
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_chunksize(self):
+        User = self.classes.User
+
+        s = create_session()
+
+        def go():
+            eq_(
+                [u.id for u in s.get_many(User, [7, 8, 9, 10], chunksize=3)],
+                [7, 8, 9, 10]
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_composite_pk(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        eq_(
+            [
+                (c.i, c.j, c.k) if c is not None else None
+                for c in s.get_many(
+                    CompositePk, [(2, 1), (100, 100), (1, 2)])
+            ],
+            [(2, 1, 4), None, (1, 2, 3)]
+        )
+
+    def test_expired(self):
+        User = self.classes.User
+
+        s = Session()
+        u7, u8 = s.get_many(User, [7, 8])
+        s.expire(u7)
+        s.expire(u8)
+
+        def go():
+            eq_(s.get_many(User, [7, 8]), [u7, u8])
+            eq_(u7.name, 'jack')
+            eq_(u8.name, 'ed')
+        self.assert_sql_count(testing.db, go, 1)
+        s.rollback()
+
+    def test_expired_deleted(self):
+        User, users = self.classes.User, self.tables.users
+
+        s = Session()
+        u7 = s.query(User).get(7)
+        s.execute(users.delete().where(users.c.id == 7))
+        s.expire(u7)
+        eq_(s.get_many(User, [7, 8]), [None, User(id=8)])
+        assert u7 not in s
+        s.rollback()
+
+    def test_too_few_params(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            r"Incorrect number of values in identifier to formulate "
+            r"primary key for query.get_many\(\)",
+            s.get_many, CompositePk, [(1, 2), 7]
+        )
+
+
 class InvalidGenerationsTest(QueryTest, AssertsCompiledSQL):
     def test_no_limit_offset(self):
         User = self.classes.User
@@ -1805,6 +1887,132 @@ class SliceTest(QueryTest):
                     "FROM users", {})])
 
 
+class KeysetPaginationTest(QueryTest, AssertsCompiledSQL):
+    __dialect__ = 'default'
+
+    def test_pages(self):
+        User = self.classes.User
+
+        q = create_session().query(User).order_by(User.id)
+        eq_(
+            list(q.keyset_pages(3)),
+            [
+                ([User(id=7), User(id=8), User(id=9)], (9, )),
+                ([User(id=10)], (10, ))
+            ]
+        )
+
+    def test_pages_exact_multiple(self):
+        User = self.classes.User
+
+        q = create_session().query(User).order_by(User.id)
+        eq_(
+            [bookmark for page, bookmark in q.keyset_pages(2)],
+            [(8, ), (10, )]
+        )
+
+    def test_resume_from_bookmark(self):
+        User = self.classes.User
+
+        q = create_session().query(User).order_by(User.id)
+        eq_(
+            list(q.keyset_pages(2, bookmark=(8, ))),
+            [([User(id=9), User(id=10)], (10, ))]
+        )
+
+    def test_column_entities(self):
+        User = self.classes.User
+
+        q = create_session().query(User.name, User.id).\
+            order_by(User.name.desc(), User.id)
+        pages = list(q.keyset_pages(3))
+        eq_(
+            [page for page, bookmark in pages],
+            [[('jack', 7), ('fred', 9), ('ed', 8)], [('chuck', 10)]]
+        )
+        eq_(pages[0][0][0].keys(), ['name', 'id'])
+        eq_(pages[0][1], ('ed', 8))
+
+    def test_seek_row_comparison(self):
+        User = self.classes.User
+
+        q = create_session().query(User).order_by(User.name, User.id)
+        self.assert_compile(
+            q.seek(('ed', 8)),
+            "SELECT users.id AS users_id, users.name AS users_name "
+            "FROM users WHERE (users.name, users.id) > "
+            "(:param_1, :param_2) ORDER BY users.name, users.id",
+            checkparams={'param_1': 'ed', 'param_2': 8}
+        )
+
+    def test_seek_mixed_directions(self):
+        User = self.classes.User
+
+        q = create_session().query(User).\
+            order_by(User.name.desc(), User.id)
+        self.assert_compile(
+            q.seek(('ed', 8)),
+            "SELECT users.id AS users_id, users.name AS users_name "
+            "FROM users WHERE users.name < :name_1 OR "
+            "users.name = :name_2 AND users.id > :id_1 "
+            "ORDER BY users.name DESC, users.id",
+            checkparams={'name_1': 'ed', 'name_2': 'ed', 'id_1': 8}
+        )
+
+    def test_seek_no_row_comparison(self):
+        User = self.classes.User
+
+        q = create_session().query(User).order_by(User.name, User.id)
+        self.assert_compile(
+            q.seek(('ed', 8), row_comparison=False),
+            "SELECT users.id AS users_id, users.name AS users_name "
+            "FROM users WHERE users.name > :name_1 OR "
+            "users.name = :name_2 AND users.id > :id_1 "
+            "ORDER BY users.name, users.id",
+            checkparams={'name_1': 'ed', 'name_2': 'ed', 'id_1': 8}
+        )
+
+    def test_no_order_by(self):
+        User = self.classes.User
+
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Keyset pagination requires that the Query have an ORDER BY",
+            create_session().query(User).seek, (8, )
+        )
+
+    def test_pages_no_order_by(self):
+        User = self.classes.User
+
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Keyset pagination requires that the Query have an ORDER BY",
+            create_session().query(User).keyset_pages, 2
+        )
+
+    def test_pages_no_limit_offset(self):
+        User = self.classes.User
+
+        q = create_session().query(User).order_by(User.id)
+        for q in (q.limit(5), q.offset(1)):
+            assert_raises_message(
+                sa_exc.InvalidRequestError,
+                "Keyset pagination can't be used on a Query which has "
+                "LIMIT or OFFSET applied",
+                q.keyset_pages, 2
+            )
+
+    def test_bookmark_length(self):
+        User = self.classes.User
+
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            r"Bookmark \(8,\) has 1 values; ORDER BY of this Query has 2",
+            create_session().query(User).order_by(User.name, User.id).seek,
+            (8, )
+        )
+
+
 class FilterTest(QueryTest, AssertsCompiledSQL):
     __dialect__ = 'default'
 
@@ -2682,42 +2890,59 @@ class YieldTest(_fixtures.FixtureTest):
             q._execution_options,
             {"stream_results": True, "foo": "bar", "max_row_buffer": 15})
 
-    def test_no_joinedload_opt(self):
+    def _assert_collections_per_batch(self, q):
+        User = self.classes.User
+        sess = create_session()
+        q = q.with_session(sess).order_by(User.id).yield_per(2)
+
+        def go():
+            counts = []
+            for u in q:
+                assert 'addresses' in u.__dict__
+                counts.append(len(u.addresses))
+            eq_(counts, [1, 3, 1, 0])
+
+        # two batches of two users, each followed by a SELECT of
+        # their addresses
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_joinedload_opt(self):
         self._eagerload_mappings()
 
         User = self.classes.User
-        sess = create_session()
-        q = sess.query(User).options(joinedload("addresses")).yield_per(1)
-        assert_raises_message(
-            sa_exc.InvalidRequestError,
-            "The yield_per Query option is currently not compatible with "
-            "joined collection eager loading.  Please specify ",
-            q.all
-        )
+        self._assert_collections_per_batch(
+            Query(User).options(joinedload("addresses")))
 
-    def test_no_subqueryload_opt(self):
+    def test_joinedload_mapping(self):
+        self._eagerload_mappings(addresses_lazy="joined")
+
+        User = self.classes.User
+        self._assert_collections_per_batch(Query(User))
+
+    def test_subqueryload_opt(self):
         self._eagerload_mappings()
 
         User = self.classes.User
-        sess = create_session()
-        q = sess.query(User).options(subqueryload("addresses")).yield_per(1)
-        assert_raises_message(
-            sa_exc.InvalidRequestError,
-            "The yield_per Query option is currently not compatible with "
-            "subquery eager loading.  Please specify ",
-            q.all
-        )
+        self._assert_collections_per_batch(
+            Query(User).options(subqueryload("addresses")))
 
-    def test_no_subqueryload_mapping(self):
+    def test_subqueryload_mapping(self):
         self._eagerload_mappings(addresses_lazy="subquery")
 
+        User = self.classes.User
+        self._assert_collections_per_batch(Query(User))
+
+    def test_no_contains_eager_collection(self):
+        self._eagerload_mappings()
+
         User = self.classes.User
         sess = create_session()
-        q = sess.query(User).yield_per(1)
+        q = sess.query(User).join(User.addresses).\
+            options(contains_eager(User.addresses)).yield_per(1)
         assert_raises_message(
             sa_exc.InvalidRequestError,
             "The yield_per Query option is currently not compatible with "
-            "subquery eager loading.  Please specify ",
+            "joined collection eager loading.  Please specify ",
             q.all
         )
 
@@ -0,0 +1,162 @@
+from sqlalchemy.testing import eq_, is_
+from sqlalchemy import testing, bindparam, text
+from sqlalchemy.orm import mapper, relationship, Session, QueryCache, \
+    joinedload, subqueryload, aliased, column_property
+from test.orm import _fixtures
+
+
+class QueryCacheTest(_fixtures.FixtureTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        User, Address = cls.classes.User, cls.classes.Address
+        users, addresses = cls.tables.users, cls.tables.addresses
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address, order_by=addresses.c.id),
+            'name': users.c.name,
+            'uname': column_property(users.c.name)
+        })
+        mapper(Address, addresses)
+
+    def _session(self):
+        cache = QueryCache()
+        return Session(query_cache=cache), cache
+
+    def test_criteria_values(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        for id_, name in [(7, 'jack'), (8, 'ed'), (9, 'fred')]:
+            eq_(
+                sess.query(User).filter(User.id == id_).all(),
+                [User(id=id_, name=name)]
+            )
+        eq_(cache.stats()['misses'], 1)
+        eq_(cache.stats()['hits'], 2)
+        eq_(cache.stats()['size'], 1)
+
+    def test_criteria_values_one(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        eq_(sess.query(User).filter(User.id == 7).one().name, 'jack')
+        eq_(sess.query(User).filter(User.id == 9).one().name, 'fred')
+        eq_(cache.stats()['hits'], 1)
+
+    def test_distinct_structure(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        sess.query(User).filter(User.id == 7).all()
+        sess.query(User).filter(User.id > 7).all()
+        sess.query(User).filter(User.id == 7).order_by(User.name).all()
+        eq_(cache.stats()['misses'], 3)
+        eq_(cache.stats()['hits'], 0)
+
+    def test_params(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        q = sess.query(User).filter(User.id == bindparam('id'))
+        eq_(q.params(id=7).all(), [User(id=7, name='jack')])
+        eq_(q.params(id=8).all(), [User(id=8, name='ed')])
+        eq_(cache.stats()['hits'], 1)
+
+    def test_get(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        eq_(sess.query(User).get(7), User(id=7, name='jack'))
+        eq_(sess.query(User).get(8), User(id=8, name='ed'))
+        eq_(cache.stats()['hits'], 1)
+
+    def test_limit_offset_in_key(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        q = sess.query(User).order_by(User.id)
+        eq_([u.id for u in q.limit(2).all()], [7, 8])
+        eq_([u.id for u in q.limit(2).offset(1).all()], [8, 9])
+        eq_([u.id for u in q.limit(2).all()], [7, 8])
+        eq_(cache.stats()['misses'], 2)
+        eq_(cache.stats()['hits'], 1)
+
+    def test_joinedload(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        for id_ in (7, 9):
+            sess.expunge_all()
+            u = sess.query(User).options(joinedload(User.addresses)).\
+                filter(User.id == id_).one()
+
+            def go():
+                eq_(len(u.addresses), 1)
+            self.assert_sql_count(testing.db, go, 0)
+        eq_(cache.stats()['hits'], 1)
+
+        sess.query(User).filter(User.id == 7).all()
+        eq_(cache.stats()['misses'], 2)
+
+    def test_aliased_join(self):
+        User, Address = self.classes.User, self.classes.Address
+        sess, cache = self._session()
+
+        for email, id_ in [('jack@bean.com', 7), ('fred@fred.com', 9)]:
+            a1 = aliased(Address)
+            eq_(
+                sess.query(User).join(a1, User.addresses).
+                filter(a1.email_address == email).all(),
+                [User(id=id_)]
+            )
+        eq_(cache.stats()['hits'], 1)
+
+    def test_column_entities(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        row = sess.query(User.name).filter(User.id == 7).one()
+        eq_(row.keys(), ['name'])
+        row = sess.query(User.uname).filter(User.id == 7).one()
+        eq_(row.keys(), ['uname'])
+        eq_(cache.stats()['hits'], 0)
+
+        eq_(sess.query(User.name).filter(User.id == 8).one(), ('ed', ))
+        eq_(cache.stats()['hits'], 1)
+
+    def test_subqueryload_not_cached(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        for id_ in (7, 9):
+            u = sess.query(User).options(subqueryload(User.addresses)).\
+                filter(User.id == id_).one()
+            eq_(len(u.addresses), 1)
+        eq_(cache.stats()['size'], 0)
+
+    def test_from_statement_not_cached(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        eq_(
+            sess.query(User).from_statement(
+                text("select * from users where id=7")).all(),
+            [User(id=7)]
+        )
+        eq_(cache.stats()['misses'], 0)
+        eq_(cache.stats()['size'], 0)
+
+    def test_hints_not_cached(self):
+        User = self.classes.User
+        sess, cache = self._session()
+
+        assert sess.query(User).filter(User.id == 7).\
+            _generate_cache_key() is not None
+        is_(
+            sess.query(User).with_hint(User, "some hint").
+            _generate_cache_key(),
+            None
+        )
@@ -0,0 +1,212 @@
+from sqlalchemy.testing import eq_, is_, assert_raises_message, mock
+from sqlalchemy import testing, exc as sa_exc
+from sqlalchemy.orm import mapper, relationship, Session, SecondLevelCache
+from sqlalchemy.testing import fixtures
+from test.orm import _fixtures
+
+
+class SecondLevelCacheTest(_fixtures.FixtureTest):
+
+    def _fixture(self, **kw):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+        cache = SecondLevelCache(**kw)
+        mapper(User, users, second_level_cache=cache)
+        mapper(Address, addresses, properties={
+            'user': relationship(User)
+        })
+        return cache
+
+    def test_get(self):
+        cache = self._fixture()
+        User = self.classes.User
+
+        def go():
+            eq_(Session().query(User).get(7), User(id=7, name='jack'))
+        self.assert_sql_count(testing.db, go, 1)
+        self.assert_sql_count(testing.db, go, 0)
+
+        stats = cache.stats()
+        eq_(stats['hits'], 1)
+        eq_(stats['misses'], 1)
+        eq_(stats['hit_rate'], .5)
+        eq_(stats['size'], 1)
+
+    def test_instance_is_persistent(self):
+        self._fixture()
+        User = self.classes.User
+
+        Session().query(User).get(7)
+        sess = Session()
+        u1 = sess.query(User).get(7)
+        is_(sess.query(User).get(7), u1)
+        assert u1 in sess
+        assert u1 not in sess.dirty
+
+    def test_many_to_one_lazyload(self):
+        self._fixture()
+        User, Address = self.classes.User, self.classes.Address
+
+        Session().query(User).get(7)
+
+        sess = Session()
+        a1 = sess.query(Address).get(1)
+
+        def go():
+            eq_(a1.user, User(id=7, name='jack'))
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_flush_invalidates(self):
+        cache = self._fixture()
+        User = self.classes.User
+
+        sess = Session()
+        u1 = sess.query(User).get(7)
+        u1.name = 'ed'
+        sess.commit()
+        eq_(cache.stats()['size'], 0)
+
+        def go():
+            eq_(Session().query(User).get(7), User(id=7, name='ed'))
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_no_populate_after_flush(self):
+        cache = self._fixture()
+        User = self.classes.User
+
+        sess = Session()
+        sess.query(User).get(7).name = 'ed'
+        sess.flush()
+        sess.expunge_all()
+        sess.query(User).get(7)
+        eq_(cache.stats()['size'], 0)
+        sess.rollback()
+
+        eq_(Session().query(User).get(7), User(id=7, name='jack'))
+
+    def test_no_populate_from_earlier_transaction(self):
+        cache = self._fixture()
+        User = self.classes.User
+
+        reader = Session()
+        reader.query(User).get(8)
+        eq_(cache.stats()['size'], 1)
+
+        writer = Session()
+        writer.query(User).get(7).name = 'ed'
+        writer.commit()
+
+        # the transaction of the reader began before the change was
+        # committed, so it doesn't re-populate the entry
+        reader.query(User).get(7)
+        eq_(cache.stats()['size'], 1)
+        reader.close()
+
+        reader.query(User).get(7)
+        eq_(cache.stats()['size'], 2)
+        eq_(Session().query(User).get(7), User(id=7, name='ed'))
+
+    def test_bulk_update_invalidates(self):
+        cache = self._fixture()
+        User = self.classes.User
+
+        Session().query(User).get(7)
+        Session().query(User).get(8)
+        eq_(cache.stats()['size'], 2)
+
+        sess = Session()
+        sess.query(User).filter(User.id == 7).update(
+            {"name": "ed"}, synchronize_session=False)
+        eq_(cache.stats()['size'], 0)
+        sess.commit()
+
+        eq_(Session().query(User).get(7), User(id=7, name='ed'))
+
+    def test_bulk_update_against_table_invalidates(self):
+        cache = self._fixture()
+        User, users = self.classes.User, self.tables.users
+
+        Session().query(User).get(7)
+        eq_(cache.stats()['size'], 1)
+
+        sess = Session()
+        sess.query(users).filter(users.c.id == 7).update(
+            {users.c.name: "ed"}, synchronize_session=False)
+        eq_(cache.stats()['size'], 0)
+        sess.commit()
+
+        eq_(Session().query(User).get(7), User(id=7, name='ed'))
+
+    def test_populate_existing_bypasses(self):
+        cache = self._fixture()
+        User = self.classes.User
+
+        Session().query(User).get(7)
+
+        def go():
+            Session().query(User).populate_existing().get(7)
+        self.assert_sql_count(testing.db, go, 1)
+        eq_(cache.stats()['hits'], 0)
+
+    def test_ttl(self):
+        cache = self._fixture(ttl=10)
+        User = self.classes.User
+
+        with mock.patch("sqlalchemy.orm.cache.time.time", return_value=0):
+            Session().query(User).get(7)
+        with mock.patch("sqlalchemy.orm.cache.time.time", return_value=5):
+            Session().query(User).get(7)
+        with mock.patch("sqlalchemy.orm.cache.time.time", return_value=15):
+            Session().query(User).get(7)
+
+        stats = cache.stats()
+        eq_(stats['hits'], 1)
+        eq_(stats['misses'], 2)
+        eq_(stats['expirations'], 1)
+
+    def test_inheriting_mapper_disallowed(self):
+        users = self.tables.users
+
+        class Base(object):
+            pass
+
+        class Sub(Base):
+            pass
+
+        mapper(Base, users)
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            "second_level_cache may only be configured on the base mapper",
+            mapper, Sub, inherits=Base,
+            second_level_cache=SecondLevelCache()
+        )
+
+
+class SecondLevelCacheStorageTest(fixtures.TestBase):
+
+    def test_lru(self):
+        cache = SecondLevelCache(capacity=10, threshold=.5)
+        for i in range(16):
+            cache.set((object, (i, )), i)
+        eq_(cache.stats()['size'], 10)
+        eq_(cache.stats()['evictions'], 6)
+        eq_(cache.get((object, (15, ))), 15)
+        eq_(cache.get((object, (0, ))), None)
+
+    def test_invalidate_class(self):
+        class A(object):
+            pass
+
+        class B(object):
+            pass
+
+        cache = SecondLevelCache()
+        cache.set((A, (1, )), 'a1')
+        cache.set((A, (2, )), 'a2')
+        cache.set((B, (1, )), 'b1')
+        cache.invalidate_class(A)
+        eq_(cache.get((A, (1, ))), None)
+        eq_(cache.get((B, (1, ))), 'b1')
+        eq_(cache.stats()['invalidations'], 2)
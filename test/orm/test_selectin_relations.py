@@ -0,0 +1,254 @@
+from sqlalchemy.testing import eq_, is_
+from sqlalchemy import testing
+from sqlalchemy.orm import selectinload, selectinload_all, \
+    mapper, relationship, create_session, aliased, Session
+from sqlalchemy.testing.assertsql import CompiledSQL
+from test.orm import _fixtures
+
+
+class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def test_basic(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses))
+
+        def go():
+            eq_(
+                [User(id=7, addresses=[
+                    Address(id=1, email_address='jack@bean.com')])],
+                q.filter(User.id == 7).all()
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+        def go():
+            eq_(
+                self.static.user_address_result,
+                q.order_by(User.id).all()
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_one_to_many_omits_join(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses)).\
+            filter(User.id.in_([7, 8]))
+
+        self.assert_sql_execution(
+            testing.db,
+            q.all,
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN (:id_1, :id_2)",
+                {"id_1": 7, "id_2": 8}
+            ),
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, "
+                "addresses.user_id AS addresses_user_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE addresses.user_id IN "
+                "([EXPANDING_primary_keys]) ORDER BY addresses.id",
+                {"primary_keys": [7, 8]}
+            )
+        )
+
+    def test_from_aliased(self):
+        users, Dingaling, User, dingalings, Address, addresses = (
+            self.tables.users,
+            self.classes.Dingaling,
+            self.classes.User,
+            self.tables.dingalings,
+            self.classes.Address,
+            self.tables.addresses)
+
+        mapper(Dingaling, dingalings)
+        mapper(Address, addresses, properties={
+            'dingalings': relationship(Dingaling, order_by=Dingaling.id)
+        })
+        mapper(User, users, properties={
+            'addresses': relationship(
+                Address,
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        u = aliased(User)
+
+        q = sess.query(u).options(selectinload(u.addresses))
+
+        def go():
+            eq_(
+                self.static.user_address_result,
+                q.order_by(u.id).all()
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+        q = sess.query(u).\
+            options(selectinload_all(u.addresses, Address.dingalings))
+
+        def go():
+            eq_(
+                [
+                    User(id=8, addresses=[
+                        Address(id=2, email_address='ed@wood.com',
+                                dingalings=[Dingaling()]),
+                        Address(id=3, email_address='ed@bettyboop.com'),
+                        Address(id=4, email_address='ed@lala.com'),
+                    ]),
+                    User(id=9, addresses=[
+                        Address(id=5, dingalings=[Dingaling()])
+                    ]),
+                ],
+                q.filter(u.id.in_([8, 9])).order_by(u.id).all()
+            )
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_many_to_many(self):
+        keywords, items, item_keywords, Keyword, Item = (
+            self.tables.keywords,
+            self.tables.items,
+            self.tables.item_keywords,
+            self.classes.Keyword,
+            self.classes.Item)
+
+        mapper(Keyword, keywords)
+        mapper(Item, items, properties=dict(
+            keywords=relationship(Keyword, secondary=item_keywords,
+                                  lazy='selectin', order_by=keywords.c.id)))
+
+        q = create_session().query(Item).order_by(Item.id)
+
+        def go():
+            eq_(self.static.item_keyword_result, q.all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_many_to_one(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(Address, addresses, properties={
+            'user': relationship(mapper(User, users), lazy='selectin')
+        })
+        sess = create_session()
+
+        def go():
+            eq_(
+                self.static.address_user_result,
+                sess.query(Address).order_by(Address.id).all()
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_nested(self):
+        users, items, order_items, Order, Item, User, orders = (
+            self.tables.users,
+            self.tables.items,
+            self.tables.order_items,
+            self.classes.Order,
+            self.classes.Item,
+            self.classes.User,
+            self.tables.orders)
+
+        mapper(User, users, properties={
+            'orders': relationship(Order, order_by=orders.c.id)
+        })
+        mapper(Order, orders, properties={
+            'items': relationship(Item, secondary=order_items,
+                                  order_by=items.c.id)
+        })
+        mapper(Item, items)
+
+        sess = create_session()
+        q = sess.query(User).options(
+            selectinload(User.orders).selectinload(Order.items)).\
+            order_by(User.id)
+
+        def go():
+            eq_(self.static.user_order_result, q.all())
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_chunksize(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(
+            selectinload(User.addresses, chunksize=3)).order_by(User.id)
+
+        def go():
+            eq_(self.static.user_address_result, q.all())
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_yield_per(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses)).\
+            order_by(User.id).yield_per(2)
+
+        def go():
+            eq_(self.static.user_address_result, list(q))
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_existing_collection_not_overwritten(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                order_by=Address.id)
+        })
+        sess = Session(autoflush=False)
+
+        u8 = sess.query(User).get(8)
+        u8.addresses.pop()
+
+        users = sess.query(User).options(selectinload(User.addresses)).\
+            order_by(User.id).all()
+        is_(users[1], u8)
+        eq_(len(u8.addresses), 2)
+        eq_(len(users[0].addresses), 1)
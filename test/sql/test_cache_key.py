@@ -0,0 +1,152 @@
+from sqlalchemy.testing import eq_, is_, ne_, fixtures
+from sqlalchemy import MetaData, Table, Column, Integer, String, select, \
+    func, bindparam, text, literal_column, and_, or_, case, cast, exists, \
+    union, tuple_, desc
+from sqlalchemy.sql import column, table
+
+
+class CacheKeyTest(fixtures.TestBase):
+
+    @classmethod
+    def setup_class(cls):
+        global t1, t2
+        m = MetaData()
+        t1 = Table('t1', m,
+                   Column('a', Integer, primary_key=True),
+                   Column('b', String(20)))
+        t2 = Table('t2', m,
+                   Column('a', Integer, primary_key=True),
+                   Column('t1_a', Integer),
+                   Column('c', String(30)))
+
+    def _key(self, stmt):
+        key = stmt._generate_cache_key()
+        assert key is not None
+        return key
+
+    def _assert_equal(self, fn):
+        k1, b1 = self._key(fn(5, 'x'))
+        k2, b2 = self._key(fn(10, 'y'))
+        eq_(k1, k2)
+        eq_(hash(k1), hash(k2))
+        eq_([b.effective_value for b in b1], [5, 'x'])
+        eq_([b.effective_value for b in b2], [10, 'y'])
+
+    def test_select_values_ignored(self):
+        self._assert_equal(
+            lambda a, b: select([t1]).where(
+                and_(t1.c.a == a, t1.c.b == b))
+        )
+
+    def test_join_subquery_values_ignored(self):
+        def go(a, b):
+            subq = select([t2.c.t1_a]).where(t2.c.a > a).alias()
+            return select([t1.c.b, func.count(subq.c.t1_a)]).\
+                select_from(t1.join(subq, t1.c.a == subq.c.t1_a)).\
+                where(t1.c.b.like(b)).group_by(t1.c.b)
+        self._assert_equal(go)
+
+    def test_union_values_ignored(self):
+        self._assert_equal(
+            lambda a, b: union(
+                select([t1.c.a]).where(t1.c.a == a),
+                select([t2.c.a]).where(t2.c.c == b)
+            )
+        )
+
+    def test_expressions_values_ignored(self):
+        self._assert_equal(
+            lambda a, b: select([
+                case([(t1.c.a > a, t1.c.b)], else_=b),
+                cast(t1.c.b, Integer),
+                desc(t1.c.a)
+            ])
+        )
+
+    def test_dml_values_ignored(self):
+        self._assert_equal(
+            lambda a, b: t1.update().where(t1.c.b == b).
+            values(a=bindparam('q', value=a))
+        )
+
+    def test_correlated_subquery(self):
+        self._assert_equal(
+            lambda a, b: select([t1]).where(
+                exists().where(t2.c.t1_a == t1.c.a).
+                where(t2.c.a == a).where(t2.c.c == b))
+        )
+
+    def test_structure_differs(self):
+        stmts = [
+            select([t1]),
+            select([t1.c.a]),
+            select([t2]),
+            select([t1]).where(t1.c.a == 5),
+            select([t1]).where(t1.c.a > 5),
+            select([t1]).where(t1.c.b == 5),
+            select([t1]).where(or_(t1.c.a == 5, t1.c.b == 'x')),
+            select([t1]).where(tuple_(t1.c.a, t1.c.b) == (5, 'x')),
+            select([t1]).order_by(t1.c.a),
+            select([t1]).distinct(),
+            select([t1]).apply_labels(),
+            select([t1]).with_for_update(),
+            select([t1]).limit(5),
+            select([t1]).limit(10),
+            select([t1.c.a.label('q')]),
+            select([t1.c.a.label('r')]),
+            select([t1.c.a.op('->')(5)]),
+            select([t1.c.a.op('#>')(5)]),
+            select([func.foo(t1.c.a)]),
+            select([func.bar(t1.c.a)]),
+            select([literal_column('q')]),
+            select([column('q')]),
+            select([column('q', Integer)]),
+            select([column('q', String(20))]),
+            select([column('q', String(30))]),
+            select([table('t1', column('a'))]),
+            select([t1]).select_from(t1.join(t2, t1.c.a == t2.c.t1_a)),
+            select([t1]).select_from(
+                t1.outerjoin(t2, t1.c.a == t2.c.t1_a)),
+            t1.insert(),
+            t1.update(),
+            t1.delete(),
+            t1.delete().where(t1.c.a == 5),
+        ]
+        keys = [self._key(stmt)[0] for stmt in stmts]
+        for idx, key in enumerate(keys):
+            for other in keys[idx + 1:]:
+                ne_(key, other)
+
+    def test_limit_value_in_key(self):
+        ne_(
+            self._key(select([t1]).limit(5))[0],
+            self._key(select([t1]).limit(10))[0]
+        )
+
+    def test_text(self):
+        eq_(
+            self._key(text("select :x").bindparams(x=5))[0],
+            self._key(text("select :x").bindparams(x=10))[0]
+        )
+        ne_(
+            self._key(text("select :x"))[0],
+            self._key(text("select :y"))[0]
+        )
+
+    def test_uncacheable(self):
+        for stmt in [
+            t1.insert().values(a=5),
+            t1.update().values(b='x'),
+            select([select([t2.c.a]).cte().c.a]),
+        ]:
+            is_(stmt._generate_cache_key(), None)
+
+    def test_custom_operator(self):
+        eq_(
+            self._key(select([t1.c.a.op('->')(5)]))[0],
+            self._key(select([t1.c.a.op('->')(10)]))[0]
+        )
+        ne_(
+            self._key(select([t1.c.a.op('->', precedence=5)(5)]))[0],
+            self._key(select([t1.c.a.op('->')(5)]))[0]
+        )
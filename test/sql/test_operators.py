@@ -4,7 +4,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.sql import column, desc, asc, literal, collate, null, true, false
 from sqlalchemy.sql.expression import BinaryExpression, \
     ClauseList, Grouping, \
-    UnaryExpression, select, union, func, tuple_
+    UnaryExpression, select, union, func, tuple_, bindparam
 from sqlalchemy.sql import operators, table
 import operator
 from sqlalchemy import String, Integer, LargeBinary
@@ -1290,6 +1290,38 @@ class InTest(fixtures.TestBase, testing.AssertsCompiledSQL):
         self.assert_compile(~self.table1.c.myid.in_([]),
                             "mytable.myid = mytable.myid")
 
+    def test_in_expanding(self):
+        expr = self.table1.c.myid.in_(bindparam('q', expanding=True))
+        is_(expr.right.type._type_affinity, Integer)
+        self.assert_compile(
+            expr,
+            "mytable.myid IN ([EXPANDING_q])"
+        )
+        self.assert_compile(
+            self.table1.c.myid.in_(bindparam('q', [1, 2], expanding=True)),
+            "mytable.myid IN ([EXPANDING_q])",
+            checkparams={"q": [1, 2]}
+        )
+
+    def test_notin_expanding(self):
+        self.assert_compile(
+            ~self.table1.c.myid.in_(bindparam('q', expanding=True)),
+            "mytable.myid NOT IN ([EXPANDING_q])"
+        )
+
+    def test_in_expanding_literal_binds(self):
+        self.assert_compile(
+            self.table1.c.myid.in_(bindparam('q', [1, 2], expanding=True)),
+            "mytable.myid IN (1, 2)",
+            literal_binds=True
+        )
+
+    def test_in_expanding_type_from_value(self):
+        is_(
+            bindparam('q', ['x', 'y'], expanding=True).type._type_affinity,
+            String
+        )
+
 
 class MathOperatorTest(fixtures.TestBase, testing.AssertsCompiledSQL):
     __dialect__ = 'default'
@@ -6,9 +6,10 @@ from sqlalchemy import (
     exc, sql, func, select, String, Integer, MetaData, and_, ForeignKey,
     union, intersect, except_, union_all, VARCHAR, INT, CHAR, text, Sequence,
     bindparam, literal, not_, type_coerce, literal_column, desc, asc,
-    TypeDecorator, or_, cast, table, column)
+    TypeDecorator, or_, cast, table, column, Float)
 from sqlalchemy.engine import default, result as _result
 from sqlalchemy.testing.schema import Table, Column
+import array
 
 # ongoing - these are old tests.  those which are of general use
 # to test a dialect are being slowly migrated to
@@ -548,6 +549,155 @@ class QueryTest(fixtures.TestBase):
             l.append(row)
         self.assert_(len(l) == 2, "fetchmany(size=2) got %s rows" % len(l))
 
+    def test_fetch_columns(self):
+        users.insert().execute(
+            {'user_id': 7, 'user_name': 'jack'},
+            {'user_id': 8, 'user_name': 'ed'},
+            {'user_id': 9, 'user_name': None},
+        )
+        r = users.select().order_by(users.c.user_id).execute()
+        ids, names = r.fetch_columns()
+        assert isinstance(ids, array.array)
+        eq_(list(ids), [7, 8, 9])
+        eq_(names, ['jack', 'ed', None])
+        eq_([list(c) for c in r.fetch_columns()], [[], []])
+
+    def test_fetch_columns_processors(self):
+        class MyType(TypeDecorator):
+            impl = String(30)
+
+            def process_result_value(self, value, dialect):
+                return "XX" + value
+
+        users.insert().execute(user_id=7, user_name='jack')
+        users.insert().execute(user_id=8, user_name='ed')
+        r = testing.db.execute(
+            select([users.c.user_id, type_coerce(users.c.user_name, MyType)]).
+            order_by(users.c.user_id))
+        eq_([list(c) for c in r.fetch_columns(size=1)], [[7], ['XXjack']])
+        eq_([list(c) for c in r.fetch_columns(size=5)], [[8], ['XXed']])
+        eq_([list(c) for c in r.fetch_columns(size=5)], [[], []])
+
+    def test_fetch_columns_nulls(self):
+        users.insert().execute(user_id=7, user_name='jack')
+        r = testing.db.execute(
+            select([users.c.user_id, literal(None, Integer)]))
+        ids, nulls = r.fetch_columns()
+        assert isinstance(ids, array.array)
+        eq_(list(ids), [7])
+        is_(type(nulls), list)
+        eq_(nulls, [None])
+
+    def test_fetch_columns_containers(self):
+        class MyInt(TypeDecorator):
+            impl = Integer
+
+            def process_result_value(self, value, dialect):
+                return value * 10
+
+        users.insert().execute(
+            {'user_id': 7, 'user_name': 'jack'},
+            {'user_id': 8, 'user_name': 'ed'},
+        )
+        r = testing.db.execute(
+            select([
+                users.c.user_id,
+                cast(users.c.user_id, Float),
+                func.nullif(users.c.user_id, 8, type_=Integer),
+                type_coerce(users.c.user_id, MyInt),
+                users.c.user_name,
+            ]).order_by(users.c.user_id))
+        ids, floats, nullif, decorated, names = r.fetch_columns()
+        eq_(
+            [(type(col), list(col))
+             for col in (ids, floats, nullif, decorated, names)],
+            [
+                (array.array, [7, 8]),
+                (array.array, [7.0, 8.0]),
+                (list, [7, None]),
+                (list, [70, 80]),
+                (list, ['jack', 'ed'])
+            ]
+        )
+        eq_(floats.typecode, 'd')
+
+    def test_process_columns_overflow(self):
+        r = testing.db.execute(select([literal(1, Integer)]))
+        big, = r.process_columns([(2 ** 70, )])
+        r.close()
+        is_(type(big), list)
+        eq_(big, [2 ** 70])
+
+    def test_row_format_tuple(self):
+        class MyType(TypeDecorator):
+            impl = String(30)
+
+            def process_result_value(self, value, dialect):
+                return "XX" + value
+
+        users.insert().execute(
+            {'user_id': 7, 'user_name': 'jack'},
+            {'user_id': 8, 'user_name': 'ed'},
+            {'user_id': 9, 'user_name': 'fred'},
+        )
+        stmt = select(
+            [users.c.user_id, type_coerce(users.c.user_name, MyType)]).\
+            order_by(users.c.user_id)
+
+        conn = testing.db.connect().execution_options(row_format='tuple')
+        r = conn.execute(stmt)
+        row = r.fetchone()
+        is_(type(row), tuple)
+        eq_(row, (7, 'XXjack'))
+        eq_(r.fetchmany(1), [(8, 'XXed')])
+        eq_(r.fetchall(), [(9, 'XXfred')])
+
+        eq_(list(conn.execute(stmt)), [
+            (7, 'XXjack'), (8, 'XXed'), (9, 'XXfred')])
+        eq_(conn.execute(stmt).scalar(), 7)
+        conn.close()
+
+    def test_row_format_tuple_statement(self):
+        users.insert().execute(user_id=7, user_name='jack')
+        stmt = select([users.c.user_name]).execution_options(
+            row_format='tuple')
+        row = testing.db.execute(stmt).first()
+        is_(type(row), tuple)
+        eq_(row, ('jack', ))
+        assert isinstance(
+            testing.db.execute(select([users.c.user_name])).first(),
+            _result.RowProxy)
+
+    def test_iterate_columns(self):
+        users.insert().execute(
+            [{'user_id': i, 'user_name': 'u%d' % i} for i in range(1, 8)]
+        )
+        r = users.select().order_by(users.c.user_id).execute()
+        chunks = [
+            [list(col) for col in chunk]
+            for chunk in r.iterate_columns(3)
+        ]
+        eq_(
+            chunks,
+            [
+                [[1, 2, 3], ['u1', 'u2', 'u3']],
+                [[4, 5, 6], ['u4', 'u5', 'u6']],
+                [[7], ['u7']]
+            ]
+        )
+
+    def test_iterate_columns_containers_per_chunk(self):
+        users.insert().execute(
+            [{'user_id': i, 'user_name': 'u%d' % i} for i in range(1, 5)]
+        )
+        r = testing.db.execute(
+            select([func.nullif(users.c.user_id, 4, type_=Integer)]).
+            order_by(users.c.user_id))
+        eq_(
+            [(type(col), list(col)) for col, in r.iterate_columns(2)],
+            [(array.array, [1, 2]), (list, [3, None])]
+        )
+
     def test_like_ops(self):
         users.insert().execute(
             {'user_id': 1, 'user_name': 'apples'},
@@ -1419,6 +1569,63 @@ class QueryTest(fixtures.TestBase):
         r = s.execute().fetchall()
         assert len(r) == 1
 
+    def test_expanding_in(self):
+        users.insert().execute(user_id=7, user_name='jack')
+        users.insert().execute(user_id=8, user_name='fred')
+        users.insert().execute(user_id=9, user_name=None)
+
+        with testing.db.connect() as conn:
+            stmt = select([users]).where(
+                users.c.user_name.in_(bindparam('uname', expanding=True))
+            ).order_by(users.c.user_id)
+
+            eq_(
+                conn.execute(stmt, {"uname": ['jack']}).fetchall(),
+                [(7, 'jack')]
+            )
+
+            eq_(
+                conn.execute(stmt, {"uname": ['jack', 'fred']}).fetchall(),
+                [(7, 'jack'), (8, 'fred')]
+            )
+
+            eq_(
+                conn.execute(stmt, {"uname": ('fred', 'ed')}).fetchall(),
+                [(8, 'fred')]
+            )
+
+    def test_expanding_in_repeated(self):
+        users.insert().execute(user_id=7, user_name='jack')
+        users.insert().execute(user_id=8, user_name='fred')
+        users.insert().execute(user_id=9, user_name=None)
+
+        with testing.db.connect() as conn:
+            stmt = select([users]).where(
+                users.c.user_name.in_(
+                    bindparam('uname', expanding=True)) |
+                users.c.user_id.in_(bindparam('ids', expanding=True)) |
+                users.c.user_name.in_(
+                    bindparam('uname', expanding=True))
+            ).order_by(users.c.user_id)
+
+            eq_(
+                conn.execute(
+                    stmt, {"uname": ['jack'], "ids": [9, 10]}).fetchall(),
+                [(7, 'jack'), (9, None)]
+            )
+
+    def test_expanding_in_empty(self):
+        with testing.db.connect() as conn:
+            stmt = select([users]).where(
+                users.c.user_name.in_(bindparam('uname', expanding=True)))
+
+            assert_raises_message(
+                exc.StatementError,
+                "'expanding' parameter 'uname' can't be used with an "
+                "empty list",
+                conn.execute, stmt, {"uname": []}
+            )
+
 
 class RequiredBindTest(fixtures.TablesTest):
     run_create_tables = None